@@ -0,0 +1,203 @@
+import pandas as pd
+
+import eemeter
+
+from .common import balance_points, scaled_sample
+
+
+def _baseline_data(freq, scale, n_balance_points=20):
+    meter_data, temperature_data = scaled_sample(freq, scale)
+    heating_balance_points, cooling_balance_points = balance_points(n_balance_points)
+    data = eemeter.merge_temperature_data(
+        meter_data,
+        temperature_data,
+        heating_balance_points=heating_balance_points,
+        cooling_balance_points=cooling_balance_points,
+    )
+    return data, meter_data, temperature_data
+
+
+class CaltrackMethod(object):
+    params = (["daily", "billing_monthly"], [1, 4])
+    param_names = ["freq", "scale"]
+    timeout = 300
+
+    def setup(self, freq, scale):
+        self.data, _, _ = _baseline_data(freq, scale)
+        self.use_billing_presets = freq != "daily"
+
+    def time_caltrack_method(self, freq, scale):
+        eemeter.caltrack_method(self.data, use_billing_presets=self.use_billing_presets)
+
+
+class CaltrackPredict(object):
+    params = (["daily", "billing_monthly"], [1, 4], [False, True])
+    param_names = ["freq", "scale", "with_disaggregated"]
+    timeout = 300
+
+    def setup(self, freq, scale, with_disaggregated):
+        data, _, _ = _baseline_data(freq, 1)
+        model_results = eemeter.caltrack_method(
+            data, use_billing_presets=freq != "daily"
+        )
+        self.model = model_results.model
+        meter_data, self.temperature_data = scaled_sample(freq, scale)
+        self.prediction_index = meter_data.index
+
+    def time_caltrack_predict(self, freq, scale, with_disaggregated):
+        self.model.predict(
+            self.temperature_data,
+            self.prediction_index,
+            "daily",
+            with_disaggregated=with_disaggregated,
+        )
+
+
+class CaltrackSavings(object):
+    params = (["metered", "modeled"], [False, True])
+    param_names = ["savings", "with_disaggregated"]
+    timeout = 300
+
+    def setup(self, savings, with_disaggregated):
+        data, meter_data, temperature_data = _baseline_data("daily", 1)
+        self.model = eemeter.caltrack_method(data).model
+        self.meter_data = meter_data
+        self.temperature_data = temperature_data.resample("D").mean()
+
+    def time_caltrack_savings(self, savings, with_disaggregated):
+        if savings == "metered":
+            eemeter.caltrack_metered_savings(
+                self.model,
+                self.meter_data,
+                self.temperature_data,
+                with_disaggregated=with_disaggregated,
+            )
+        else:
+            eemeter.caltrack_modeled_savings(
+                self.model,
+                self.model,
+                self.meter_data.index,
+                self.temperature_data,
+                with_disaggregated=with_disaggregated,
+            )
+
+
+class CaltrackPredictFrame(object):
+    params = ([10, 1000], [False, True])
+    param_names = ["n_models", "with_disaggregated"]
+    timeout = 300
+
+    def setup(self, n_models, with_disaggregated):
+        data, meter_data, self.temperature_data = _baseline_data("daily", 1)
+        model_results = eemeter.caltrack_method(data)
+        candidates = [
+            candidate
+            for candidate in model_results.candidates
+            if candidate.status == "QUALIFIED"
+        ]
+        self.model_params = pd.DataFrame(
+            [
+                dict(model_type=candidate.model_type, **candidate.model_params)
+                for candidate in candidates
+            ]
+        ).sample(n_models, replace=True, random_state=0)
+        self.model_params.index = range(n_models)
+        self.prediction_index = meter_data.index
+
+    def time_caltrack_predict_frame(self, n_models, with_disaggregated):
+        eemeter.caltrack_predict_frame(
+            self.model_params,
+            self.temperature_data,
+            self.prediction_index,
+            "daily",
+            with_disaggregated=with_disaggregated,
+        )
+
+
+class CaltrackSufficiencyAndData(object):
+    params = (["daily", "billing_monthly"],)
+    param_names = ["freq"]
+
+    def setup(self, freq):
+        self.meter_data, self.temperature_data = scaled_sample(freq, 1)
+        self.heating_balance_points, self.cooling_balance_points = balance_points(20)
+
+    def time_caltrack_sufficiency_and_data(self, freq):
+        eemeter.caltrack_sufficiency_and_data(
+            self.meter_data,
+            self.temperature_data,
+            None,
+            None,
+            heating_balance_points=self.heating_balance_points,
+            cooling_balance_points=self.cooling_balance_points,
+        )
+
+
+class CaltrackSufficiencyCriteriaFrame(object):
+    params = ([100, 10000],)
+    param_names = ["n_meters"]
+
+    def setup(self, n_meters):
+        meter_data, temperature_data = scaled_sample("daily", 1)
+        data_quality = eemeter.merge_temperature_data(
+            meter_data, temperature_data, data_quality=True, temperature_mean=False
+        )
+        self.data = pd.concat(
+            [data_quality] * n_meters, keys=range(n_meters), names=["meter_id", "start"]
+        )
+
+    def time_caltrack_sufficiency_criteria_frame(self, n_meters):
+        eemeter.caltrack_sufficiency_criteria_frame(self.data, None, None)
+
+
+class CaltrackMethodRolling(object):
+    timeout = 300
+
+    def setup(self):
+        self.data, _, _ = _baseline_data("daily", 1)
+
+    def time_caltrack_method_rolling(self):
+        for _ in eemeter.caltrack_method_rolling(self.data, window=365):
+            pass
+
+
+class GetChangePointCandidateModel(object):
+    params = (["cdd_hdd", "hdd_only", "cdd_only"],)
+    param_names = ["model_type"]
+
+    def setup(self, model_type):
+        self.data, _, _ = _baseline_data("daily", 1)
+
+    def time_get_change_point_candidate_model(self, model_type):
+        eemeter.get_change_point_candidate_model(self.data, model_type=model_type)
+
+
+class CaltrackMethodSensitivity(object):
+    params = ([1, 10],)
+    param_names = ["n_settings"]
+    timeout = 300
+
+    def setup(self, n_settings):
+        self.data, _, _ = _baseline_data("daily", 1)
+        self.settings = [
+            {"minimum_non_zero_cdd": 5 * i, "beta_hdd_maximum_p_value": 1 - 0.05 * i}
+            for i in range(n_settings)
+        ]
+
+    def time_caltrack_method_sensitivity(self, n_settings):
+        eemeter.caltrack_method_sensitivity(self.data, self.settings)
+
+
+class CompiledCaltrackModel(object):
+    params = ([1, 10000],)
+    param_names = ["n_days"]
+
+    def setup(self, n_days):
+        data, _, _ = _baseline_data("daily", 1)
+        self.model = eemeter.caltrack_method(data).model.compile()
+        self.temperature_mean = data.temperature_mean.values[:n_days]
+        if n_days == 1:
+            self.temperature_mean = float(self.temperature_mean[0])
+
+    def time_compiled_caltrack_model(self, n_days):
+        self.model(self.temperature_mean)
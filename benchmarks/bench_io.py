@@ -0,0 +1,50 @@
+import gzip
+import io
+
+import eemeter
+from eemeter.samples import load
+
+from .common import scaled_sample
+
+
+class MeterDataFromCSV(object):
+    params = (["hourly", "daily"], [1, 4])
+    param_names = ["freq", "scale"]
+
+    def setup(self, freq, scale):
+        meter_data, _ = scaled_sample(freq, scale)
+        self.csv = gzip.compress(meter_data.to_csv().encode("utf-8"))
+
+    def time_meter_data_from_csv(self, freq, scale):
+        eemeter.meter_data_from_csv(io.BytesIO(self.csv), gzipped=True)
+
+
+class TemperatureDataFromCSV(object):
+    params = ([1, 4],)
+    param_names = ["scale"]
+
+    def setup(self, scale):
+        _, temperature_data = scaled_sample("hourly", scale)
+        self.csv = gzip.compress(
+            temperature_data.to_frame("tempF").to_csv().encode("utf-8")
+        )
+
+    def time_temperature_data_from_csv(self, scale):
+        eemeter.temperature_data_from_csv(
+            io.BytesIO(self.csv), gzipped=True, freq="hourly"
+        )
+
+
+class LoadSample(object):
+    params = ([False, True],)
+    param_names = ["cached"]
+
+    def setup(self, cached):
+        load._data_cache.clear()
+        if cached:
+            eemeter.load_sample("il-electricity-cdd-hdd-hourly")
+
+    def time_load_sample(self, cached):
+        if not cached:
+            load._data_cache.clear()
+        eemeter.load_sample("il-electricity-cdd-hdd-hourly")
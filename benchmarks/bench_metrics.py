@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+import eemeter
+
+
+class ModelMetrics(object):
+    params = ([365, 8760, 87600],)
+    param_names = ["length"]
+
+    def setup(self, length):
+        rng = np.random.RandomState(0)
+        index = pd.date_range("2017-01-01", periods=length, freq="H", tz="UTC")
+        observed = rng.gamma(2, 10, length)
+        self.observed = pd.Series(observed, index=index)
+        self.predicted = pd.Series(observed + rng.normal(0, 5, length), index=index)
+
+    def time_model_metrics(self, length):
+        eemeter.ModelMetrics(self.observed, self.predicted, num_parameters=2)
+
+
+class ComputeMetricsFrame(object):
+    params = ([100, 10000],)
+    param_names = ["n_meters"]
+
+    def setup(self, n_meters):
+        rng = np.random.RandomState(0)
+        length = 365 * n_meters
+        observed = rng.gamma(2, 10, length)
+        self.data = pd.DataFrame(
+            {
+                "meter_id": np.repeat(np.arange(n_meters), 365),
+                "observed": observed,
+                "predicted": observed + rng.normal(0, 5, length),
+            }
+        )
+
+    def time_compute_metrics_frame(self, n_meters):
+        eemeter.compute_metrics_frame(self.data, num_parameters=2)
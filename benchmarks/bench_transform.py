@@ -0,0 +1,130 @@
+import pandas as pd
+
+import eemeter
+
+from .common import balance_points, scaled_sample
+
+
+class MergeTemperatureData(object):
+    params = (["hourly", "daily", "billing_monthly"], [1, 4])
+    param_names = ["freq", "scale"]
+    timeout = 600
+
+    def setup(self, freq, scale):
+        self.meter_data, self.temperature_data = scaled_sample(freq, scale)
+        if freq == "hourly":
+            # hourly degree days are computed hour-by-hour and are very slow.
+            self.heating_balance_points, self.cooling_balance_points = [], []
+            self.degree_day_method = "hourly"
+        else:
+            self.heating_balance_points, self.cooling_balance_points = balance_points(
+                20
+            )
+            self.degree_day_method = "daily"
+
+    def _merge(self):
+        return eemeter.merge_temperature_data(
+            self.meter_data,
+            self.temperature_data,
+            heating_balance_points=self.heating_balance_points,
+            cooling_balance_points=self.cooling_balance_points,
+            degree_day_method=self.degree_day_method,
+        )
+
+    def time_merge_temperature_data(self, freq, scale):
+        self._merge()
+
+    def peakmem_merge_temperature_data(self, freq, scale):
+        self._merge()
+
+
+class MergeTemperatureDataChunked(object):
+    params = ([None, 24 * 30],)
+    param_names = ["chunk_size"]
+    timeout = 600
+
+    def setup(self, chunk_size):
+        self.meter_data, self.temperature_data = scaled_sample("hourly", 4)
+
+    def peakmem_merge_temperature_data(self, chunk_size):
+        eemeter.merge_temperature_data(
+            self.meter_data,
+            self.temperature_data,
+            degree_day_method="hourly",
+            chunk_size=chunk_size,
+        )
+
+
+class ComputeTemperatureFeatures(object):
+    params = ([0, 1, 10, 30, 60],)
+    param_names = ["n_balance_points"]
+    timeout = 300
+
+    def setup(self, n_balance_points):
+        meter_data, self.temperature_data = scaled_sample("daily", 1)
+        self.index = meter_data.index
+        self.heating_balance_points, self.cooling_balance_points = balance_points(
+            n_balance_points
+        )
+
+    def time_compute_temperature_features(self, n_balance_points):
+        eemeter.compute_temperature_features(
+            self.temperature_data,
+            self.index,
+            heating_balance_points=self.heating_balance_points,
+            cooling_balance_points=self.cooling_balance_points,
+        )
+
+
+class ComputeTemperatureFeaturesDailyTemperatures(object):
+    params = (["daily", "billing_monthly"], ["H", "D"])
+    param_names = ["freq", "temperature_freq"]
+
+    def setup(self, freq, temperature_freq):
+        meter_data, temperature_data = scaled_sample(freq, 1)
+        self.index = meter_data.index
+        if temperature_freq == "D":
+            temperature_data = temperature_data.resample("D").mean()
+        self.temperature_data = temperature_data
+        self.heating_balance_points, self.cooling_balance_points = balance_points(20)
+
+    def time_compute_temperature_features(self, freq, temperature_freq):
+        eemeter.compute_temperature_features(
+            self.temperature_data,
+            self.index,
+            heating_balance_points=self.heating_balance_points,
+            cooling_balance_points=self.cooling_balance_points,
+        )
+
+
+class MergeTemperatureDataFrame(object):
+    params = ([10, 1000],)
+    param_names = ["n_meters"]
+    timeout = 300
+
+    def setup(self, n_meters):
+        meter_data, self.temperature_data = scaled_sample("daily", 1)
+        self.meter_data = pd.concat(
+            [meter_data] * n_meters, keys=range(n_meters), names=["meter_id", "start"]
+        )
+        self.heating_balance_points, self.cooling_balance_points = balance_points(20)
+
+    def time_merge_temperature_data_frame(self, n_meters):
+        eemeter.merge_temperature_data_frame(
+            self.meter_data,
+            self.temperature_data,
+            heating_balance_points=self.heating_balance_points,
+            cooling_balance_points=self.cooling_balance_points,
+        )
+
+
+class AsFreq(object):
+    params = (["daily", "billing_monthly"], ["H", "D"])
+    param_names = ["freq", "target_freq"]
+
+    def setup(self, freq, target_freq):
+        meter_data, _ = scaled_sample(freq, 1)
+        self.series = meter_data.value
+
+    def time_as_freq(self, freq, target_freq):
+        eemeter.as_freq(self.series, target_freq)
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from eemeter import load_sample
+
+SAMPLES = {
+    "hourly": "il-electricity-cdd-hdd-hourly",
+    "daily": "il-electricity-cdd-hdd-daily",
+    "billing_monthly": "il-electricity-cdd-hdd-billing_monthly",
+    "billing_bimonthly": "il-electricity-cdd-hdd-billing_bimonthly",
+}
+
+
+def scaled_sample(freq, scale):
+    """ Return meter data and temperature data for the sample with the given
+    frequency, tiled ``scale`` times end to end in time. """
+    meter_data, temperature_data, _ = load_sample(SAMPLES[freq])
+    if scale == 1:
+        return meter_data, temperature_data
+
+    span = pd.Timedelta(
+        days=int(np.ceil((temperature_data.index[-1] - meter_data.index[0]).days)) + 1
+    )
+
+    meter_copies, temperature_copies = [], []
+    for i in range(scale):
+        meter_copy = meter_data.copy()
+        temperature_copy = temperature_data.copy()
+        meter_copy.index = meter_copy.index + span * i
+        temperature_copy.index = temperature_copy.index + span * i
+        if i < scale - 1:
+            # the last value of each copy only marks the end of the data
+            meter_copy = meter_copy.iloc[:-1]
+        meter_copies.append(meter_copy)
+        temperature_copies.append(temperature_copy)
+
+    scaled_meter_data = pd.concat(meter_copies)
+    if meter_data.index.freq is not None:
+        scaled_meter_data = scaled_meter_data.asfreq(meter_data.index.freq)
+    scaled_temperature_data = pd.concat(temperature_copies).asfreq("H")
+    return scaled_meter_data, scaled_temperature_data
+
+
+def balance_points(n):
+    """ Return ``n`` heating and ``n`` cooling balance points. """
+    return list(range(40, 40 + n)), list(range(50, 50 + n))
@@ -10,32 +10,13 @@ Full documentation is at <https://openee.io>.
 :license: Apache 2.0, see LICENSE for more details.
 """
 
+import importlib
 import logging
+import sys
 
 from .__version__ import __title__, __description__, __url__, __version__
 from .__version__ import __author__, __author_email__, __license__
 from .__version__ import __copyright__
-from .api import CandidateModel, DataSufficiency, EEMeterWarning, ModelResults
-from .caltrack import (
-    caltrack_method,
-    caltrack_sufficiency_criteria,
-    caltrack_metered_savings,
-    caltrack_modeled_savings,
-    caltrack_predict,
-    get_single_cdd_only_candidate_model,
-    get_single_hdd_only_candidate_model,
-    get_single_cdd_hdd_candidate_model,
-    get_cdd_hdd_candidate_models,
-    get_cdd_only_candidate_models,
-    get_hdd_only_candidate_models,
-    get_intercept_only_candidate_models,
-    get_parameter_negative_warning,
-    get_parameter_p_value_too_high_warning,
-    get_too_few_non_zero_degree_day_warning,
-    get_total_degree_day_too_low_warning,
-    plot_caltrack_candidate,
-    select_best_candidate,
-)
 from .exceptions import (
     EEMeterError,
     NoBaselineDataError,
@@ -43,28 +24,106 @@ from .exceptions import (
     MissingModelParameterError,
     UnrecognizedModelTypeError,
 )
-from .metrics import ModelMetrics
-from .transform import (
-    as_freq,
-    compute_temperature_features,
-    day_counts,
-    get_baseline_data,
-    get_reporting_data,
-    merge_temperature_data,
-    remove_duplicates,
-)
-from .io import (
-    meter_data_from_csv,
-    meter_data_from_json,
-    meter_data_to_csv,
-    temperature_data_from_csv,
-    temperature_data_from_json,
-    temperature_data_to_csv,
-)
-from .visualization import plot_energy_signature, plot_time_series
 from .samples.load import samples, load_sample
 
 
+# Public names which are imported from their submodules on first access rather
+# than when ``eemeter`` is imported. This keeps ``import eemeter`` fast by
+# deferring pandas, statsmodels and friends until they are actually needed.
+_LAZY_ATTRIBUTES = {
+    "CandidateModel": "api",
+    "DataSufficiency": "api",
+    "EEMeterWarning": "api",
+    "ModelResults": "api",
+    "caltrack_method": "caltrack",
+    "caltrack_method_rolling": "caltrack",
+    "caltrack_method_sensitivity": "caltrack",
+    "caltrack_sufficiency_criteria": "caltrack",
+    "caltrack_sufficiency_and_data": "caltrack",
+    "caltrack_sufficiency_criteria_frame": "caltrack",
+    "caltrack_sufficiency_criteria_from_frame": "caltrack",
+    "caltrack_metered_savings": "caltrack",
+    "caltrack_modeled_savings": "caltrack",
+    "caltrack_predict": "caltrack",
+    "caltrack_predict_frame": "caltrack",
+    "CompiledCaltrackModel": "caltrack",
+    "get_single_cdd_only_candidate_model": "caltrack",
+    "get_single_hdd_only_candidate_model": "caltrack",
+    "get_single_cdd_hdd_candidate_model": "caltrack",
+    "get_cdd_hdd_candidate_models": "caltrack",
+    "get_change_point_candidate_model": "caltrack",
+    "get_cdd_only_candidate_models": "caltrack",
+    "get_hdd_only_candidate_models": "caltrack",
+    "get_intercept_only_candidate_models": "caltrack",
+    "get_parameter_negative_warning": "caltrack",
+    "get_parameter_p_value_too_high_warning": "caltrack",
+    "get_too_few_non_zero_degree_day_warning": "caltrack",
+    "get_total_degree_day_too_low_warning": "caltrack",
+    "plot_caltrack_candidate": "caltrack",
+    "select_best_candidate": "caltrack",
+    "MetricsAccumulator": "metrics",
+    "ModelMetrics": "metrics",
+    "SavingsAccumulator": "metrics",
+    "compute_metrics_frame": "metrics",
+    "Timings": "instrumentation",
+    "record_timings": "instrumentation",
+    "register_timing_hook": "instrumentation",
+    "unregister_timing_hook": "instrumentation",
+    "as_freq": "transform",
+    "compute_temperature_features": "transform",
+    "day_counts": "transform",
+    "get_baseline_data": "transform",
+    "get_reporting_data": "transform",
+    "merge_temperature_data": "transform",
+    "merge_temperature_data_frame": "transform",
+    "remove_duplicates": "transform",
+    "SharedTemperatureData": "shared",
+    "meter_data_from_csv": "io",
+    "meter_data_from_json": "io",
+    "meter_data_to_csv": "io",
+    "temperature_data_from_csv": "io",
+    "temperature_data_from_json": "io",
+    "temperature_data_to_csv": "io",
+    "plot_energy_signature": "visualization",
+    "plot_time_series": "visualization",
+    "synthetic_meters": "samples.synthetic",
+}
+
+_LAZY_SUBMODULES = (
+    "api",
+    "caltrack",
+    "cli",
+    "instrumentation",
+    "io",
+    "metrics",
+    "shared",
+    "transform",
+    "visualization",
+)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(".{}".format(_LAZY_ATTRIBUTES[name]), __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(".{}".format(name), __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_LAZY_SUBMODULES))
+
+
+# Module-level __getattr__ (PEP 562) requires python 3.7+; import eagerly on
+# older interpreters.
+if sys.version_info < (3, 7):  # pragma: no cover
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
+
+
 def get_version():
     return __version__
 
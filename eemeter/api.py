@@ -115,6 +115,21 @@ class CandidateModel(object):
                 self.model_type, self.model_params, *args, **kwargs
             )
 
+    def compile(self):
+        """ Return a lightweight, picklable predictor for this model, for fast
+        prediction from arrays of daily mean temperatures. See
+        :any:`eemeter.CompiledCaltrackModel`.
+        """
+        if self.predict_func is None:
+            raise ValueError(
+                "This candidate model cannot be compiled because"
+                " the predict_func attr is not set."
+            )
+        # deferred: caltrack imports this module
+        from .caltrack import CompiledCaltrackModel
+
+        return CompiledCaltrackModel(self.model_type, self.model_params)
+
     def plot(self, *args, **kwargs):
         """ Predict for this model. Arguments may vary by model type.
         """
@@ -253,6 +268,9 @@ class ModelResults(object):
         A ModelMetrics object, if one is calculated and associated with this
         model. (This initializes to None.) The ModelMetrics object contains
         model fit information and descriptive statistics about the underlying data.
+    timings : :any:`eemeter.Timings`
+        Wall time and call counts of pipeline stages, if recorded with
+        :any:`eemeter.record_timings`. (This initializes to None.)
     """
 
     def __init__(
@@ -288,6 +306,7 @@ class ModelResults(object):
         self.settings = settings
 
         self.metrics = None
+        self.timings = None
 
     def __repr__(self):
         return "ModelResults(status='{}', method_name='{}', r_squared_adj={})".format(
@@ -3,25 +3,35 @@ from collections import Counter
 import numpy as np
 import pandas as pd
 import pytz
-import statsmodels.formula.api as smf
+import re
 import traceback
 
 from .api import CandidateModel, DataSufficiency, EEMeterWarning, ModelResults
 from .exceptions import MissingModelParameterError, UnrecognizedModelTypeError
+from .instrumentation import current_timings, timed, timed_function
 from .transform import (
     day_counts,
     compute_temperature_features,
+    merge_temperature_data,
     overwrite_partial_rows_with_nan,
+    _astype_temperature_features,
 )
 from .metrics import ModelMetrics
 
 
 __all__ = (
     "caltrack_method",
+    "caltrack_method_rolling",
+    "caltrack_method_sensitivity",
     "caltrack_sufficiency_criteria",
+    "caltrack_sufficiency_and_data",
+    "caltrack_sufficiency_criteria_frame",
+    "caltrack_sufficiency_criteria_from_frame",
     "caltrack_metered_savings",
     "caltrack_modeled_savings",
     "caltrack_predict",
+    "caltrack_predict_frame",
+    "CompiledCaltrackModel",
     "plot_caltrack_candidate",
     "get_too_few_non_zero_degree_day_warning",
     "get_total_degree_day_too_low_warning",
@@ -34,6 +44,7 @@ __all__ = (
     "get_cdd_only_candidate_models",
     "get_hdd_only_candidate_models",
     "get_cdd_hdd_candidate_models",
+    "get_change_point_candidate_model",
     "select_best_candidate",
 )
 
@@ -201,7 +212,7 @@ def caltrack_predict(
 ):
     """ CalTRACK predict method.
 
-    Given a model type, parameters, hourly temperatures, a
+    Given a model type, parameters, hourly or daily temperatures, a
     :any:`pandas.DatetimeIndex` index over which to predict meter usage,
     return model predictions as totals for the period (so billing period totals,
     daily totals, etc.). Optionally include the computed design matrix or
@@ -214,8 +225,10 @@ def caltrack_predict(
     model_params : :any:`dict`
         Parameters as stored in :any:`eemeter.CandidateModel.model_params`.
     temperature_data : :any:`pandas.DataFrame`
-        Hourly temperature data to use for prediction. Time period should match
-        the ``prediction_index`` argument.
+        Hourly or daily temperature data to use for prediction. Time period
+        should match the ``prediction_index`` argument. Daily temperature data
+        requires ``degree_day_method='daily'`` (see
+        :any:`eemeter.compute_temperature_features`).
     prediction_index : :any:`pandas.DatetimeIndex`
         Time period over which to predict.
     with_disaggregated : :any:`bool`, optional
@@ -285,29 +298,344 @@ def caltrack_predict(
             design_matrix.n_hours_kept + design_matrix.n_hours_dropped
         ) / 24
 
-    results = _caltrack_predict_design_matrix(
+    # the total is the sum of the loads, so evaluate the loads just once.
+    loads = _caltrack_predict_design_matrix(
         model_type,
         model_params,
         design_matrix,
+        disaggregated=True,
         input_averages=False,
         output_averages=False,
-    ).to_frame("predicted_usage")
+    )
+    base_load = loads["base_load"].values
+    heating_load = loads["heating_load"].values
+    cooling_load = loads["cooling_load"].values
 
+    columns = [("predicted_usage", base_load + heating_load + cooling_load)]
     if with_disaggregated:
-        disaggregated = _caltrack_predict_design_matrix(
-            model_type,
-            model_params,
-            design_matrix,
-            disaggregated=True,
-            input_averages=False,
-            output_averages=False,
+        columns.append(("base_load", base_load))
+        columns.append(("heating_load", heating_load))
+        columns.append(("cooling_load", cooling_load))
+    if with_design_matrix:
+        columns.extend(
+            (column, design_matrix[column].values) for column in design_matrix.columns
         )
-        results = results.join(disaggregated)
 
-    if with_design_matrix:
-        results = results.join(design_matrix)
+    return pd.DataFrame(
+        dict(columns), index=design_matrix.index, columns=[c for c, _ in columns]
+    )
+
+
+_MODEL_TYPE_PARAMETERS = {
+    "intercept_only": ["intercept"],
+    "hdd_only": ["intercept", "beta_hdd", "heating_balance_point"],
+    "cdd_only": ["intercept", "beta_cdd", "cooling_balance_point"],
+    "cdd_hdd": [
+        "intercept",
+        "beta_cdd",
+        "beta_hdd",
+        "cooling_balance_point",
+        "heating_balance_point",
+    ],
+}
+
+
+def caltrack_predict_frame(
+    model_params,
+    temperature_data,
+    prediction_index,
+    degree_day_method,
+    with_disaggregated=False,
+    long_format=False,
+):
+    """ CalTRACK predict method for many models at once, e.g., those of a
+    portfolio of meters sharing a weather station.
+
+    Results are the same as those of :any:`eemeter.caltrack_predict` for
+    each model, but temperature features are computed once for all of the
+    distinct balance points of the models, and predictions are evaluated
+    for all models together with array arithmetic.
+
+    Parameters
+    ----------
+    model_params : :any:`pandas.DataFrame`
+        One row per model, indexed by, e.g., meter ID, with the column
+        ``model_type`` and columns of parameters as stored in
+        :any:`eemeter.CandidateModel.model_params`: ``intercept``,
+        ``beta_hdd``, ``beta_cdd``, ``heating_balance_point``, and
+        ``cooling_balance_point``. Parameters not used by the model type of
+        a row may be null, and columns not used by any model may be omitted.
+    temperature_data : :any:`pandas.DataFrame`
+        Hourly or daily temperature data to use for prediction. Time period
+        should match the ``prediction_index`` argument. Daily temperature data
+        requires ``degree_day_method='daily'`` (see
+        :any:`eemeter.compute_temperature_features`).
+    prediction_index : :any:`pandas.DatetimeIndex`
+        Time period over which to predict.
+    degree_day_method : :any:`str`
+        ``'daily'`` or ``'hourly'``, as for :any:`eemeter.caltrack_predict`.
+    with_disaggregated : :any:`bool`, optional
+        If True, also return ``'base_load'``, ``'heating_load'``, and
+        ``'cooling_load'``.
+    long_format : :any:`bool`, optional
+        If True, return results with one row per model and period rather
+        than one column per model.
+
+    Returns
+    -------
+    prediction : :any:`pandas.DataFrame`
+        If ``long_format=False``, predicted usage indexed by
+        ``prediction_index`` with one column per model, labeled as in the
+        index of ``model_params``. If ``with_disaggregated=True``, columns are
+        a :any:`pandas.MultiIndex` of ``'predicted_usage'``, ``'base_load'``,
+        ``'heating_load'``, and ``'cooling_load'`` and the model, so that,
+        e.g., ``prediction['heating_load']`` gives heating load for each
+        model. If ``long_format=True``, the columns ``'predicted_usage'``
+        (and disaggregated loads, if requested) indexed by model and period.
+    """
+    n_models = len(model_params)
+    model_types = model_params["model_type"].values
+
+    for model_type in pd.unique(model_types):
+        if model_type is None or model_type != model_type:
+            raise ValueError("Model not valid for prediction: model_type=None")
+        if model_type not in _MODEL_TYPE_PARAMETERS:
+            raise UnrecognizedModelTypeError(
+                "invalid caltrack model type: {}".format(model_type)
+            )
+        for param in _MODEL_TYPE_PARAMETERS[model_type]:
+            if (
+                param not in model_params.columns
+                or model_params[param][model_types == model_type].isnull().any()
+            ):
+                raise MissingModelParameterError(
+                    '"{}" parameter required for model_type: {}'.format(
+                        param, model_type
+                    )
+                )
+
+    has_hdd = np.in1d(model_types, ["hdd_only", "cdd_hdd"])
+    has_cdd = np.in1d(model_types, ["cdd_only", "cdd_hdd"])
+
+    def _distinct_balance_points(has_degree_days, column):
+        if not has_degree_days.any():
+            return [], np.zeros(n_models, dtype=int)
+        balance_points, indices = np.unique(
+            model_params[column].values[has_degree_days], return_inverse=True
+        )
+        model_indices = np.zeros(n_models, dtype=int)
+        model_indices[has_degree_days] = indices
+        return list(balance_points), model_indices
+
+    heating_balance_points, hdd_indices = _distinct_balance_points(
+        has_hdd, "heating_balance_point"
+    )
+    cooling_balance_points, cdd_indices = _distinct_balance_points(
+        has_cdd, "cooling_balance_point"
+    )
+
+    design_matrix = compute_temperature_features(
+        temperature_data,
+        prediction_index,
+        heating_balance_points=heating_balance_points,
+        cooling_balance_points=cooling_balance_points,
+        degree_day_method=degree_day_method,
+        use_mean_daily_values=False,
+    )
+    index = design_matrix.index
+    n_periods = len(index)
+
+    def _load(prefix, balance_points, indices, has_degree_days, beta_column):
+        load = np.zeros((n_periods, n_models))
+        if n_periods > 0 and has_degree_days.any():
+            degree_days = design_matrix[
+                ["%s_%s" % (prefix, balance_point) for balance_point in balance_points]
+            ].values
+            load[:, has_degree_days] = (
+                degree_days[:, indices[has_degree_days]]
+                * model_params[beta_column].values[has_degree_days]
+            )
+        return load
+
+    days_per_period = day_counts(pd.Series(0, index=index)).values
+    intercept = model_params["intercept"].values.astype(np.float64)
+    loads = {
+        "base_load": days_per_period[:, None] * intercept,
+        "heating_load": _load(
+            "hdd", heating_balance_points, hdd_indices, has_hdd, "beta_hdd"
+        ),
+        "cooling_load": _load(
+            "cdd", cooling_balance_points, cdd_indices, has_cdd, "beta_cdd"
+        ),
+    }
+    if n_periods > 0:
+        # The last row of data was nan -- Restore the NaN
+        loads["base_load"][-1] = np.nan
+    predicted_usage = loads["base_load"] + loads["heating_load"] + loads["cooling_load"]
+
+    components = [("predicted_usage", predicted_usage)]
+    if with_disaggregated:
+        components.extend(
+            (component, loads[component])
+            for component in ["base_load", "heating_load", "cooling_load"]
+        )
+
+    if long_format:
+        long_index = pd.MultiIndex.from_product(
+            [model_params.index, index], names=[model_params.index.name, index.name]
+        )
+        return pd.DataFrame(
+            {component: values.T.ravel() for component, values in components},
+            index=long_index,
+            columns=[component for component, _ in components],
+        )
+
+    if not with_disaggregated:
+        return pd.DataFrame(predicted_usage, index=index, columns=model_params.index)
+    columns = pd.MultiIndex.from_product(
+        [[component for component, _ in components], model_params.index]
+    )
+    return pd.DataFrame(
+        np.hstack([values for _, values in components]), index=index, columns=columns
+    )
+
+
+class CompiledCaltrackModel(object):
+    """ A lightweight, picklable CalTRACK model for fast prediction from
+    daily mean temperatures, e.g., in simulations or optimization loops that
+    predict many times. Usually made with
+    :any:`eemeter.CandidateModel.compile`.
+
+    Predictions are as from :any:`eemeter.caltrack_predict` with
+    ``degree_day_method='daily'`` on periods of one day, but are computed
+    directly from :any:`numpy.ndarray` (or scalar) inputs, without
+    computing temperature features from hourly data or building pandas
+    objects.
+
+    Parameters
+    ----------
+    model_type : :any:`str`
+        Model type (e.g., ``'cdd_hdd'``).
+    model_params : :any:`dict`
+        Parameters as stored in :any:`eemeter.CandidateModel.model_params`.
+    """
+
+    __slots__ = (
+        "model_type",
+        "intercept",
+        "beta_hdd",
+        "heating_balance_point",
+        "beta_cdd",
+        "cooling_balance_point",
+    )
+
+    def __init__(self, model_type, model_params):
+        if model_type is None:
+            raise ValueError("Model not valid for prediction: model_type=None")
+        if model_type not in _MODEL_TYPE_PARAMETERS:
+            raise UnrecognizedModelTypeError(
+                "invalid caltrack model type: {}".format(model_type)
+            )
+        params = {
+            param: float(_get_parameter_or_raise(model_type, model_params, param))
+            for param in _MODEL_TYPE_PARAMETERS[model_type]
+        }
+        self.model_type = model_type
+        self.intercept = params["intercept"]
+        # None for terms not in the model, which don't depend on temperature.
+        self.beta_hdd = params.get("beta_hdd")
+        self.heating_balance_point = params.get("heating_balance_point")
+        self.beta_cdd = params.get("beta_cdd")
+        self.cooling_balance_point = params.get("cooling_balance_point")
+
+    def __repr__(self):
+        return "CompiledCaltrackModel(model_type='{}')".format(self.model_type)
+
+    def __getstate__(self):
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        for attr, value in zip(self.__slots__, state):
+            setattr(self, attr, value)
+
+    def disaggregated(self, temperature_mean, n_days=1):
+        """ Return base, heating and cooling loads.
+
+        Parameters
+        ----------
+        temperature_mean : :any:`numpy.ndarray` or :any:`float`
+            Daily mean temperatures.
+        n_days : :any:`numpy.ndarray` or :any:`float`, optional
+            The number of days in each period, e.g., less than one for days
+            with missing meter data.
+
+        Returns
+        -------
+        base_load, heating_load, cooling_load : :any:`tuple` of :any:`numpy.ndarray` or :any:`float`
+            Loads as totals over the periods.
+        """
+        temperature_mean = np.asarray(temperature_mean, dtype=np.float64)
+        base_load = np.full(temperature_mean.shape, self.intercept) * n_days
+        if self.beta_hdd is None:
+            heating_load = np.zeros(temperature_mean.shape) * n_days
+        else:
+            heating_load = (
+                self.beta_hdd
+                * np.maximum(self.heating_balance_point - temperature_mean, 0)
+                * n_days
+            )
+        if self.beta_cdd is None:
+            cooling_load = np.zeros(temperature_mean.shape) * n_days
+        else:
+            cooling_load = (
+                self.beta_cdd
+                * np.maximum(temperature_mean - self.cooling_balance_point, 0)
+                * n_days
+            )
+        return base_load, heating_load, cooling_load
+
+    def __call__(self, temperature_mean, n_days=1):
+        """ Return predicted usage.
+
+        Parameters
+        ----------
+        temperature_mean : :any:`numpy.ndarray` or :any:`float`
+            Daily mean temperatures.
+        n_days : :any:`numpy.ndarray` or :any:`float`, optional
+            The number of days in each period, e.g., less than one for days
+            with missing meter data.
+
+        Returns
+        -------
+        predicted_usage : :any:`numpy.ndarray` or :any:`float`
+            Predicted usage as totals over the periods.
+        """
+        if isinstance(temperature_mean, (int, float)) and isinstance(
+            n_days, (int, float)
+        ):
+            # plain arithmetic is much faster than numpy for scalars.
+            predicted_usage = self.intercept
+            if self.beta_hdd is not None:
+                predicted_usage += self.beta_hdd * max(
+                    self.heating_balance_point - temperature_mean, 0.0
+                )
+            if self.beta_cdd is not None:
+                predicted_usage += self.beta_cdd * max(
+                    temperature_mean - self.cooling_balance_point, 0.0
+                )
+            return predicted_usage * n_days
 
-    return results
+        temperature_mean = np.asarray(temperature_mean, dtype=np.float64)
+        predicted_usage = np.full(temperature_mean.shape, self.intercept)
+        if self.beta_hdd is not None:
+            predicted_usage = predicted_usage + self.beta_hdd * np.maximum(
+                self.heating_balance_point - temperature_mean, 0
+            )
+        if self.beta_cdd is not None:
+            predicted_usage = predicted_usage + self.beta_cdd * np.maximum(
+                temperature_mean - self.cooling_balance_point, 0
+            )
+        return predicted_usage * n_days
 
 
 def get_too_few_non_zero_degree_day_warning(
@@ -334,8 +662,16 @@ def get_too_few_non_zero_degree_day_warning(
     warnings : :any:`list` of :any:`eemeter.EEMeterWarning`
         Empty list or list of single warning.
     """
-    warnings = []
     n_non_zero = int((degree_days > 0).sum())
+    return _get_too_few_non_zero_degree_day_warning(
+        model_type, balance_point, degree_day_type, n_non_zero, minimum_non_zero
+    )
+
+
+def _get_too_few_non_zero_degree_day_warning(
+    model_type, balance_point, degree_day_type, n_non_zero, minimum_non_zero
+):
+    warnings = []
     if n_non_zero < minimum_non_zero:
         warnings.append(
             EEMeterWarning(
@@ -390,9 +726,16 @@ def get_total_degree_day_too_low_warning(
     warnings : :any:`list` of :any:`eemeter.EEMeterWarning`
         Empty list or list of single warning.
     """
+    total_degree_days = degree_days.sum()
+    return _get_total_degree_day_too_low_warning(
+        model_type, balance_point, degree_day_type, total_degree_days, minimum_total
+    )
 
+
+def _get_total_degree_day_too_low_warning(
+    model_type, balance_point, degree_day_type, total_degree_days, minimum_total
+):
     warnings = []
-    total_degree_days = degree_days.sum()
     if total_degree_days < minimum_total:
         warnings.append(
             EEMeterWarning(
@@ -538,6 +881,48 @@ def get_fit_failed_candidate_model(model_type, formula):
     return _candidate_model_factory(model_type, formula, "ERROR", warnings)
 
 
+def _get_fitted_candidate_model(
+    model_type,
+    formula,
+    model_params,
+    p_value_checks,
+    r_squared_adj,
+    model=None,
+    result=None,
+):
+    # p_value_checks: list of (parameter, p_value, maximum_p_value)
+    model_warnings = []
+
+    # CalTrack 3.4.3.2
+    for parameter in ["intercept", "beta_cdd", "beta_hdd"]:
+        if parameter in model_params:
+            model_warnings.extend(
+                get_parameter_negative_warning(model_type, model_params, parameter)
+            )
+    for parameter, p_value, maximum_p_value in p_value_checks:
+        model_warnings.extend(
+            get_parameter_p_value_too_high_warning(
+                model_type, model_params, parameter, p_value, maximum_p_value
+            )
+        )
+
+    if len(model_warnings) > 0:
+        status = "DISQUALIFIED"
+    else:
+        status = "QUALIFIED"
+
+    return _candidate_model_factory(
+        model_type,
+        formula,
+        status,
+        warnings=model_warnings,
+        model_params=model_params,
+        model=model,
+        result=result,
+        r_squared_adj=r_squared_adj,
+    )
+
+
 def get_intercept_only_candidate_models(data, weights_col):
     """ Return a list of a single candidate intercept-only model.
 
@@ -561,7 +946,11 @@ def get_intercept_only_candidate_models(data, weights_col):
     if weights_col is None:
         weights = 1
     else:
-        weights = data[weights_col]
+        # upcast compact (e.g., float32) weights for fitting.
+        weights = data[weights_col].astype(np.float64)
+
+    # deferred: statsmodels is slow to import and only needed for fitting
+    import statsmodels.formula.api as smf
 
     try:
         model = smf.wls(formula=formula, data=data, weights=weights)
@@ -573,33 +962,86 @@ def get_intercept_only_candidate_models(data, weights_col):
     # CalTrack 3.3.1.3
     model_params = {"intercept": result.params["Intercept"]}
 
-    model_warnings = []
-
-    # CalTrack 3.4.3.2
-    for parameter in ["intercept"]:
-        model_warnings.extend(
-            get_parameter_negative_warning(model_type, model_params, parameter)
-        )
-
-    if len(model_warnings) > 0:
-        status = "DISQUALIFIED"
-    else:
-        status = "QUALIFIED"
-
     return [
-        _candidate_model_factory(
-            model_type,
-            formula,
-            status,
-            warnings=model_warnings,
-            model_params=model_params,
-            model=model,
-            result=result,
-            r_squared_adj=0,
+        _get_fitted_candidate_model(
+            model_type, formula, model_params, [], 0, model=model, result=result
         )
     ]
 
 
+def _equivalent_balance_points(data, degree_day_type, balance_points):
+    # the first of the balance points whose degree day column is identical
+    # to that of each balance point, e.g., all those at which there are no
+    # degree days. Candidate models need only be fit for one of them.
+    first_balance_points = {}
+    equivalents = []
+    for balance_point in balance_points:
+        values = data["%s_%s" % (degree_day_type, balance_point)].values
+        values = np.asarray(values, dtype=np.float64) + 0.0  # no negative zeros
+        key = np.where(np.isnan(values), np.nan, values).tobytes()
+        equivalents.append(first_balance_points.setdefault(key, balance_point))
+    return equivalents
+
+
+def _equivalent_candidate_model(
+    candidate_model, formula, cooling_balance_point=None, heating_balance_point=None
+):
+    # relabel a candidate model for the balance points of identical degree
+    # day columns. The raw model and result are shared, not refit.
+    relabeled = {}
+    if cooling_balance_point is not None:
+        relabeled["cooling_balance_point"] = cooling_balance_point
+        relabeled["cdd_balance_point"] = cooling_balance_point
+    if heating_balance_point is not None:
+        relabeled["heating_balance_point"] = heating_balance_point
+        relabeled["hdd_balance_point"] = heating_balance_point
+
+    def _relabel(data):
+        return {key: relabeled.get(key, value) for key, value in data.items()}
+
+    return CandidateModel(
+        model_type=candidate_model.model_type,
+        formula=formula,
+        status=candidate_model.status,
+        predict_func=candidate_model.predict_func,
+        plot_func=candidate_model.plot_func,
+        model_params=_relabel(candidate_model.model_params),
+        model=candidate_model.model,
+        result=candidate_model.result,
+        r_squared_adj=candidate_model.r_squared_adj,
+        warnings=[
+            EEMeterWarning(
+                qualified_name=warning.qualified_name,
+                description=warning.description,
+                data=_relabel(warning.data),
+            )
+            for warning in candidate_model.warnings
+        ],
+    )
+
+
+def _balance_point(value):
+    # whole degree balance points are kept as ints so that they name columns
+    # as in merge_temperature_data, e.g., hdd_60 rather than hdd_60.0.
+    value = float(value)
+    if value.is_integer():
+        return int(value)
+    return value
+
+
+def _column_balance_point(column):
+    # e.g., 60 from hdd_60 or 60.5 from hdd_60.5
+    return _balance_point(column[4:])
+
+
+def _formula_term(column):
+    # patsy can only refer to columns named like python identifiers directly,
+    # so quote others, e.g., those with fractional balance points.
+    if re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", column):
+        return column
+    return 'Q("%s")' % column
+
+
 def get_single_cdd_only_candidate_model(
     data,
     minimum_non_zero_cdd,
@@ -636,7 +1078,8 @@ def get_single_cdd_only_candidate_model(
     """
     model_type = "cdd_only"
     cdd_column = "cdd_%s" % balance_point
-    formula = "meter_value ~ %s" % cdd_column
+    cdd_term = _formula_term(cdd_column)
+    formula = "meter_value ~ %s" % cdd_term
 
     degree_day_warnings = []
     degree_day_warnings.extend(
@@ -662,7 +1105,11 @@ def get_single_cdd_only_candidate_model(
     if weights_col is None:
         weights = 1
     else:
-        weights = data[weights_col]
+        # upcast compact (e.g., float32) weights for fitting.
+        weights = data[weights_col].astype(np.float64)
+
+    # deferred: statsmodels is slow to import and only needed for fitting
+    import statsmodels.formula.api as smf
 
     try:
         model = smf.wls(formula=formula, data=data, weights=weights)
@@ -671,46 +1118,23 @@ def get_single_cdd_only_candidate_model(
 
     result = model.fit()
     r_squared_adj = result.rsquared_adj
-    beta_cdd_p_value = result.pvalues[cdd_column]
+    beta_cdd_p_value = result.pvalues[cdd_term]
 
     # CalTrack 3.3.1.3
     model_params = {
         "intercept": result.params["Intercept"],
-        "beta_cdd": result.params[cdd_column],
+        "beta_cdd": result.params[cdd_term],
         "cooling_balance_point": balance_point,
     }
 
-    model_warnings = []
-
-    # CalTrack 3.4.3.2
-    for parameter in ["intercept", "beta_cdd"]:
-        model_warnings.extend(
-            get_parameter_negative_warning(model_type, model_params, parameter)
-        )
-    model_warnings.extend(
-        get_parameter_p_value_too_high_warning(
-            model_type,
-            model_params,
-            parameter,
-            beta_cdd_p_value,
-            beta_cdd_maximum_p_value,
-        )
-    )
-
-    if len(model_warnings) > 0:
-        status = "DISQUALIFIED"
-    else:
-        status = "QUALIFIED"
-
-    return _candidate_model_factory(
+    return _get_fitted_candidate_model(
         model_type,
         formula,
-        status,
-        warnings=model_warnings,
-        model_params=model_params,
+        model_params,
+        [("beta_cdd", beta_cdd_p_value, beta_cdd_maximum_p_value)],
+        r_squared_adj,
         model=model,
         result=result,
-        r_squared_adj=r_squared_adj,
     )
 
 
@@ -741,18 +1165,33 @@ def get_cdd_only_candidate_models(
     candidate_models : :any:`list` of :any:`CandidateModel`
         A list of cdd-only candidate models, with any associated warnings.
     """
-    balance_points = [int(col[4:]) for col in data.columns if col.startswith("cdd")]
-    candidate_models = [
-        get_single_cdd_only_candidate_model(
-            data,
-            minimum_non_zero_cdd,
-            minimum_total_cdd,
-            beta_cdd_maximum_p_value,
-            weights_col,
-            balance_point,
-        )
-        for balance_point in balance_points
+    balance_points = [
+        _column_balance_point(col) for col in data.columns if col.startswith("cdd")
     ]
+    equivalent_balance_points = _equivalent_balance_points(data, "cdd", balance_points)
+
+    candidate_models = []
+    fitted_candidate_models = {}
+    for balance_point, equivalent in zip(balance_points, equivalent_balance_points):
+        if equivalent in fitted_candidate_models:
+            formula = "meter_value ~ %s" % _formula_term("cdd_%s" % balance_point)
+            candidate_model = _equivalent_candidate_model(
+                fitted_candidate_models[equivalent],
+                formula,
+                cooling_balance_point=balance_point,
+            )
+        else:
+            candidate_model = get_single_cdd_only_candidate_model(
+                data,
+                minimum_non_zero_cdd,
+                minimum_total_cdd,
+                beta_cdd_maximum_p_value,
+                weights_col,
+                balance_point,
+            )
+            if candidate_model.status != "ERROR":
+                fitted_candidate_models[balance_point] = candidate_model
+        candidate_models.append(candidate_model)
     return candidate_models
 
 
@@ -792,7 +1231,8 @@ def get_single_hdd_only_candidate_model(
     """
     model_type = "hdd_only"
     hdd_column = "hdd_%s" % balance_point
-    formula = "meter_value ~ %s" % hdd_column
+    hdd_term = _formula_term(hdd_column)
+    formula = "meter_value ~ %s" % hdd_term
 
     degree_day_warnings = []
     degree_day_warnings.extend(
@@ -818,7 +1258,11 @@ def get_single_hdd_only_candidate_model(
     if weights_col is None:
         weights = 1
     else:
-        weights = data[weights_col]
+        # upcast compact (e.g., float32) weights for fitting.
+        weights = data[weights_col].astype(np.float64)
+
+    # deferred: statsmodels is slow to import and only needed for fitting
+    import statsmodels.formula.api as smf
 
     try:
         model = smf.wls(formula=formula, data=data, weights=weights)
@@ -827,46 +1271,23 @@ def get_single_hdd_only_candidate_model(
 
     result = model.fit()
     r_squared_adj = result.rsquared_adj
-    beta_hdd_p_value = result.pvalues[hdd_column]
+    beta_hdd_p_value = result.pvalues[hdd_term]
 
     # CalTrack 3.3.1.3
     model_params = {
         "intercept": result.params["Intercept"],
-        "beta_hdd": result.params[hdd_column],
+        "beta_hdd": result.params[hdd_term],
         "heating_balance_point": balance_point,
     }
 
-    model_warnings = []
-
-    # CalTrack 3.4.3.2
-    for parameter in ["intercept", "beta_hdd"]:
-        model_warnings.extend(
-            get_parameter_negative_warning(model_type, model_params, parameter)
-        )
-    model_warnings.extend(
-        get_parameter_p_value_too_high_warning(
-            model_type,
-            model_params,
-            parameter,
-            beta_hdd_p_value,
-            beta_hdd_maximum_p_value,
-        )
-    )
-
-    if len(model_warnings) > 0:
-        status = "DISQUALIFIED"
-    else:
-        status = "QUALIFIED"
-
-    return _candidate_model_factory(
+    return _get_fitted_candidate_model(
         model_type,
         formula,
-        status,
-        warnings=model_warnings,
-        model_params=model_params,
+        model_params,
+        [("beta_hdd", beta_hdd_p_value, beta_hdd_maximum_p_value)],
+        r_squared_adj,
         model=model,
         result=result,
-        r_squared_adj=r_squared_adj,
     )
 
 
@@ -897,19 +1318,33 @@ def get_hdd_only_candidate_models(
         A list of hdd-only candidate models, with any associated warnings.
     """
 
-    balance_points = [int(col[4:]) for col in data.columns if col.startswith("hdd")]
-
-    candidate_models = [
-        get_single_hdd_only_candidate_model(
-            data,
-            minimum_non_zero_hdd,
-            minimum_total_hdd,
-            beta_hdd_maximum_p_value,
-            weights_col,
-            balance_point,
-        )
-        for balance_point in balance_points
+    balance_points = [
+        _column_balance_point(col) for col in data.columns if col.startswith("hdd")
     ]
+    equivalent_balance_points = _equivalent_balance_points(data, "hdd", balance_points)
+
+    candidate_models = []
+    fitted_candidate_models = {}
+    for balance_point, equivalent in zip(balance_points, equivalent_balance_points):
+        if equivalent in fitted_candidate_models:
+            formula = "meter_value ~ %s" % _formula_term("hdd_%s" % balance_point)
+            candidate_model = _equivalent_candidate_model(
+                fitted_candidate_models[equivalent],
+                formula,
+                heating_balance_point=balance_point,
+            )
+        else:
+            candidate_model = get_single_hdd_only_candidate_model(
+                data,
+                minimum_non_zero_hdd,
+                minimum_total_hdd,
+                beta_hdd_maximum_p_value,
+                weights_col,
+                balance_point,
+            )
+            if candidate_model.status != "ERROR":
+                fitted_candidate_models[balance_point] = candidate_model
+        candidate_models.append(candidate_model)
     return candidate_models
 
 
@@ -962,7 +1397,9 @@ def get_single_cdd_hdd_candidate_model(
     model_type = "cdd_hdd"
     cdd_column = "cdd_%s" % cooling_balance_point
     hdd_column = "hdd_%s" % heating_balance_point
-    formula = "meter_value ~ %s + %s" % (cdd_column, hdd_column)
+    cdd_term = _formula_term(cdd_column)
+    hdd_term = _formula_term(hdd_column)
+    formula = "meter_value ~ %s + %s" % (cdd_term, hdd_term)
 
     degree_day_warnings = []
     degree_day_warnings.extend(
@@ -1014,7 +1451,11 @@ def get_single_cdd_hdd_candidate_model(
     if weights_col is None:
         weights = 1
     else:
-        weights = data[weights_col]
+        # upcast compact (e.g., float32) weights for fitting.
+        weights = data[weights_col].astype(np.float64)
+
+    # deferred: statsmodels is slow to import and only needed for fitting
+    import statsmodels.formula.api as smf
 
     try:
         model = smf.wls(formula=formula, data=data, weights=weights)
@@ -1023,58 +1464,30 @@ def get_single_cdd_hdd_candidate_model(
 
     result = model.fit()
     r_squared_adj = result.rsquared_adj
-    beta_cdd_p_value = result.pvalues[cdd_column]
-    beta_hdd_p_value = result.pvalues[hdd_column]
+    beta_cdd_p_value = result.pvalues[cdd_term]
+    beta_hdd_p_value = result.pvalues[hdd_term]
 
     # CalTrack 3.3.1.3
     model_params = {
         "intercept": result.params["Intercept"],
-        "beta_cdd": result.params[cdd_column],
-        "beta_hdd": result.params[hdd_column],
+        "beta_cdd": result.params[cdd_term],
+        "beta_hdd": result.params[hdd_term],
         "cooling_balance_point": cooling_balance_point,
         "heating_balance_point": heating_balance_point,
     }
 
-    model_warnings = []
-
-    # CalTrack 3.4.3.2
-    for parameter in ["intercept", "beta_cdd", "beta_hdd"]:
-        model_warnings.extend(
-            get_parameter_negative_warning(model_type, model_params, parameter)
-        )
-    model_warnings.extend(
-        get_parameter_p_value_too_high_warning(
-            model_type,
-            model_params,
-            parameter,
-            beta_cdd_p_value,
-            beta_cdd_maximum_p_value,
-        )
-    )
-    model_warnings.extend(
-        get_parameter_p_value_too_high_warning(
-            model_type,
-            model_params,
-            parameter,
-            beta_hdd_p_value,
-            beta_hdd_maximum_p_value,
-        )
-    )
-
-    if len(model_warnings) > 0:
-        status = "DISQUALIFIED"
-    else:
-        status = "QUALIFIED"
-
-    return _candidate_model_factory(
+    return _get_fitted_candidate_model(
         model_type,
         formula,
-        status,
-        warnings=model_warnings,
-        model_params=model_params,
+        model_params,
+        # both p-value warnings have always been reported under beta_hdd.
+        [
+            ("beta_hdd", beta_cdd_p_value, beta_cdd_maximum_p_value),
+            ("beta_hdd", beta_hdd_p_value, beta_hdd_maximum_p_value),
+        ],
+        r_squared_adj,
         model=model,
         result=result,
-        r_squared_adj=r_squared_adj,
     )
 
 
@@ -1120,19 +1533,328 @@ def get_cdd_hdd_candidate_models(
     """
 
     cooling_balance_points = [
-        int(col[4:]) for col in data.columns if col.startswith("cdd")
+        _column_balance_point(col) for col in data.columns if col.startswith("cdd")
     ]
     heating_balance_points = [
-        int(col[4:]) for col in data.columns if col.startswith("hdd")
+        _column_balance_point(col) for col in data.columns if col.startswith("hdd")
     ]
 
+    equivalent_cooling_balance_points = dict(
+        zip(
+            cooling_balance_points,
+            _equivalent_balance_points(data, "cdd", cooling_balance_points),
+        )
+    )
+    equivalent_heating_balance_points = dict(
+        zip(
+            heating_balance_points,
+            _equivalent_balance_points(data, "hdd", heating_balance_points),
+        )
+    )
+
     # CalTrack 3.2.2.1
-    candidate_models = [
-        get_single_cdd_hdd_candidate_model(
-            data,
-            minimum_non_zero_cdd,
-            minimum_non_zero_hdd,
-            minimum_total_cdd,
+    candidate_models = []
+    fitted_candidate_models = {}
+    for cooling_balance_point in cooling_balance_points:
+        for heating_balance_point in heating_balance_points:
+            if heating_balance_point > cooling_balance_point:
+                continue
+            equivalent = (
+                equivalent_cooling_balance_points[cooling_balance_point],
+                equivalent_heating_balance_points[heating_balance_point],
+            )
+            if equivalent in fitted_candidate_models:
+                formula = "meter_value ~ %s + %s" % (
+                    _formula_term("cdd_%s" % cooling_balance_point),
+                    _formula_term("hdd_%s" % heating_balance_point),
+                )
+                candidate_model = _equivalent_candidate_model(
+                    fitted_candidate_models[equivalent],
+                    formula,
+                    cooling_balance_point=cooling_balance_point,
+                    heating_balance_point=heating_balance_point,
+                )
+            else:
+                candidate_model = get_single_cdd_hdd_candidate_model(
+                    data,
+                    minimum_non_zero_cdd,
+                    minimum_non_zero_hdd,
+                    minimum_total_cdd,
+                    minimum_total_hdd,
+                    beta_cdd_maximum_p_value,
+                    beta_hdd_maximum_p_value,
+                    weights_col,
+                    cooling_balance_point,
+                    heating_balance_point,
+                )
+                if candidate_model.status != "ERROR":
+                    fitted_candidate_models[equivalent] = candidate_model
+            candidate_models.append(candidate_model)
+    return candidate_models
+
+
+class _ChangePointSums(object):
+    """ Cumulative sums over temperature-sorted daily data from which the
+    least squares fit of a change-point model can be found for any balance
+    points in O(log n) time.
+    """
+
+    def __init__(self, temperatures, meter_values, weights):
+        order = np.argsort(temperatures, kind="mergesort")
+        t, y, w = temperatures[order], meter_values[order], weights[order]
+        self.temperatures = t
+
+        def _cumulative(values):
+            return np.concatenate([[0.0], np.cumsum(values)])
+
+        self.w, self.wt, self.wtt = (
+            _cumulative(w),
+            _cumulative(w * t),
+            _cumulative(w * t * t),
+        )
+        self.wy, self.wty = _cumulative(w * y), _cumulative(w * t * y)
+        self.t = _cumulative(t)
+        self.wyy = np.dot(w * y, y)
+
+    def heating(self, balance_points):
+        # sums over days with temperatures below the balance points
+        k = np.searchsorted(self.temperatures, balance_points, side="left")
+        bp = balance_points
+        return (
+            k,
+            bp * k - self.t[k],
+            bp * self.w[k] - self.wt[k],
+            bp * bp * self.w[k] - 2 * bp * self.wt[k] + self.wtt[k],
+            bp * self.wy[k] - self.wty[k],
+        )
+
+    def cooling(self, balance_points):
+        # sums over days with temperatures above the balance points
+        k = np.searchsorted(self.temperatures, balance_points, side="right")
+        bp = balance_points
+        w, wt, wtt = (
+            self.w[-1] - self.w[k],
+            self.wt[-1] - self.wt[k],
+            self.wtt[-1] - self.wtt[k],
+        )
+        return (
+            len(self.temperatures) - k,
+            (self.t[-1] - self.t[k]) - bp * (len(self.temperatures) - k),
+            wt - bp * w,
+            wtt - 2 * bp * wt + bp * bp * w,
+            (self.wty[-1] - self.wty[k]) - bp * (self.wy[-1] - self.wy[k]),
+        )
+
+    def fit(self, heating_balance_points=None, cooling_balance_points=None):
+        """ Return the params, sum of squared residuals, and the number of
+        non-zero and total degree days of each fit, broadcasting over the
+        balance points given. Heating and cooling degree days are assumed
+        not to overlap, i.e., heating balance points must not exceed
+        cooling balance points.
+        """
+        columns = []
+        if heating_balance_points is not None:
+            columns.append(self.heating(heating_balance_points))
+        if cooling_balance_points is not None:
+            columns.append(self.cooling(cooling_balance_points))
+
+        n_columns = len(columns) + 1
+        shape = np.broadcast(*[column[2] for column in columns]).shape
+        gram = np.zeros(shape + (n_columns, n_columns))
+        moments = np.zeros(shape + (n_columns,))
+        gram[..., 0, 0] = self.w[-1]
+        moments[..., 0] = self.wy[-1]
+        for i, (_, _, sum_x, sum_xx, sum_xy) in enumerate(columns, 1):
+            gram[..., 0, i] = gram[..., i, 0] = sum_x
+            gram[..., i, i] = sum_xx
+            moments[..., i] = sum_xy
+
+        params = np.full(shape + (n_columns,), np.nan)
+        ssr = np.full(shape, np.inf)
+        solvable = np.abs(np.linalg.det(gram)) > 1e-9 * np.prod(
+            np.diagonal(gram, axis1=-2, axis2=-1), axis=-1
+        )
+        params[solvable] = np.linalg.solve(gram[solvable], moments[solvable])
+        ssr[solvable] = self.wyy - np.einsum(
+            "...i,...i->...", params[solvable], moments[solvable]
+        )
+        return params, ssr, [column[:2] for column in columns]
+
+
+def get_change_point_candidate_model(
+    data,
+    model_type="cdd_hdd",
+    heating_balance_point_bounds=(30, 90),
+    cooling_balance_point_bounds=(30, 90),
+    grid_step=1,
+    minimum_non_zero_cdd=10,
+    minimum_non_zero_hdd=10,
+    minimum_total_cdd=20,
+    minimum_total_hdd=20,
+    beta_cdd_maximum_p_value=1,
+    beta_hdd_maximum_p_value=1,
+    weights_col=None,
+):
+    """ Return a single candidate model with balance points optimized over a
+    continuous range rather than chosen from a fixed set of ``hdd_<bp>`` and
+    ``cdd_<bp>`` columns.
+
+    The change-point model is fit to daily mean temperatures. Its sum of
+    squared residuals is found for any balance points from cumulative sums
+    over temperature-sorted data, first on a grid of balance points
+    ``grid_step`` apart, and then continuously around the best grid point.
+    Balance points are restricted to those for which degree days meet the
+    ``minimum_*`` requirements and no parameters are negative, and are
+    rounded to hundredths of a degree. Only the final candidate model is fit
+    with statsmodels, as in :any:`eemeter.get_single_cdd_hdd_candidate_model`
+    (or its hdd-only and cdd-only counterparts), so the result is a regular
+    candidate model with fractional balance points that fits at least as
+    well as any on the grid.
+
+    Parameters
+    ----------
+    data : :any:`pandas.DataFrame`
+        Daily data containing at least the columns ``meter_value`` and
+        ``temperature_mean``, as made by
+        :any:`eemeter.merge_temperature_data`. Days with an ``n_days_kept``
+        of 0, i.e., insufficient temperature data, are ignored.
+    model_type : :any:`str`, optional
+        ``'cdd_hdd'``, ``'hdd_only'``, or ``'cdd_only'``.
+    heating_balance_point_bounds : :any:`tuple` of :any:`float`, optional
+        The lowest and highest heating balance points to consider.
+    cooling_balance_point_bounds : :any:`tuple` of :any:`float`, optional
+        The lowest and highest cooling balance points to consider.
+    grid_step : :any:`float`, optional
+        The spacing of the balance point grid searched before optimizing
+        continuously.
+    minimum_non_zero_cdd : :any:`int`, optional
+        Minimum allowable number of non-zero cooling degree day values.
+    minimum_non_zero_hdd : :any:`int`, optional
+        Minimum allowable number of non-zero heating degree day values.
+    minimum_total_cdd : :any:`float`, optional
+        Minimum allowable total sum of cooling degree day values.
+    minimum_total_hdd : :any:`float`, optional
+        Minimum allowable total sum of heating degree day values.
+    beta_cdd_maximum_p_value : :any:`float`, optional
+        The maximum allowable p-value of the beta cdd parameter.
+    beta_hdd_maximum_p_value : :any:`float`, optional
+        The maximum allowable p-value of the beta hdd parameter.
+    weights_col : :any:`str` or None, optional
+        The name of the column (if any) in ``data`` to use as weights.
+
+    Returns
+    -------
+    candidate_model : :any:`CandidateModel`
+        A single candidate model of the given type, with any associated
+        warnings.
+    """
+    if model_type not in ["cdd_hdd", "hdd_only", "cdd_only"]:
+        raise ValueError("invalid change point model type: {}".format(model_type))
+    fit_hdd = model_type in ["cdd_hdd", "hdd_only"]
+    fit_cdd = model_type in ["cdd_hdd", "cdd_only"]
+
+    temperatures = np.asarray(data.temperature_mean.values, dtype=np.float64)
+    meter_values = np.asarray(data.meter_value.values, dtype=np.float64)
+    if weights_col is None:
+        weights = np.ones(len(data))
+    else:
+        weights = np.asarray(data[weights_col].values, dtype=np.float64)
+    used = ~(np.isnan(temperatures) | np.isnan(meter_values) | np.isnan(weights))
+    if "n_days_kept" in data.columns:
+        used &= (data.n_days_kept > 0).values
+    sums = _ChangePointSums(temperatures[used], meter_values[used], weights[used])
+
+    def _evaluate(heating_balance_points, cooling_balance_points):
+        # sums of squared residuals, inf where constraints aren't met.
+        params, ssr, degree_days = sums.fit(
+            heating_balance_points, cooling_balance_points
+        )
+        with np.errstate(invalid="ignore"):
+            feasible = np.all(params >= 0, axis=-1)
+        minimums = []
+        if fit_hdd:
+            minimums.append((minimum_non_zero_hdd, minimum_total_hdd))
+        if fit_cdd:
+            minimums.append((minimum_non_zero_cdd, minimum_total_cdd))
+        for (n_non_zero, total), (minimum_non_zero, minimum_total) in zip(
+            degree_days, minimums
+        ):
+            feasible &= (n_non_zero >= minimum_non_zero) & (total >= minimum_total)
+        if fit_hdd and fit_cdd:
+            feasible &= heating_balance_points <= cooling_balance_points
+        return np.where(feasible, ssr, np.inf), ssr
+
+    bounds = []
+    if fit_hdd:
+        bounds.append(heating_balance_point_bounds)
+    if fit_cdd:
+        bounds.append(cooling_balance_point_bounds)
+    lower, upper = np.array(bounds, dtype=np.float64).T
+
+    def _split(balance_points):
+        heating = balance_points[0] if fit_hdd else None
+        cooling = balance_points[-1] if fit_cdd else None
+        return heating, cooling
+
+    # grid search
+    grids = np.meshgrid(
+        *[
+            np.arange(low, high + grid_step / 2.0, grid_step, dtype=np.float64)
+            for low, high in bounds
+        ],
+        indexing="ij"
+    )
+    constrained_ssr, ssr = _evaluate(*_split(grids))
+    constrained = not np.isinf(constrained_ssr).all()
+    if not constrained:
+        # no balance points meet the constraints; report on the best fit.
+        constrained_ssr = ssr
+    best = np.argmin(constrained_ssr)
+    best_ssr = constrained_ssr.flat[best]
+    best_balance_points = np.array([grid.flat[best] for grid in grids])
+
+    # continuous refinement around the best grid point
+    if constrained:
+        from scipy import optimize
+
+        def _objective(balance_points):
+            balance_points = np.clip(balance_points, lower, upper)
+            return float(_evaluate(*_split(balance_points))[0])
+
+        result = optimize.minimize(
+            _objective,
+            best_balance_points,
+            method="Nelder-Mead",
+            options={"xatol": 1e-4, "fatol": 1e-10},
+        )
+        refined = np.clip(np.round(result.x, 2), lower, upper)
+        if _objective(refined) < best_ssr:
+            best_balance_points = refined
+
+    best_balance_points = [_balance_point(bp) for bp in best_balance_points]
+    heating_balance_point = best_balance_points[0] if fit_hdd else None
+    cooling_balance_point = best_balance_points[-1] if fit_cdd else None
+
+    # fit the final candidate as usual, from degree day columns at the
+    # optimal balance points.
+    candidate_data = data.copy()
+    if not used.all():
+        candidate_data.loc[~used, "meter_value"] = np.nan
+    if fit_hdd:
+        candidate_data["hdd_%s" % heating_balance_point] = np.where(
+            used, np.maximum(heating_balance_point - temperatures, 0), np.nan
+        )
+    if fit_cdd:
+        candidate_data["cdd_%s" % cooling_balance_point] = np.where(
+            used, np.maximum(temperatures - cooling_balance_point, 0), np.nan
+        )
+
+    if model_type == "cdd_hdd":
+        return get_single_cdd_hdd_candidate_model(
+            candidate_data,
+            minimum_non_zero_cdd,
+            minimum_non_zero_hdd,
+            minimum_total_cdd,
             minimum_total_hdd,
             beta_cdd_maximum_p_value,
             beta_hdd_maximum_p_value,
@@ -1140,13 +1862,27 @@ def get_cdd_hdd_candidate_models(
             cooling_balance_point,
             heating_balance_point,
         )
-        for cooling_balance_point in cooling_balance_points
-        for heating_balance_point in heating_balance_points
-        if heating_balance_point <= cooling_balance_point
-    ]
-    return candidate_models
+    elif model_type == "hdd_only":
+        return get_single_hdd_only_candidate_model(
+            candidate_data,
+            minimum_non_zero_hdd,
+            minimum_total_hdd,
+            beta_hdd_maximum_p_value,
+            weights_col,
+            heating_balance_point,
+        )
+    else:
+        return get_single_cdd_only_candidate_model(
+            candidate_data,
+            minimum_non_zero_cdd,
+            minimum_total_cdd,
+            beta_cdd_maximum_p_value,
+            weights_col,
+            cooling_balance_point,
+        )
 
 
+@timed_function("select_best_candidate")
 def select_best_candidate(candidate_models):
     """ Select and return the best candidate model based on r-squared and
     qualification.
@@ -1193,6 +1929,69 @@ def select_best_candidate(candidate_models):
     return best_candidate, []
 
 
+def _no_data_model_results():
+    return ModelResults(
+        status="NO DATA",
+        method_name="caltrack_method",
+        warnings=[
+            EEMeterWarning(
+                qualified_name="eemeter.caltrack_method.no_data",
+                description=("No data available. Cannot fit model."),
+                data={},
+            )
+        ],
+    )
+
+
+def _get_model_metrics(data, candidate_model):
+    if candidate_model.model_type in ["cdd_hdd"]:
+        num_parameters = 2
+    elif candidate_model.model_type in ["hdd_only", "cdd_only"]:
+        num_parameters = 1
+    else:
+        num_parameters = 0
+
+    predicted = _caltrack_predict_design_matrix(
+        candidate_model.model_type,
+        candidate_model.model_params,
+        data,
+        input_averages=True,
+        output_averages=True,
+    )
+    return ModelMetrics(data.meter_value, predicted, num_parameters)
+
+
+def _caltrack_method_model_results(data, candidates, settings, metrics_func=None):
+    # find best candidate result
+    best_candidate, candidate_warnings = select_best_candidate(candidates)
+
+    warnings = candidate_warnings
+
+    if best_candidate is None:
+        status = "NO MODEL"
+        r_squared_adj = None
+    else:
+        status = "SUCCESS"
+        r_squared_adj = best_candidate.r_squared_adj
+
+    model_result = ModelResults(
+        status=status,
+        method_name="caltrack_method",
+        model=best_candidate,
+        candidates=candidates,
+        r_squared_adj=r_squared_adj,
+        warnings=warnings,
+        settings=settings,
+    )
+
+    if best_candidate is not None:
+        if metrics_func is None:
+            metrics_func = _get_model_metrics
+        model_result.metrics = metrics_func(data, best_candidate)
+
+    return model_result
+
+
 def caltrack_method(
     data,
     fit_cdd=True,
@@ -1269,85 +2068,63 @@ def caltrack_method(
     data = overwrite_partial_rows_with_nan(data)
 
     if data.empty:
-        return ModelResults(
-            status="NO DATA",
-            method_name="caltrack_method",
-            warnings=[
-                EEMeterWarning(
-                    qualified_name="eemeter.caltrack_method.no_data",
-                    description=("No data available. Cannot fit model."),
-                    data={},
-                )
-            ],
-        )
+        return _no_data_model_results()
 
     # collect all candidate results, then validate all at once
     # CalTrack 3.4.3.1
     candidates = []
 
     if fit_intercept_only:
-        candidates.extend(
-            get_intercept_only_candidate_models(data, weights_col=weights_col)
-        )
-
-    if fit_hdd_only:
-        candidates.extend(
-            get_hdd_only_candidate_models(
-                data=data,
-                minimum_non_zero_hdd=minimum_non_zero_hdd,
-                minimum_total_hdd=minimum_total_hdd,
-                beta_hdd_maximum_p_value=beta_hdd_maximum_p_value,
-                weights_col=weights_col,
-            )
-        )
-
-    # cdd models ignored for gas
-    if fit_cdd:
-        if fit_cdd_only:
+        with timed("caltrack_method.intercept_only"):
             candidates.extend(
-                get_cdd_only_candidate_models(
-                    data=data,
-                    minimum_non_zero_cdd=minimum_non_zero_cdd,
-                    minimum_total_cdd=minimum_total_cdd,
-                    beta_cdd_maximum_p_value=beta_cdd_maximum_p_value,
-                    weights_col=weights_col,
-                )
+                get_intercept_only_candidate_models(data, weights_col=weights_col)
             )
 
-        if fit_cdd_hdd:
+    if fit_hdd_only:
+        with timed("caltrack_method.hdd_only"):
             candidates.extend(
-                get_cdd_hdd_candidate_models(
+                get_hdd_only_candidate_models(
                     data=data,
-                    minimum_non_zero_cdd=minimum_non_zero_cdd,
                     minimum_non_zero_hdd=minimum_non_zero_hdd,
-                    minimum_total_cdd=minimum_total_cdd,
                     minimum_total_hdd=minimum_total_hdd,
-                    beta_cdd_maximum_p_value=beta_cdd_maximum_p_value,
                     beta_hdd_maximum_p_value=beta_hdd_maximum_p_value,
                     weights_col=weights_col,
                 )
             )
 
-    # find best candidate result
-    best_candidate, candidate_warnings = select_best_candidate(candidates)
-
-    warnings = candidate_warnings
+    # cdd models ignored for gas
+    if fit_cdd:
+        if fit_cdd_only:
+            with timed("caltrack_method.cdd_only"):
+                candidates.extend(
+                    get_cdd_only_candidate_models(
+                        data=data,
+                        minimum_non_zero_cdd=minimum_non_zero_cdd,
+                        minimum_total_cdd=minimum_total_cdd,
+                        beta_cdd_maximum_p_value=beta_cdd_maximum_p_value,
+                        weights_col=weights_col,
+                    )
+                )
 
-    if best_candidate is None:
-        status = "NO MODEL"
-        r_squared_adj = None
-    else:
-        status = "SUCCESS"
-        r_squared_adj = best_candidate.r_squared_adj
+        if fit_cdd_hdd:
+            with timed("caltrack_method.cdd_hdd"):
+                candidates.extend(
+                    get_cdd_hdd_candidate_models(
+                        data=data,
+                        minimum_non_zero_cdd=minimum_non_zero_cdd,
+                        minimum_non_zero_hdd=minimum_non_zero_hdd,
+                        minimum_total_cdd=minimum_total_cdd,
+                        minimum_total_hdd=minimum_total_hdd,
+                        beta_cdd_maximum_p_value=beta_cdd_maximum_p_value,
+                        beta_hdd_maximum_p_value=beta_hdd_maximum_p_value,
+                        weights_col=weights_col,
+                    )
+                )
 
-    model_result = ModelResults(
-        status=status,
-        method_name="caltrack_method",
-        model=best_candidate,
-        candidates=candidates,
-        r_squared_adj=r_squared_adj,
-        warnings=warnings,
-        settings={
+    model_result = _caltrack_method_model_results(
+        data,
+        candidates,
+        {
             "fit_cdd": fit_cdd,
             "minimum_non_zero_cdd": minimum_non_zero_cdd,
             "minimum_non_zero_hdd": minimum_non_zero_hdd,
@@ -1358,24 +2135,608 @@ def caltrack_method(
         },
     )
 
-    if best_candidate is not None:
-        if best_candidate.model_type in ["cdd_hdd"]:
-            num_parameters = 2
-        elif best_candidate.model_type in ["hdd_only", "cdd_only"]:
-            num_parameters = 1
+    timings = current_timings()
+    if timings is not None:
+        model_result.timings = timings.copy()
+
+    return model_result
+
+
+def _fit_from_sums(gram, moments, endog_sum_of_squares, n, columns):
+    """ Solve weighted least squares for several sets of exog ``columns``
+    from sums of cross products, giving results as from statsmodels: params,
+    adjusted r-squared and p-values. Column 0 must be the intercept.
+    """
+    # deferred: scipy is slow to import and only needed for fitting
+    from scipy import stats
+
+    gram_subsets = gram[columns[:, :, None], columns[:, None, :]]
+    moment_subsets = moments[columns]
+    normalized_cov_params = np.linalg.pinv(gram_subsets)
+    params = np.einsum("mij,mj->mi", normalized_cov_params, moment_subsets)
+    ssr = (
+        endog_sum_of_squares
+        - 2 * np.einsum("mi,mi->m", params, moment_subsets)
+        + np.einsum("mi,mij,mj->m", params, gram_subsets, params)
+    )
+    ssr = np.maximum(ssr, 0)
+    df_resid = n - np.linalg.matrix_rank(gram_subsets)
+    centered_tss = endog_sum_of_squares - moments[0] ** 2 / gram[0, 0]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared_adj = 1 - (n - 1) / df_resid * ssr / centered_tss
+        bse = np.sqrt(
+            np.diagonal(normalized_cov_params, axis1=1, axis2=2)
+            * (ssr / df_resid)[:, None]
+        )
+        p_values = 2 * stats.t.sf(np.abs(params / bse), df_resid[:, None])
+    return params, r_squared_adj, p_values
+
+
+def _select_best_rolling_candidate(candidate_models, rtol=1e-9):
+    # Like select_best_candidate, but r-squared values from rolling sums are
+    # compared with a tolerance, so that exact ties are not broken by
+    # rounding error, and the first of them wins as in a refit.
+    best_candidate, warnings = select_best_candidate(candidate_models)
+    if best_candidate is None:
+        return best_candidate, warnings
+    tolerance = rtol * abs(best_candidate.r_squared_adj)
+    best_candidate = next(
+        candidate
+        for candidate in candidate_models
+        if candidate.status == "QUALIFIED"
+        and abs(candidate.r_squared_adj - best_candidate.r_squared_adj) <= tolerance
+    )
+    return best_candidate, warnings
+
+
+def caltrack_method_rolling(
+    data,
+    window=365,
+    fit_cdd=True,
+    use_billing_presets=False,
+    minimum_non_zero_cdd=10,
+    minimum_non_zero_hdd=10,
+    minimum_total_cdd=20,
+    minimum_total_hdd=20,
+    beta_cdd_maximum_p_value=1,
+    beta_hdd_maximum_p_value=1,
+    weights_col=None,
+    fit_intercept_only=True,
+    fit_cdd_only=True,
+    fit_hdd_only=True,
+    fit_cdd_hdd=True,
+):
+    """ CalTRACK method refit on a baseline window sliding over the data one
+    period at a time, e.g., for continuous monitoring.
+
+    Results match those of :any:`eemeter.caltrack_method` on each baseline
+    up to floating point error, but candidate models are not refit from
+    scratch. Instead, sums of cross products of meter values and degree
+    days for all balance points are kept and updated as the window slides,
+    by adding the newest period and removing the expired one, and each
+    candidate model is solved from these sums. Candidate models therefore
+    have no statsmodels ``model`` or ``result``. Sums are recomputed from
+    scratch once per ``window`` periods to bound rounding drift.
+
+    Candidates whose adjusted r-squared values tie up to rounding error
+    (e.g., degree days for several balance points that all temperatures
+    fall below) are resolved in favor of the first, as exact ties are by
+    :any:`eemeter.select_best_candidate`. Rounding error in a refit may
+    break such ties differently.
+
+    Parameters
+    ----------
+    data : :any:`pandas.DataFrame`
+        A DataFrame like that required by :any:`eemeter.caltrack_method`, for
+        the full extent over which to slide the baseline window. The last
+        period only marks the end of the data, as in the output of
+        :any:`eemeter.merge_temperature_data`.
+    window : :any:`int`, optional
+        The number of periods in each baseline, e.g., 365 for daily data.
+    **kwargs
+        Other arguments are as for :any:`eemeter.caltrack_method`.
+
+    Yields
+    ------
+    baseline_end, model_results : :any:`pandas.Timestamp`, :any:`eemeter.ModelResults`
+        The end of each baseline and the results of the CalTRACK method for
+        that baseline, i.e., for the ``window`` periods of ``data`` before
+        ``baseline_end``. For daily data, the baseline is the same as that
+        given by :any:`eemeter.get_baseline_data` with ``end=baseline_end``
+        and ``max_days=window``.
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1.")
+
+    if use_billing_presets:
+        minimum_non_zero_cdd = 0
+        minimum_non_zero_hdd = 0
+        minimum_total_cdd = 0
+        minimum_total_hdd = 0
+
+    settings = {
+        "fit_cdd": fit_cdd,
+        "minimum_non_zero_cdd": minimum_non_zero_cdd,
+        "minimum_non_zero_hdd": minimum_non_zero_hdd,
+        "minimum_total_cdd": minimum_total_cdd,
+        "minimum_total_hdd": minimum_total_hdd,
+        "beta_cdd_maximum_p_value": beta_cdd_maximum_p_value,
+        "beta_hdd_maximum_p_value": beta_hdd_maximum_p_value,
+    }
+
+    data = overwrite_partial_rows_with_nan(data)
+
+    hdd_columns = [column for column in data.columns if column.startswith("hdd")]
+    cdd_columns = [column for column in data.columns if column.startswith("cdd")]
+    heating_balance_points = [_column_balance_point(column) for column in hdd_columns]
+    cooling_balance_points = [_column_balance_point(column) for column in cdd_columns]
+    n_hdd = len(hdd_columns)
+
+    # design matrix columns: intercept, hdd columns, cdd columns.
+    meter_value = np.asarray(data.meter_value.values, dtype=np.float64)
+    exog = np.column_stack(
+        [np.ones(len(data))]
+        + [data[column].values for column in hdd_columns + cdd_columns]
+    ).astype(np.float64)
+    valid = ~np.isnan(meter_value)
+    if weights_col is None:
+        weights = valid.astype(np.float64)
+    else:
+        weights = np.where(valid, data[weights_col].values.astype(np.float64), 0)
+    valid_exog = np.where(valid[:, None], exog, 0)
+    valid_endog = np.where(valid, meter_value, 0)
+
+    def _sums(rows):
+        x, y, w = valid_exog[rows], valid_endog[rows], weights[rows]
+        wx = x * w[:, None]
+        return [
+            np.count_nonzero(valid[rows]),
+            np.dot(wx.T, x),
+            np.dot(wx.T, y),
+            np.dot(w * y, y),
+            x[:, 1:].sum(axis=0),
+            (x[:, 1:] > 0).sum(axis=0),
+        ]
+
+    hdd_only_columns = np.array([[0, 1 + i] for i in range(n_hdd)], dtype=int)
+    cdd_only_columns = np.array(
+        [[0, 1 + n_hdd + i] for i in range(len(cdd_columns))], dtype=int
+    )
+    cdd_hdd_pairs = [
+        (i, j)
+        for i, cooling_balance_point in enumerate(cooling_balance_points)
+        for j, heating_balance_point in enumerate(heating_balance_points)
+        if heating_balance_point <= cooling_balance_point
+    ]
+    cdd_hdd_columns = np.array(
+        [[0, 1 + n_hdd + i, 1 + j] for i, j in cdd_hdd_pairs], dtype=int
+    )
+
+    def _degree_day_warnings(model_type, degree_day_type, i, totals, non_zeros):
+        if degree_day_type == "hdd":
+            balance_point = heating_balance_points[i]
+            minimum_total, minimum_non_zero = minimum_total_hdd, minimum_non_zero_hdd
+            column = 1 + i
         else:
-            num_parameters = 0
-
-        predicted = _caltrack_predict_design_matrix(
-            best_candidate.model_type,
-            best_candidate.model_params,
-            data,
-            input_averages=True,
-            output_averages=True,
+            balance_point = cooling_balance_points[i]
+            minimum_total, minimum_non_zero = minimum_total_cdd, minimum_non_zero_cdd
+            column = 1 + n_hdd + i
+        return _get_total_degree_day_too_low_warning(
+            model_type,
+            balance_point,
+            degree_day_type,
+            totals[column - 1],
+            minimum_total,
+        ) + _get_too_few_non_zero_degree_day_warning(
+            model_type,
+            balance_point,
+            degree_day_type,
+            int(non_zeros[column - 1]),
+            minimum_non_zero,
         )
-        model_result.metrics = ModelMetrics(data.meter_value, predicted, num_parameters)
 
-    return model_result
+    def _not_attempted(model_type, formula, warnings):
+        return _candidate_model_factory(
+            model_type,
+            formula,
+            "NOT ATTEMPTED",
+            warnings=warnings,
+            use_predict_func=False,
+        )
+
+    def _candidates(n, gram, moments, endog_sum_of_squares, totals, non_zeros):
+        def _fit(columns):
+            if len(columns) == 0:
+                return None, None, None
+            return _fit_from_sums(gram, moments, endog_sum_of_squares, n, columns)
+
+        candidates = []
+
+        if fit_intercept_only:
+            candidates.append(
+                _get_fitted_candidate_model(
+                    "intercept_only",
+                    "meter_value ~ 1",
+                    {"intercept": moments[0] / gram[0, 0]},
+                    [],
+                    0,
+                )
+            )
+
+        if fit_hdd_only:
+            model_type = "hdd_only"
+            params, r_squared_adj, p_values = _fit(hdd_only_columns)
+            for i, balance_point in enumerate(heating_balance_points):
+                hdd_column = hdd_columns[i]
+                formula = "meter_value ~ %s" % _formula_term(hdd_column)
+                warnings = _degree_day_warnings(model_type, "hdd", i, totals, non_zeros)
+                if len(warnings) > 0:
+                    candidates.append(_not_attempted(model_type, formula, warnings))
+                    continue
+                model_params = {
+                    "intercept": params[i, 0],
+                    "beta_hdd": params[i, 1],
+                    "heating_balance_point": balance_point,
+                }
+                candidates.append(
+                    _get_fitted_candidate_model(
+                        model_type,
+                        formula,
+                        model_params,
+                        [("beta_hdd", p_values[i, 1], beta_hdd_maximum_p_value)],
+                        r_squared_adj[i],
+                    )
+                )
+
+        if fit_cdd and fit_cdd_only:
+            model_type = "cdd_only"
+            params, r_squared_adj, p_values = _fit(cdd_only_columns)
+            for i, balance_point in enumerate(cooling_balance_points):
+                cdd_column = cdd_columns[i]
+                formula = "meter_value ~ %s" % _formula_term(cdd_column)
+                warnings = _degree_day_warnings(model_type, "cdd", i, totals, non_zeros)
+                if len(warnings) > 0:
+                    candidates.append(_not_attempted(model_type, formula, warnings))
+                    continue
+                model_params = {
+                    "intercept": params[i, 0],
+                    "beta_cdd": params[i, 1],
+                    "cooling_balance_point": balance_point,
+                }
+                candidates.append(
+                    _get_fitted_candidate_model(
+                        model_type,
+                        formula,
+                        model_params,
+                        [("beta_cdd", p_values[i, 1], beta_cdd_maximum_p_value)],
+                        r_squared_adj[i],
+                    )
+                )
+
+        if fit_cdd and fit_cdd_hdd:
+            model_type = "cdd_hdd"
+            params, r_squared_adj, p_values = _fit(cdd_hdd_columns)
+            for k, (i, j) in enumerate(cdd_hdd_pairs):
+                formula = "meter_value ~ %s + %s" % (
+                    _formula_term(cdd_columns[i]),
+                    _formula_term(hdd_columns[j]),
+                )
+                warnings = _degree_day_warnings(
+                    model_type, "cdd", i, totals, non_zeros
+                ) + _degree_day_warnings(model_type, "hdd", j, totals, non_zeros)
+                if len(warnings) > 0:
+                    candidates.append(_not_attempted(model_type, formula, warnings))
+                    continue
+                model_params = {
+                    "intercept": params[k, 0],
+                    "beta_cdd": params[k, 1],
+                    "beta_hdd": params[k, 2],
+                    "cooling_balance_point": cooling_balance_points[i],
+                    "heating_balance_point": heating_balance_points[j],
+                }
+                candidates.append(
+                    _get_fitted_candidate_model(
+                        model_type,
+                        formula,
+                        model_params,
+                        # as in get_single_cdd_hdd_candidate_model
+                        [
+                            ("beta_hdd", p_values[k, 1], beta_cdd_maximum_p_value),
+                            ("beta_hdd", p_values[k, 2], beta_hdd_maximum_p_value),
+                        ],
+                        r_squared_adj[k],
+                    )
+                )
+
+        return candidates
+
+    sums = None
+    for start in range(len(data) - window):
+        stop = start + window
+        if start % window == 0:
+            # recompute from scratch once per window to bound rounding drift.
+            sums = _sums(slice(start, stop))
+        else:
+            # slide the window: add the newest period, remove the expired one.
+            added, removed = (
+                _sums(slice(stop - 1, stop)),
+                _sums(slice(start - 1, start)),
+            )
+            sums = [total + a - r for total, a, r in zip(sums, added, removed)]
+        n = sums[0]
+        baseline_end = data.index[stop]
+
+        if n <= 3:
+            # too little data for results from sums to match; fit directly.
+            baseline_data = data.iloc[start : stop + 1].copy()
+            baseline_data.iloc[-1] = np.nan
+            yield baseline_end, caltrack_method(
+                baseline_data,
+                fit_cdd=fit_cdd,
+                weights_col=weights_col,
+                fit_intercept_only=fit_intercept_only,
+                fit_cdd_only=fit_cdd_only,
+                fit_hdd_only=fit_hdd_only,
+                fit_cdd_hdd=fit_cdd_hdd,
+                **{k: v for k, v in settings.items() if k != "fit_cdd"}
+            )
+            continue
+
+        candidates = _candidates(*sums)
+        best_candidate, warnings = _select_best_rolling_candidate(candidates)
+
+        if best_candidate is None:
+            status = "NO MODEL"
+            r_squared_adj = None
+        else:
+            status = "SUCCESS"
+            r_squared_adj = best_candidate.r_squared_adj
+
+        model_results = ModelResults(
+            status=status,
+            method_name="caltrack_method",
+            model=best_candidate,
+            candidates=candidates,
+            r_squared_adj=r_squared_adj,
+            warnings=warnings,
+            settings=dict(settings),
+        )
+
+        if best_candidate is not None:
+            model_params = best_candidate.model_params
+            columns, coefficients = [0], [model_params["intercept"]]
+            if "beta_hdd" in model_params:
+                hdd_column = "hdd_%s" % model_params["heating_balance_point"]
+                columns.append(1 + hdd_columns.index(hdd_column))
+                coefficients.append(model_params["beta_hdd"])
+            if "beta_cdd" in model_params:
+                cdd_column = "cdd_%s" % model_params["cooling_balance_point"]
+                columns.append(1 + n_hdd + cdd_columns.index(cdd_column))
+                coefficients.append(model_params["beta_cdd"])
+
+            rows = slice(start, stop + 1)
+            index = data.index[rows]
+            predicted = np.dot(exog[rows][:, columns], coefficients)
+            observed = meter_value[rows].copy()
+            # the last period only marks the end of the baseline.
+            predicted[-1] = observed[-1] = np.nan
+            model_results.metrics = ModelMetrics(
+                pd.Series(observed, index=index),
+                pd.Series(predicted, index=index),
+                len(columns) - 1,
+            )
+
+        yield baseline_end, model_results
+
+
+_CALTRACK_METHOD_SETTINGS = {
+    "use_billing_presets": False,
+    "minimum_non_zero_cdd": 10,
+    "minimum_non_zero_hdd": 10,
+    "minimum_total_cdd": 20,
+    "minimum_total_hdd": 20,
+    "beta_cdd_maximum_p_value": 1,
+    "beta_hdd_maximum_p_value": 1,
+}
+
+
+def caltrack_method_sensitivity(
+    data,
+    settings,
+    fit_cdd=True,
+    weights_col=None,
+    fit_intercept_only=True,
+    fit_cdd_only=True,
+    fit_hdd_only=True,
+    fit_cdd_hdd=True,
+):
+    """ CalTRACK method under each of several settings for degree day
+    requirements and parameter p-values, e.g., for sensitivity studies.
+
+    These settings only decide which candidate models are attempted and
+    which qualify, not how they are fit. So rather than refitting for each
+    settings as :any:`eemeter.caltrack_method` would, every candidate model is
+    fit once, and its degree day totals, parameters and p-values are kept
+    and requalified under each settings. Results are the same as those of
+    :any:`eemeter.caltrack_method`, but candidate models share their
+    statsmodels ``model`` and ``result`` across settings.
+
+    Parameters
+    ----------
+    data : :any:`pandas.DataFrame`
+        A DataFrame like that required by :any:`eemeter.caltrack_method`.
+    settings : :any:`list` of :any:`dict`
+        Settings for each run of the CalTRACK method: dicts of any of the
+        arguments ``use_billing_presets``, ``minimum_non_zero_cdd``,
+        ``minimum_non_zero_hdd``, ``minimum_total_cdd``,
+        ``minimum_total_hdd``, ``beta_cdd_maximum_p_value`` and
+        ``beta_hdd_maximum_p_value`` of :any:`eemeter.caltrack_method`.
+        Those not given take their defaults.
+    **kwargs
+        Other arguments are as for :any:`eemeter.caltrack_method`, and are
+        the same for all settings.
+
+    Returns
+    -------
+    model_results : :any:`list` of :any:`eemeter.ModelResults`
+        Results of running the CalTRACK method under each settings, in the
+        order given.
+    """
+    method_settings = []
+    for run_settings in settings:
+        unrecognized = sorted(set(run_settings) - set(_CALTRACK_METHOD_SETTINGS))
+        if len(unrecognized) > 0:
+            raise ValueError(
+                "Unrecognized caltrack_method settings: {}".format(
+                    ", ".join(unrecognized)
+                )
+            )
+        run_settings = dict(_CALTRACK_METHOD_SETTINGS, **run_settings)
+        if run_settings.pop("use_billing_presets"):
+            run_settings.update(
+                minimum_non_zero_cdd=0,
+                minimum_non_zero_hdd=0,
+                minimum_total_cdd=0,
+                minimum_total_hdd=0,
+            )
+        method_settings.append(run_settings)
+
+    data = overwrite_partial_rows_with_nan(data)
+
+    if data.empty:
+        return [_no_data_model_results() for _ in method_settings]
+
+    cooling_balance_points = [
+        _column_balance_point(col) for col in data.columns if col.startswith("cdd")
+    ]
+    heating_balance_points = [
+        _column_balance_point(col) for col in data.columns if col.startswith("hdd")
+    ]
+
+    # fit every candidate model once, with no degree day requirements or
+    # p-value limits, keeping the balance points of each.
+    candidates = []
+    balance_points = []
+    if fit_intercept_only:
+        candidates.extend(get_intercept_only_candidate_models(data, weights_col))
+        balance_points.append((None, None))
+    if fit_hdd_only:
+        candidates.extend(get_hdd_only_candidate_models(data, 0, 0, 1, weights_col))
+        balance_points.extend((None, bp) for bp in heating_balance_points)
+    if fit_cdd:
+        if fit_cdd_only:
+            candidates.extend(get_cdd_only_candidate_models(data, 0, 0, 1, weights_col))
+            balance_points.extend((bp, None) for bp in cooling_balance_points)
+        if fit_cdd_hdd:
+            candidates.extend(
+                get_cdd_hdd_candidate_models(data, 0, 0, 0, 0, 1, 1, weights_col)
+            )
+            balance_points.extend(
+                (cooling_balance_point, heating_balance_point)
+                for cooling_balance_point in cooling_balance_points
+                for heating_balance_point in heating_balance_points
+                if heating_balance_point <= cooling_balance_point
+            )
+
+    degree_days = {}
+    for column in data.columns:
+        if column.startswith("cdd") or column.startswith("hdd"):
+            degree_days[column] = (data[column].sum(), int((data[column] > 0).sum()))
+
+    def _requalified_candidate_model(candidate_model, balance_points, settings):
+        model_type = candidate_model.model_type
+        if model_type == "intercept_only":
+            return candidate_model
+
+        degree_day_warnings = []
+        for degree_day_type, balance_point in zip(["cdd", "hdd"], balance_points):
+            if balance_point is None:
+                continue
+            total, n_non_zero = degree_days["%s_%s" % (degree_day_type, balance_point)]
+            degree_day_warnings.extend(
+                _get_total_degree_day_too_low_warning(
+                    model_type,
+                    balance_point,
+                    degree_day_type,
+                    total,
+                    settings["minimum_total_%s" % degree_day_type],
+                )
+            )
+            degree_day_warnings.extend(
+                _get_too_few_non_zero_degree_day_warning(
+                    model_type,
+                    balance_point,
+                    degree_day_type,
+                    n_non_zero,
+                    settings["minimum_non_zero_%s" % degree_day_type],
+                )
+            )
+        if len(degree_day_warnings) > 0:
+            return _candidate_model_factory(
+                model_type,
+                candidate_model.formula,
+                "NOT ATTEMPTED",
+                warnings=degree_day_warnings,
+                use_predict_func=False,
+            )
+
+        if candidate_model.status == "ERROR":
+            return candidate_model
+
+        # p-values are in formula order: intercept, then cdd and/or hdd.
+        p_values = candidate_model.result.pvalues.values
+        if model_type == "cdd_hdd":
+            # as in get_single_cdd_hdd_candidate_model
+            p_value_checks = [
+                ("beta_hdd", p_values[1], settings["beta_cdd_maximum_p_value"]),
+                ("beta_hdd", p_values[2], settings["beta_hdd_maximum_p_value"]),
+            ]
+        else:
+            parameter = "beta_cdd" if model_type == "cdd_only" else "beta_hdd"
+            p_value_checks = [
+                (parameter, p_values[1], settings[parameter + "_maximum_p_value"])
+            ]
+        return _get_fitted_candidate_model(
+            model_type,
+            candidate_model.formula,
+            dict(candidate_model.model_params),
+            p_value_checks,
+            candidate_model.r_squared_adj,
+            model=candidate_model.model,
+            result=candidate_model.result,
+        )
+
+    # the same model is often selected under several settings.
+    metrics = {}
+
+    def _get_cached_model_metrics(data, candidate_model):
+        key = (candidate_model.model_type, candidate_model.formula)
+        if key not in metrics:
+            metrics[key] = _get_model_metrics(data, candidate_model)
+        return metrics[key]
+
+    model_results = []
+    for run_settings in method_settings:
+        requalified_candidates = [
+            _requalified_candidate_model(candidate, bps, run_settings)
+            for candidate, bps in zip(candidates, balance_points)
+        ]
+        model_results.append(
+            _caltrack_method_model_results(
+                data,
+                requalified_candidates,
+                dict(run_settings, fit_cdd=fit_cdd),
+                metrics_func=_get_cached_model_metrics,
+            )
+        )
+
+    timings = current_timings()
+    if timings is not None:
+        for model_result in model_results:
+            model_result.timings = timings.copy()
+
+    return model_results
 
 
 def caltrack_sufficiency_criteria(
@@ -1624,6 +2985,401 @@ def caltrack_sufficiency_criteria(
     )
 
 
+def caltrack_sufficiency_and_data(
+    meter_data,
+    temperature_data,
+    requested_start,
+    requested_end,
+    heating_balance_points=None,
+    cooling_balance_points=None,
+    num_days=365,
+    min_fraction_daily_coverage=0.9,
+    min_fraction_hourly_temperature_coverage_per_period=0.9,
+    **kwargs
+):
+    """ Check CalTRACK data sufficiency and create the dataset to fit models
+    with from a single temperature feature computation.
+
+    Equivalent to calling :any:`eemeter.caltrack_sufficiency_criteria` on
+    the output of :any:`eemeter.merge_temperature_data` with
+    ``data_quality=True`` and ``temperature_mean=False``, and calling
+    :any:`eemeter.merge_temperature_data` again with balance points for
+    fitting, but temperature data is only matched and aggregated once.
+
+    Parameters
+    ----------
+    meter_data : :any:`pandas.DataFrame`
+        DataFrame with :any:`pandas.DatetimeIndex` and a column with the name
+        ``value``.
+    temperature_data : :any:`pandas.Series`
+        Series with :any:`pandas.DatetimeIndex` with hourly (``'H'``) frequency
+        and a set of temperature values.
+    requested_start : :any:`datetime.datetime`, timezone aware (or :any:`None`)
+        See :any:`eemeter.caltrack_sufficiency_criteria`.
+    requested_end : :any:`datetime.datetime`, timezone aware (or :any:`None`)
+        See :any:`eemeter.caltrack_sufficiency_criteria`.
+    heating_balance_points : :any:`list` of :any:`int` or :any:`float`, optional
+        List of heating balance points for which to create heating degree days.
+    cooling_balance_points : :any:`list` of :any:`int` or :any:`float`, optional
+        List of cooling balance points for which to create cooling degree days.
+    num_days : :any:`int`, optional
+        See :any:`eemeter.caltrack_sufficiency_criteria`.
+    min_fraction_daily_coverage : :any:`float`, optional
+        See :any:`eemeter.caltrack_sufficiency_criteria`.
+    min_fraction_hourly_temperature_coverage_per_period : :any:`float`, optional
+        See :any:`eemeter.caltrack_sufficiency_criteria`.
+    **kwargs
+        Other keyword arguments for :any:`eemeter.merge_temperature_data`,
+        e.g., ``temperature_mean`` or ``degree_day_method``.
+
+    Returns
+    -------
+    data_sufficiency, data : :any:`eemeter.DataSufficiency`, :any:`pandas.DataFrame`
+        The sufficiency status and warnings for this data and a dataset
+        ready for :any:`eemeter.caltrack_method`.
+    """
+    data = merge_temperature_data(
+        meter_data,
+        temperature_data,
+        heating_balance_points=heating_balance_points,
+        cooling_balance_points=cooling_balance_points,
+        data_quality=True,
+        keep_partial_nan_rows=True,
+        **kwargs
+    )
+
+    data_quality_columns = ["temperature_not_null", "temperature_null"]
+    data_quality = overwrite_partial_rows_with_nan(
+        data[["meter_value"] + data_quality_columns]
+    )
+    data_sufficiency = caltrack_sufficiency_criteria(
+        data_quality,
+        requested_start,
+        requested_end,
+        num_days=num_days,
+        min_fraction_daily_coverage=min_fraction_daily_coverage,
+        min_fraction_hourly_temperature_coverage_per_period=min_fraction_hourly_temperature_coverage_per_period,
+    )
+
+    data = data.drop(data_quality_columns, axis=1)
+    data = overwrite_partial_rows_with_nan(data, inplace=True)
+    # rows overwritten with nan may have upcast compact columns.
+    data = _astype_temperature_features(
+        data, kwargs.get("dtype"), exclude=["meter_value"]
+    )
+    return data_sufficiency, data
+
+
+_NS_PER_DAY = 24 * 60 * 60 * 10 ** 9
+
+_SUFFICIENCY_WARNING_DESCRIPTIONS = [
+    (
+        "extra_data_after_requested_end_date",
+        "Extra data found after requested end date.",
+    ),
+    (
+        "extra_data_before_requested_start_date",
+        "Extra data found before requested start date.",
+    ),
+    (
+        "negative_meter_values",
+        "Found negative meter data values, which may indicate presence"
+        " of solar net metering.",
+    ),
+    (
+        "incorrect_number_of_total_days",
+        "Total data span does not match the required value.",
+    ),
+    (
+        "too_many_days_with_missing_data",
+        "Too many days in data have missing meter data or temperature data.",
+    ),
+    (
+        "too_many_days_with_missing_meter_data",
+        "Too many days in data have missing meter data.",
+    ),
+    (
+        "too_many_days_with_missing_temperature_data",
+        "Too many days in data have missing temperature data.",
+    ),
+]
+
+
+def _utc_times_by_meter(times, meter_ids):
+    # a scalar, None, or a series indexed by meter ID.
+    if not isinstance(times, pd.Series):
+        times = pd.Series([times] * len(meter_ids), index=meter_ids)
+    times = pd.to_datetime(times.reindex(meter_ids), utc=True)
+    return pd.DatetimeIndex(times)
+
+
+def caltrack_sufficiency_criteria_frame(
+    data_quality,
+    requested_start,
+    requested_end,
+    meter_id_column="meter_id",
+    start_column="start",
+    num_days=365,
+    min_fraction_daily_coverage=0.9,
+    min_fraction_hourly_temperature_coverage_per_period=0.9,
+):
+    """ Check CalTRACK data sufficiency for many meters at once.
+
+    All meters are handled together with grouped, vectorized operations, so
+    this is much faster than calling
+    :any:`eemeter.caltrack_sufficiency_criteria` per meter for large
+    portfolios, e.g., to screen out insufficient meters before fitting.
+    Results are summarized in a table with a boolean column for each
+    warning. Use :any:`eemeter.caltrack_sufficiency_criteria_from_frame` to
+    get the full :any:`eemeter.DataSufficiency` for any one meter.
+
+    Parameters
+    ----------
+    data_quality : :any:`pandas.DataFrame`
+        Long-format data with one row per meter and period, containing meter
+        ID and period start columns (or index levels) and the columns
+        required by :any:`eemeter.caltrack_sufficiency_criteria`.
+    requested_start : :any:`datetime.datetime` or :any:`pandas.Series`
+        The desired start of the period, if any, for all meters or as a
+        series indexed by meter ID (with missing values where there is
+        none). See :any:`eemeter.caltrack_sufficiency_criteria`.
+    requested_end : :any:`datetime.datetime` or :any:`pandas.Series`
+        The desired end of the period, if any, for all meters or as a
+        series indexed by meter ID (with missing values where there is
+        none). See :any:`eemeter.caltrack_sufficiency_criteria`.
+    meter_id_column : :any:`str`, optional
+        Name of the column (or index level) containing meter IDs.
+    start_column : :any:`str`, optional
+        Name of the column (or index level) containing timezone-aware period
+        start times.
+    num_days : :any:`int`, optional
+        See :any:`eemeter.caltrack_sufficiency_criteria`.
+    min_fraction_daily_coverage : :any:`float`, optional
+        See :any:`eemeter.caltrack_sufficiency_criteria`.
+    min_fraction_hourly_temperature_coverage_per_period : :any:`float`, optional
+        See :any:`eemeter.caltrack_sufficiency_criteria`.
+
+    Returns
+    -------
+    sufficiency : :any:`pandas.DataFrame`
+        A dataframe indexed by meter ID with the ``status`` (``'PASS'`` or
+        ``'FAIL'``) of each meter, the day counts and dates used in the
+        check, a boolean column for each possible warning (e.g.,
+        ``negative_meter_values``), and the settings used.
+    """
+
+    def _values(column):
+        if column in data_quality.columns:
+            return data_quality[column].values
+        return data_quality.index.get_level_values(column).values
+
+    codes, unique_meter_ids = pd.factorize(_values(meter_id_column), sort=True)
+    n_meters = len(unique_meter_ids)
+    # nanoseconds since epoch (UTC)
+    times = np.asarray(_values(start_column), dtype="datetime64[ns]").view("i8")
+    meter_value = np.asarray(data_quality.meter_value.values, dtype=np.float64)
+    temperature_not_null = np.asarray(
+        data_quality.temperature_not_null.values, dtype=np.float64
+    )
+    temperature_null = np.asarray(
+        data_quality.temperature_null.values, dtype=np.float64
+    )
+
+    # sort rows by meter, then by time.
+    rows = np.flatnonzero(codes >= 0)
+    rows = rows[np.lexsort((times[rows], codes[rows]))]
+    codes, times = codes[rows], times[rows]
+    meter_value = meter_value[rows]
+    temperature_not_null = temperature_not_null[rows]
+    temperature_null = temperature_null[rows]
+
+    def _sums(values):
+        return np.bincount(codes, weights=values, minlength=n_meters)
+
+    n_rows = np.bincount(codes, minlength=n_meters)
+    last_rows = np.cumsum(n_rows) - 1
+    first_rows = last_rows - n_rows + 1
+    data_start = times[first_rows]
+    data_end = times[last_rows]
+    n_days_data = (data_end - data_start) // _NS_PER_DAY
+
+    requested_start = _utc_times_by_meter(requested_start, unique_meter_ids)
+    requested_end = _utc_times_by_meter(requested_end, unique_meter_ids)
+    n_days_start_gap = np.where(
+        requested_start.isnull(), 0, (data_start - requested_start.asi8) // _NS_PER_DAY
+    )
+    n_days_end_gap = np.where(
+        requested_end.isnull(), 0, (requested_end.asi8 - data_end) // _NS_PER_DAY
+    )
+
+    # CalTRACK 2.2.4
+    extra_data_after_requested_end_date = n_days_end_gap < 0
+    extra_data_before_requested_start_date = n_days_start_gap < 0
+    n_days_total = (
+        n_days_data + np.maximum(n_days_start_gap, 0) + np.maximum(n_days_end_gap, 0)
+    )
+
+    # CalTRACK 2.3.5
+    with np.errstate(invalid="ignore"):
+        negative_meter_values = meter_value < 0
+    n_negative_meter_values = np.bincount(
+        codes[negative_meter_values], minlength=n_meters
+    )
+
+    # days per period, given on period starts; the last period of each meter
+    # only marks the end of the data.
+    row_day_counts = np.full(len(times), np.nan)
+    row_day_counts[:-1] = (np.diff(times) / 10 ** 9) / (60 * 60 * 24)
+    row_day_counts[last_rows] = np.nan
+    has_day_count = ~np.isnan(row_day_counts)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        valid_meter_value_rows = ~np.isnan(meter_value)
+        valid_temperature_rows = (
+            temperature_not_null / (temperature_not_null + temperature_null)
+        ) > min_fraction_hourly_temperature_coverage_per_period
+    valid_rows = valid_meter_value_rows & valid_temperature_rows
+
+    def _valid_days(valid):
+        return _sums(np.where(valid & has_day_count, row_day_counts, 0)).astype(int)
+
+    n_valid_meter_value_days = _valid_days(valid_meter_value_rows)
+    n_valid_temperature_days = _valid_days(valid_temperature_rows)
+    n_valid_days = _valid_days(valid_rows)
+
+    def _too_few(n_valid):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction_valid = np.where(
+                n_days_total > 0, n_valid / n_days_total.astype(float), 0
+            )
+        return fraction_valid < min_fraction_daily_coverage
+
+    warnings = pd.DataFrame(
+        {
+            "extra_data_after_requested_end_date": extra_data_after_requested_end_date,
+            "extra_data_before_requested_start_date": extra_data_before_requested_start_date,
+            "negative_meter_values": n_negative_meter_values > 0,
+            "incorrect_number_of_total_days": n_days_total != num_days,
+            "too_many_days_with_missing_data": _too_few(n_valid_days),
+            "too_many_days_with_missing_meter_data": _too_few(n_valid_meter_value_days),
+            "too_many_days_with_missing_temperature_data": _too_few(
+                n_valid_temperature_days
+            ),
+        },
+        columns=[name for name, _ in _SUFFICIENCY_WARNING_DESCRIPTIONS],
+    )
+
+    sufficiency = pd.DataFrame(
+        {
+            "status": np.where(warnings.values.any(axis=1), "FAIL", "PASS"),
+            "data_start": pd.DatetimeIndex(data_start, tz="UTC"),
+            "data_end": pd.DatetimeIndex(data_end, tz="UTC"),
+            "requested_start": requested_start,
+            "requested_end": requested_end,
+            "n_days_total": n_days_total,
+            "n_valid_days": n_valid_days,
+            "n_valid_meter_value_days": n_valid_meter_value_days,
+            "n_valid_temperature_days": n_valid_temperature_days,
+            "n_negative_meter_values": n_negative_meter_values,
+        },
+        columns=[
+            "status",
+            "data_start",
+            "data_end",
+            "requested_start",
+            "requested_end",
+            "n_days_total",
+            "n_valid_days",
+            "n_valid_meter_value_days",
+            "n_valid_temperature_days",
+            "n_negative_meter_values",
+        ],
+    )
+    sufficiency = pd.concat([sufficiency, warnings], axis=1)
+    sufficiency["num_days"] = num_days
+    sufficiency["min_fraction_daily_coverage"] = min_fraction_daily_coverage
+    sufficiency[
+        "min_fraction_hourly_temperature_coverage_per_period"
+    ] = min_fraction_hourly_temperature_coverage_per_period
+    sufficiency.index = pd.Index(unique_meter_ids, name=meter_id_column)
+    return sufficiency
+
+
+def caltrack_sufficiency_criteria_from_frame(sufficiency, meter_id):
+    """ Get the :any:`eemeter.DataSufficiency` for one meter from the output
+    of :any:`eemeter.caltrack_sufficiency_criteria_frame`.
+
+    The result is the same as that of
+    :any:`eemeter.caltrack_sufficiency_criteria` for the meter's data and
+    the same settings.
+
+    Parameters
+    ----------
+    sufficiency : :any:`pandas.DataFrame`
+        Output of :any:`eemeter.caltrack_sufficiency_criteria_frame`.
+    meter_id : any
+        The ID of the meter.
+
+    Returns
+    -------
+    data_sufficiency : :any:`eemeter.DataSufficiency`
+        The sufficiency status and warnings for this meter.
+    """
+    row = sufficiency.loc[meter_id]
+    criteria_name = "caltrack_sufficiency_criteria"
+    n_days_total = int(row.n_days_total)
+    warning_data = {
+        "extra_data_after_requested_end_date": {
+            "requested_end": row.requested_end.isoformat(),
+            "data_end": row.data_end.isoformat(),
+        },
+        "extra_data_before_requested_start_date": {
+            "requested_start": row.requested_start.isoformat(),
+            "data_start": row.data_start.isoformat(),
+        },
+        "negative_meter_values": {
+            "n_negative_meter_values": int(row.n_negative_meter_values)
+        },
+        "incorrect_number_of_total_days": {
+            "num_days": int(row.num_days),
+            "n_days_total": n_days_total,
+        },
+        "too_many_days_with_missing_data": {
+            "n_valid_days": int(row.n_valid_days),
+            "n_days_total": n_days_total,
+        },
+        "too_many_days_with_missing_meter_data": {
+            "n_valid_meter_data_days": int(row.n_valid_meter_value_days),
+            "n_days_total": n_days_total,
+        },
+        "too_many_days_with_missing_temperature_data": {
+            "n_valid_temperature_data_days": int(row.n_valid_temperature_days),
+            "n_days_total": n_days_total,
+        },
+    }
+    warnings = [
+        EEMeterWarning(
+            qualified_name="eemeter.{}.{}".format(criteria_name, name),
+            description=description,
+            data=warning_data[name],
+        )
+        for name, description in _SUFFICIENCY_WARNING_DESCRIPTIONS
+        if row[name]
+    ]
+    return DataSufficiency(
+        status=row.status,
+        criteria_name=criteria_name,
+        warnings=warnings,
+        settings={
+            "num_days": int(row.num_days),
+            "min_fraction_daily_coverage": float(row.min_fraction_daily_coverage),
+            "min_fraction_hourly_temperature_coverage_per_period": float(
+                row.min_fraction_hourly_temperature_coverage_per_period
+            ),
+        },
+    )
+
+
 def caltrack_metered_savings(
     baseline_model,
     reporting_meter_data,
@@ -1673,35 +3429,31 @@ def caltrack_metered_savings(
     """
     prediction_index = reporting_meter_data.index
     predicted_baseline_usage = baseline_model.predict(
-        temperature_data, prediction_index, degree_day_method, with_disaggregated=True
+        temperature_data,
+        prediction_index,
+        degree_day_method,
+        with_disaggregated=with_disaggregated,
     )
     # CalTrack 3.5.1
-    counterfactual_usage = predicted_baseline_usage["predicted_usage"].to_frame(
-        "counterfactual_usage"
-    )
-
-    reporting_observed = reporting_meter_data["value"].to_frame("reporting_observed")
-
-    def metered_savings_func(row):
-        return row.counterfactual_usage - row.reporting_observed
+    counterfactual_usage = predicted_baseline_usage["predicted_usage"].values
+    reporting_observed = reporting_meter_data["value"].values
 
-    results = reporting_observed.join(counterfactual_usage).assign(
-        metered_savings=metered_savings_func
-    )
+    columns = [
+        ("reporting_observed", reporting_observed),
+        ("counterfactual_usage", counterfactual_usage),
+        ("metered_savings", counterfactual_usage - reporting_observed),
+    ]
 
     if with_disaggregated:
-        counterfactual_usage_disaggregated = predicted_baseline_usage[
-            ["base_load", "heating_load", "cooling_load"]
-        ].rename(
-            columns={
-                "base_load": "counterfactual_base_load",
-                "heating_load": "counterfactual_heating_load",
-                "cooling_load": "counterfactual_cooling_load",
-            }
-        )
-        results = results.join(counterfactual_usage_disaggregated)
+        for load in ["base_load", "heating_load", "cooling_load"]:
+            columns.append(
+                ("counterfactual_%s" % load, predicted_baseline_usage[load].values)
+            )
 
-    return results.dropna().reindex(results.index)
+    results = pd.DataFrame(
+        dict(columns), index=prediction_index, columns=[c for c, _ in columns]
+    )
+    return overwrite_partial_rows_with_nan(results, inplace=True)
 
 
 def caltrack_modeled_savings(
@@ -1759,71 +3511,49 @@ def caltrack_modeled_savings(
     prediction_index = result_index
 
     predicted_baseline_usage = baseline_model.predict(
-        temperature_data, prediction_index, degree_day_method, with_disaggregated=True
-    )
-    modeled_baseline_usage = predicted_baseline_usage["predicted_usage"].to_frame(
-        "modeled_baseline_usage"
+        temperature_data,
+        prediction_index,
+        degree_day_method,
+        with_disaggregated=with_disaggregated,
     )
-
     predicted_reporting_usage = reporting_model.predict(
-        temperature_data, prediction_index, degree_day_method, with_disaggregated=True
-    )
-    modeled_reporting_usage = predicted_reporting_usage["predicted_usage"].to_frame(
-        "modeled_reporting_usage"
+        temperature_data,
+        prediction_index,
+        degree_day_method,
+        with_disaggregated=with_disaggregated,
     )
+    modeled_baseline_usage = predicted_baseline_usage["predicted_usage"].values
+    modeled_reporting_usage = predicted_reporting_usage["predicted_usage"].values
 
-    def modeled_savings_func(row):
-        return row.modeled_baseline_usage - row.modeled_reporting_usage
-
-    results = modeled_baseline_usage.join(modeled_reporting_usage).assign(
-        modeled_savings=modeled_savings_func
-    )
+    columns = [
+        ("modeled_baseline_usage", modeled_baseline_usage),
+        ("modeled_reporting_usage", modeled_reporting_usage),
+        ("modeled_savings", modeled_baseline_usage - modeled_reporting_usage),
+    ]
 
     if with_disaggregated:
-        modeled_baseline_usage_disaggregated = predicted_baseline_usage[
-            ["base_load", "heating_load", "cooling_load"]
-        ].rename(
-            columns={
-                "base_load": "modeled_baseline_base_load",
-                "heating_load": "modeled_baseline_heating_load",
-                "cooling_load": "modeled_baseline_cooling_load",
-            }
-        )
-
-        modeled_reporting_usage_disaggregated = predicted_reporting_usage[
-            ["base_load", "heating_load", "cooling_load"]
-        ].rename(
-            columns={
-                "base_load": "modeled_reporting_base_load",
-                "heating_load": "modeled_reporting_heating_load",
-                "cooling_load": "modeled_reporting_cooling_load",
-            }
-        )
-
-        def modeled_base_load_savings_func(row):
-            return row.modeled_baseline_base_load - row.modeled_reporting_base_load
-
-        def modeled_heating_load_savings_func(row):
-            return (
-                row.modeled_baseline_heating_load - row.modeled_reporting_heating_load
+        loads = ["base_load", "heating_load", "cooling_load"]
+        for load in loads:
+            columns.append(
+                ("modeled_baseline_%s" % load, predicted_baseline_usage[load].values)
             )
-
-        def modeled_cooling_load_savings_func(row):
-            return (
-                row.modeled_baseline_cooling_load - row.modeled_reporting_cooling_load
+        for load in loads:
+            columns.append(
+                ("modeled_reporting_%s" % load, predicted_reporting_usage[load].values)
             )
-
-        results = (
-            results.join(modeled_baseline_usage_disaggregated)
-            .join(modeled_reporting_usage_disaggregated)
-            .assign(
-                modeled_base_load_savings=modeled_base_load_savings_func,
-                modeled_heating_load_savings=modeled_heating_load_savings_func,
-                modeled_cooling_load_savings=modeled_cooling_load_savings_func,
+        for load in loads:
+            columns.append(
+                (
+                    "modeled_%s_savings" % load,
+                    predicted_baseline_usage[load].values
+                    - predicted_reporting_usage[load].values,
+                )
             )
-        )
 
-    return results.dropna().reindex(results.index)
+    results = pd.DataFrame(
+        dict(columns), index=prediction_index, columns=[c for c, _ in columns]
+    )
+    return overwrite_partial_rows_with_nan(results, inplace=True)
 
 
 def plot_caltrack_candidate(
@@ -1894,9 +3624,9 @@ def plot_caltrack_candidate(
         "2017-01-01T00:00:00Z", periods=len(temps), freq="D"
     )
 
-    temps_hourly = pd.Series(temps, index=prediction_index).resample("H").ffill()
+    temps_daily = pd.Series(temps, index=prediction_index)
 
-    prediction = candidate.predict(temps_hourly, prediction_index, "daily")
+    prediction = candidate.predict(temps_daily, prediction_index, "daily")
 
     plot_kwargs = {"color": color, "alpha": alpha or 0.3}
     plot_kwargs.update(kwargs)
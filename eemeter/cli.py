@@ -1,4 +1,3 @@
-from pkg_resources import resource_stream
 import json
 
 import click
@@ -9,6 +8,7 @@ from eemeter import (
     temperature_data_from_csv,
     merge_temperature_data,
 )
+from eemeter.samples.load import _load_sample_metadata, _open_sample_file
 
 
 @click.group()
@@ -47,16 +47,13 @@ def _get_data(
 ):
 
     if sample is not None:
-        with resource_stream("eemeter.samples", "metadata.json") as f:
-            metadata = json.loads(f.read().decode("utf-8"))
+        metadata = _load_sample_metadata()
         if sample in metadata:
             click.echo("Loading sample: {}".format(sample))
 
-            meter_file = resource_stream(
-                "eemeter.samples", metadata[sample]["meter_data_filename"]
-            )
-            temperature_file = resource_stream(
-                "eemeter.samples", metadata[sample]["temperature_filename"]
+            meter_file = _open_sample_file(metadata[sample]["meter_data_filename"])
+            temperature_file = _open_sample_file(
+                metadata[sample]["temperature_filename"]
             )
         else:
             raise click.ClickException(
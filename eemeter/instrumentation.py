@@ -0,0 +1,210 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+import threading
+import time
+
+__all__ = (
+    "Timings",
+    "current_timings",
+    "record_timings",
+    "register_timing_hook",
+    "unregister_timing_hook",
+    "timed",
+    "timed_function",
+)
+
+
+_clock = getattr(time, "perf_counter", time.time)
+
+# Functions called as ``hook(stage, seconds)`` after every timed stage.
+_hooks = []
+
+# Per-thread stack of active Timings objects (see record_timings).
+_local = threading.local()
+
+
+def _timings_stack():
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = []
+        return _local.stack
+
+
+class Timings(object):
+    """ Wall time and call counts recorded per pipeline stage.
+
+    Stages recorded by eemeter are:
+
+    - ``'compute_temperature_features'``
+    - ``'caltrack_method.intercept_only'``, ``'caltrack_method.hdd_only'``,
+      ``'caltrack_method.cdd_only'``, ``'caltrack_method.cdd_hdd'``: fitting
+      of each family of candidate models.
+    - ``'select_best_candidate'``
+    - ``'ModelMetrics'``
+
+    Attributes
+    ----------
+    stages : :any:`collections.OrderedDict`
+        Mapping of stage name to a ``[total_seconds, count]`` pair.
+    """
+
+    def __init__(self):
+        self.stages = OrderedDict()
+
+    def __repr__(self):
+        return "Timings({})".format(
+            ", ".join(
+                "{}={:.4f}s/{}".format(stage, seconds, count)
+                for stage, (seconds, count) in self.stages.items()
+            )
+        )
+
+    def add(self, stage, seconds, count=1):
+        """ Add wall time (and calls) to the totals for a stage. """
+        totals = self.stages.get(stage)
+        if totals is None:
+            self.stages[stage] = [seconds, count]
+        else:
+            totals[0] += seconds
+            totals[1] += count
+
+    def copy(self):
+        """ Return a copy of these timings. """
+        timings = Timings()
+        timings.merge(self)
+        return timings
+
+    def merge(self, other):
+        """ Add the totals of another :any:`eemeter.Timings` to these ones. """
+        for stage, (seconds, count) in other.stages.items():
+            self.add(stage, seconds, count)
+
+    def json(self):
+        """ Return a JSON-serializable representation of these timings.
+
+        The output of this function can be converted to a serialized string
+        with :any:`json.dumps`.
+        """
+        return {
+            stage: {"seconds": seconds, "count": count}
+            for stage, (seconds, count) in self.stages.items()
+        }
+
+    def flat(self, prefix=None):
+        """ Return timings as a flat dictionary, e.g., for a metrics system.
+
+        Keys are of the form ``'<stage>.seconds'`` and ``'<stage>.count'``,
+        optionally prefixed by ``'<prefix>.'``.
+        """
+        prefix = "" if prefix is None else "{}.".format(prefix)
+        record = OrderedDict()
+        for stage, (seconds, count) in self.stages.items():
+            record["{}{}.seconds".format(prefix, stage)] = seconds
+            record["{}{}.count".format(prefix, stage)] = count
+        return record
+
+
+class _NullTimer(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer(object):
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = _clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = _clock() - self.start
+        for timings in _timings_stack():
+            timings.add(self.stage, seconds)
+        for hook in list(_hooks):
+            hook(self.stage, seconds)
+        return False
+
+
+def timed(stage):
+    """ Context manager that records the wall time of a stage.
+
+    This is a no-op unless timings are being recorded (see
+    :any:`eemeter.record_timings`) or a hook is registered (see
+    :any:`eemeter.register_timing_hook`).
+    """
+    if not _hooks and not getattr(_local, "stack", None):
+        return _NULL_TIMER
+    return _Timer(stage)
+
+
+def timed_function(stage):
+    """ Decorator that records the wall time of each call as a stage. """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def record_timings():
+    """ Record wall time and call counts of eemeter pipeline stages.
+
+    Stages run in this thread within the ``with`` block are recorded
+    in the yielded :any:`eemeter.Timings` object. :any:`eemeter.caltrack_method`
+    also attaches a snapshot of these timings to the returned
+    :any:`eemeter.ModelResults` as ``timings``, so timings for feature
+    computation followed by fitting are available on the results::
+
+        with eemeter.record_timings() as timings:
+            data = eemeter.merge_temperature_data(...)
+            model_results = eemeter.caltrack_method(data)
+        model_results.timings.flat()
+
+    Contexts can be nested; stages are recorded in all active contexts.
+    """
+    timings = Timings()
+    stack = _timings_stack()
+    stack.append(timings)
+    try:
+        yield timings
+    finally:
+        stack.remove(timings)
+
+
+def current_timings():
+    """ Return the innermost :any:`eemeter.Timings` being recorded in this
+    thread, or :any:`None`. """
+    stack = getattr(_local, "stack", None)
+    if not stack:
+        return None
+    return stack[-1]
+
+
+def register_timing_hook(hook):
+    """ Register a function to be called as ``hook(stage, seconds)`` each
+    time a pipeline stage completes, in any thread. """
+    _hooks.append(hook)
+
+
+def unregister_timing_hook(hook):
+    """ Unregister a hook registered with :any:`eemeter.register_timing_hook`. """
+    _hooks.remove(hook)
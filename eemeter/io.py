@@ -80,6 +80,7 @@ def temperature_data_from_csv(
     temp_col="tempF",
     gzipped=False,
     freq=None,
+    dtype=None,
     **kwargs
 ):
     """ Load temperature data from a CSV file.
@@ -105,13 +106,16 @@ def temperature_data_from_csv(
         Whether file is gzipped.
     freq : :any:`str`, optional
         If given, apply frequency to data using :any:`pandas.Series.resample`.
+    dtype : :any:`str` or :any:`numpy.dtype`, optional
+        Floating point type of temperature values, e.g., ``'float32'``.
+        Defaults to ``float64``.
     **kwargs
         Extra keyword arguments to pass to :any:`pandas.read_csv`, such as
         ``sep='|'``.
     """
     read_csv_kwargs = {
         "usecols": [date_col, temp_col],
-        "dtype": {temp_col: np.float64},
+        "dtype": {temp_col: np.float64 if dtype is None else dtype},
         "parse_dates": [date_col],
         "index_col": date_col,
     }
@@ -130,6 +134,8 @@ def temperature_data_from_csv(
     if freq == "hourly":
         df = df.resample("H").sum()
 
+    if dtype is not None:
+        return df[temp_col].astype(dtype, copy=False)
     return df[temp_col]
 
 
@@ -164,7 +170,7 @@ def meter_data_from_json(data, orient="list"):
         raise ValueError("orientation not recognized.")
 
 
-def temperature_data_from_json(data, orient="list"):
+def temperature_data_from_json(data, orient="list", dtype=None):
     """ Load temperature data from json. (Must be given in degrees
     Fahrenheit).
 
@@ -180,6 +186,8 @@ def temperature_data_from_json(data, orient="list"):
     ----------
     data : :any:`list`
         List elements are each a rows of data.
+    dtype : :any:`str` or :any:`numpy.dtype`, optional
+        If given, the type of temperature values, e.g., ``'float32'``.
 
     Returns
     -------
@@ -190,6 +198,8 @@ def temperature_data_from_json(data, orient="list"):
     if orient == "list":
         df = pd.DataFrame(data, columns=["dt", "tempF"])
         series = df.tempF
+        if dtype is not None:
+            series = series.astype(dtype)
         series.index = pd.DatetimeIndex(df.dt).tz_localize("UTC")
         return series
     else:
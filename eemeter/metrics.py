@@ -1,7 +1,16 @@
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
 
-__all__ = ("ModelMetrics",)
+from .instrumentation import timed_function
+
+__all__ = (
+    "ModelMetrics",
+    "MetricsAccumulator",
+    "SavingsAccumulator",
+    "compute_metrics_frame",
+)
 
 
 def _compute_r_squared(combined):
@@ -88,6 +97,208 @@ def _json_safe_float(number):
     return float(number)
 
 
+def _align_inputs(observed_input, predicted_input):
+    """ Drop null values from observed and predicted series and return their
+    values as float64 arrays, paired up by index (an inner join). Also returns
+    the number of non-null values in each input. """
+    observed_values = np.asarray(observed_input.values, dtype=np.float64)
+    predicted_values = np.asarray(predicted_input.values, dtype=np.float64)
+    observed_mask = ~np.isnan(observed_values)
+    predicted_mask = ~np.isnan(predicted_values)
+    observed_length = int(observed_mask.sum())
+    predicted_length = int(predicted_mask.sum())
+
+    # usual case: identical indexes, so no join is needed.
+    if observed_input.index.is_unique and observed_input.index.equals(
+        predicted_input.index
+    ):
+        both = observed_mask & predicted_mask
+        return (
+            observed_values[both],
+            predicted_values[both],
+            observed_length,
+            predicted_length,
+        )
+
+    combined = pd.DataFrame(
+        {"observed": observed_values[observed_mask]},
+        index=observed_input.index[observed_mask],
+    ).merge(
+        pd.DataFrame(
+            {"predicted": predicted_values[predicted_mask]},
+            index=predicted_input.index[predicted_mask],
+        ),
+        left_index=True,
+        right_index=True,
+    )
+    return (
+        combined["observed"].values,
+        combined["predicted"].values,
+        observed_length,
+        predicted_length,
+    )
+
+
+def _zero_out_fperr(value):
+    # as in pandas, moments within floating point error of zero are zero.
+    return np.where(np.abs(value) < 1e-14, 0.0, value)
+
+
+def _skew_from_moments(count, m2, m3):
+    """ Bias-corrected sample skewness, as in :any:`pandas.Series.skew`, from
+    sums of squared and cubed deviations from the mean. """
+    count = np.asarray(count, dtype=np.float64)
+    m2 = _zero_out_fperr(m2)
+    m3 = _zero_out_fperr(m3)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        skew = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+    skew = np.where(m2 == 0, 0.0, skew)
+    return np.where(count < 3, np.nan, skew)[()]
+
+
+def _kurtosis_from_moments(count, m2, m4):
+    """ Bias-corrected sample excess kurtosis, as in
+    :any:`pandas.Series.kurtosis`, from sums of squared and fourth-power
+    deviations from the mean. """
+    count = np.asarray(count, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+        numer = _zero_out_fperr(count * (count + 1) * (count - 1) * m4)
+        denom = _zero_out_fperr((count - 2) * (count - 3) * m2 ** 2)
+        kurtosis = numer / denom - adj
+    kurtosis = np.where(denom == 0, 0.0, kurtosis)
+    return np.where(count < 4, np.nan, kurtosis)[()]
+
+
+def _pearson_from_sums(sxy, sxx, syy):
+    """ Pearson correlation from sums of products of deviations from the
+    mean. Undefined (``numpy.nan``) if either variance is zero. """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        divisor = np.sqrt(sxx * syy)
+        return np.where(divisor != 0, sxy / divisor, np.nan)[()]
+
+
+class _Moments(object):
+    """ Count, means, and sums of powers (up to the fourth) and cross products
+    of deviations from the means of paired values ``x`` and ``y``. Moments of
+    separate sets of values can be merged (Chan et al., 1979; Pebay, 2008).
+    Means and sums of powers are stored as ``[x, y]`` arrays. """
+
+    def __init__(self):
+        self.n = 0
+        self.mean = np.zeros(2)
+        self.m2 = np.zeros(2)
+        self.m3 = np.zeros(2)
+        self.m4 = np.zeros(2)
+        self.cross = 0.0
+
+    @classmethod
+    def from_arrays(cls, x, y, means=None):
+        moments = cls()
+        moments.n = n = len(x)
+        if n == 0:
+            return moments
+        if means is None:
+            means = (x.sum() / n, y.sum() / n)
+        dx = x - means[0]
+        dy = y - means[1]
+        dx2 = dx ** 2
+        dy2 = dy ** 2
+        moments.mean = np.array(means)
+        moments.m2 = np.array([dx2.sum(), dy2.sum()])
+        moments.m3 = np.array([np.dot(dx2, dx), np.dot(dy2, dy)])
+        moments.m4 = np.array([np.dot(dx2, dx2), np.dot(dy2, dy2)])
+        moments.cross = np.dot(dx, dy)
+        return moments
+
+    def merge(self, other):
+        """ Add the moments of another set of values to these ones. """
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n = other.n
+            self.mean, self.m2, self.m3, self.m4 = (
+                other.mean.copy(),
+                other.m2.copy(),
+                other.m3.copy(),
+                other.m4.copy(),
+            )
+            self.cross = other.cross
+            return
+
+        n_a, n_b = float(self.n), float(other.n)
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        m2_a, m2_b, m3_a, m3_b = self.m2, other.m2, self.m3, other.m3
+
+        self.m4 = (
+            self.m4
+            + other.m4
+            + delta ** 4 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / n ** 3
+            + 6 * delta ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a) / n ** 2
+            + 4 * delta * (n_a * m3_b - n_b * m3_a) / n
+        )
+        self.m3 = (
+            m3_a
+            + m3_b
+            + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+            + 3 * delta * (n_a * m2_b - n_b * m2_a) / n
+        )
+        self.m2 = m2_a + m2_b + delta ** 2 * n_a * n_b / n
+        self.cross = self.cross + other.cross + delta[0] * delta[1] * n_a * n_b / n
+        self.mean = self.mean + delta * n_b / n
+        self.n = self.n + other.n
+
+    def correlation(self):
+        if self.n == 0:
+            return np.nan
+        return _pearson_from_sums(self.cross, self.m2[0], self.m2[1])
+
+
+def _grouped_autocorr(values, codes, n_groups, lag):
+    """ Pearson correlation of ``values`` with itself shifted by ``lag``, as
+    in :any:`pandas.Series.autocorr`, for each group of ``values`` (sorted by
+    group code). """
+    same_group = codes[lag:] == codes[:-lag]
+    x, y = values[lag:][same_group], values[:-lag][same_group]
+    codes = codes[lag:][same_group]
+    n = np.bincount(codes, minlength=n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dx = x - (np.bincount(codes, weights=x, minlength=n_groups) / n)[codes]
+        dy = y - (np.bincount(codes, weights=y, minlength=n_groups) / n)[codes]
+        autocorr = _pearson_from_sums(
+            np.bincount(codes, weights=dx * dy, minlength=n_groups),
+            np.bincount(codes, weights=dx * dx, minlength=n_groups),
+            np.bincount(codes, weights=dy * dy, minlength=n_groups),
+        )
+    return np.where(n > 0, autocorr, np.nan)
+
+
+_METRICS_COLUMNS = [
+    "observed_length",
+    "predicted_length",
+    "merged_length",
+    "observed_mean",
+    "predicted_mean",
+    "observed_skew",
+    "predicted_skew",
+    "observed_kurtosis",
+    "predicted_kurtosis",
+    "observed_cvstd",
+    "predicted_cvstd",
+    "r_squared",
+    "r_squared_adj",
+    "cvrmse",
+    "cvrmse_adj",
+    "mape",
+    "mape_no_zeros",
+    "num_meter_zeros",
+    "nmae",
+    "nmbe",
+    "autocorr_resid",
+]
+
+
 class ModelMetrics(object):
     """ Contains measures of model fit and summary statistics on the input series.
 
@@ -166,6 +377,7 @@ class ModelMetrics(object):
         using a number of lags equal to autocorr_lags.
     """
 
+    @timed_function("ModelMetrics")
     def __init__(
         self, observed_input, predicted_input, num_parameters=1, autocorr_lags=1
     ):
@@ -174,67 +386,90 @@ class ModelMetrics(object):
         if autocorr_lags <= 0:
             raise ValueError("autocorr_lags must be greater than zero")
 
-        observed = observed_input.to_frame().dropna()
-        predicted = predicted_input.to_frame().dropna()
-        observed.columns = ["observed"]
-        predicted.columns = ["predicted"]
-
-        self.observed_length = observed.shape[0]
-        self.predicted_length = predicted.shape[0]
+        observed, predicted, observed_length, predicted_length = _align_inputs(
+            observed_input, predicted_input
+        )
 
-        if self.observed_length != self.predicted_length:
+        if observed_length != predicted_length:
             raise ValueError("Input series are of different lengths")
 
-        # Do an inner join on the two input series to make sure that we only
-        # use observations with the same time stamps.
-        combined = observed.merge(predicted, left_index=True, right_index=True)
+        accumulator = MetricsAccumulator(autocorr_lags=autocorr_lags)
+        accumulator._update_arrays(
+            observed, predicted, observed_length, predicted_length
+        )
+        self._compute(accumulator, num_parameters)
 
-        self.merged_length = combined.shape[0]
+    @classmethod
+    def _from_accumulator(cls, accumulator, num_parameters):
+        model_metrics = cls.__new__(cls)
+        model_metrics._compute(accumulator, num_parameters)
+        return model_metrics
 
-        # Calculate residuals because these are an input for most of the metrics.
-        combined["residuals"] = combined.predicted - combined.observed
+    def _compute(self, accumulator, num_parameters):
+        self.observed_length = accumulator.observed_length
+        self.predicted_length = accumulator.predicted_length
 
-        self.num_parameters = num_parameters
-        self.autocorr_lags = autocorr_lags
+        moments = accumulator.moments
+        n = self.merged_length = moments.n
 
-        self.observed_mean = combined["observed"].mean()
-        self.predicted_mean = combined["predicted"].mean()
+        self.num_parameters = num_parameters
+        self.autocorr_lags = accumulator.autocorr_lags
 
-        self.observed_skew = combined["observed"].skew()
-        self.predicted_skew = combined["predicted"].skew()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.observed_mean = accumulator.observed_sum / n
+            self.predicted_mean = accumulator.predicted_sum / n
 
-        self.observed_kurtosis = combined["observed"].kurtosis()
-        self.predicted_kurtosis = combined["predicted"].kurtosis()
+            observed_m2, predicted_m2 = moments.m2
+            self.observed_skew = _skew_from_moments(n, observed_m2, moments.m3[0])
+            self.predicted_skew = _skew_from_moments(n, predicted_m2, moments.m3[1])
 
-        self.observed_cvstd = combined["observed"].std() / self.observed_mean
-        self.predicted_cvstd = combined["predicted"].std() / self.predicted_mean
+            self.observed_kurtosis = _kurtosis_from_moments(
+                n, observed_m2, moments.m4[0]
+            )
+            self.predicted_kurtosis = _kurtosis_from_moments(
+                n, predicted_m2, moments.m4[1]
+            )
 
-        self.r_squared = _compute_r_squared(combined)
-        self.r_squared_adj = _compute_r_squared_adj(
-            self.r_squared, self.merged_length, self.num_parameters
-        )
+            self.observed_cvstd = (
+                np.sqrt(observed_m2 / (n - 1)) / self.observed_mean if n > 1 else np.nan
+            )
+            self.predicted_cvstd = (
+                np.sqrt(predicted_m2 / (n - 1)) / self.predicted_mean
+                if n > 1
+                else np.nan
+            )
 
-        self.cvrmse = _compute_cvrmse(combined)
-        self.cvrmse_adj = _compute_cvrmse_adj(
-            combined, self.merged_length, self.num_parameters
-        )
+            self.r_squared = moments.correlation() ** 2
+            self.r_squared_adj = _compute_r_squared_adj(
+                self.r_squared, self.merged_length, self.num_parameters
+            )
 
-        # Create a new DataFrame with all rows removed where observed is
-        # zero, so we can calculate a version of MAPE with the zeros excluded.
-        # (Without the zeros excluded, MAPE becomes infinite when one observed
-        # value is zero.)
-        no_observed_zeros = combined[combined["observed"] > 0]
+            self.cvrmse = (
+                np.sqrt(accumulator.squared_residuals_sum / n) / self.observed_mean
+            )
+            self.cvrmse_adj = (
+                np.sqrt(accumulator.squared_residuals_sum / (n - self.num_parameters))
+                / self.observed_mean
+            )
 
-        self.mape = _compute_mape(combined)
-        self.mape_no_zeros = _compute_mape(no_observed_zeros)
+            # MAPE ignores periods where it is undefined (0 / 0), but becomes
+            # infinite when any other observed value is zero, so we also
+            # calculate a version with periods where observed is not greater
+            # than zero excluded.
+            self.mape = (
+                accumulator.percent_errors_sum / accumulator.percent_errors_count
+            )
+            self.mape_no_zeros = (
+                accumulator.positive_percent_errors_sum / accumulator.num_positive
+            )
 
-        self.num_meter_zeros = (self.merged_length) - no_observed_zeros.shape[0]
+            self.num_meter_zeros = self.merged_length - accumulator.num_positive
 
-        self.nmae = _compute_nmae(combined)
+            self.nmae = accumulator.abs_residuals_sum / accumulator.observed_sum
 
-        self.nmbe = _compute_nmbe(combined)
+            self.nmbe = accumulator.residuals_sum / accumulator.observed_sum
 
-        self.autocorr_resid = _compute_autocorr_resid(combined, autocorr_lags)
+        self.autocorr_resid = accumulator.autocorr_moments.correlation()
 
     def __repr__(self):
         return (
@@ -279,3 +514,389 @@ class ModelMetrics(object):
             "nmbe": _json_safe_float(self.nmbe),
             "autocorr_resid": _json_safe_float(self.autocorr_resid),
         }
+
+
+def compute_metrics_frame(
+    data,
+    meter_id_column="meter_id",
+    observed_column="observed",
+    predicted_column="predicted",
+    num_parameters=1,
+    autocorr_lags=1,
+):
+    """ Compute the statistics of :any:`eemeter.ModelMetrics` for many meters
+    at once.
+
+    All meters are handled together with grouped, vectorized operations, so
+    this is much faster than creating a :any:`eemeter.ModelMetrics` object
+    per meter for large portfolios. Values match those of
+    :any:`eemeter.ModelMetrics` up to floating point error, with one
+    difference: rather than raising an error if observed and predicted
+    values have a different number of nulls, rows where either is null are
+    dropped.
+
+    Parameters
+    ----------
+    data : :any:`pandas.DataFrame`
+        Long-format data with one row per meter and time period, containing
+        meter ID, observed, and predicted columns. Rows for each meter should
+        be in time order, as the autocorrelation of residuals is measured
+        between consecutive rows.
+    meter_id_column : :any:`str`, optional
+        Name of the column (or index level) containing meter IDs.
+    observed_column : :any:`str`, optional
+        Name of the column containing observed values.
+    predicted_column : :any:`str`, optional
+        Name of the column containing predicted values.
+    num_parameters : :any:`int` or :any:`pandas.Series`, optional
+        The number of parameters (excluding the intercept) used in the
+        regression from which the predictions were derived, either for all
+        meters or as a series indexed by meter ID.
+    autocorr_lags : :any:`int`, optional
+        The number of lags to use when calculating the autocorrelation of the
+        residuals.
+
+    Returns
+    -------
+    metrics : :any:`pandas.DataFrame`
+        A dataframe indexed by meter ID, with a column for each of the keys of
+        :any:`eemeter.ModelMetrics.json`.
+    """
+    if autocorr_lags <= 0:
+        raise ValueError("autocorr_lags must be greater than zero")
+
+    if meter_id_column in data.columns:
+        meter_ids = data[meter_id_column].values
+    else:
+        meter_ids = data.index.get_level_values(meter_id_column).values
+
+    codes, unique_meter_ids = pd.factorize(meter_ids, sort=True)
+    n_meters = len(unique_meter_ids)
+    observed = np.asarray(data[observed_column].values, dtype=np.float64)
+    predicted = np.asarray(data[predicted_column].values, dtype=np.float64)
+
+    if isinstance(num_parameters, pd.Series):
+        num_parameters = num_parameters.reindex(unique_meter_ids).values
+    if np.any(np.asarray(num_parameters) < 0):
+        raise ValueError("num_parameters must be greater than or equal to zero")
+
+    observed_length = np.bincount(codes[~np.isnan(observed)], minlength=n_meters)
+    predicted_length = np.bincount(codes[~np.isnan(predicted)], minlength=n_meters)
+
+    # keep rows with both values, grouped by meter but otherwise in order.
+    rows = np.flatnonzero(~np.isnan(observed) & ~np.isnan(predicted))
+    rows = rows[np.argsort(codes[rows], kind="mergesort")]
+    codes, observed, predicted = codes[rows], observed[rows], predicted[rows]
+
+    def _counts(mask):
+        return np.bincount(codes[mask], minlength=n_meters)
+
+    def _sums(values):
+        return np.bincount(codes, weights=values, minlength=n_meters)
+
+    n = np.bincount(codes, minlength=n_meters)
+    residuals = predicted - observed
+    abs_residuals = np.abs(residuals)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # first pass: sums
+        observed_sum = _sums(observed)
+        observed_mean = observed_sum / n
+        predicted_mean = _sums(predicted) / n
+        residuals_sum = _sums(residuals)
+        squared_residuals_sum = _sums(residuals ** 2)
+
+        # second pass: central moments
+        observed_dev = observed - observed_mean[codes]
+        predicted_dev = predicted - predicted_mean[codes]
+        observed_dev2 = observed_dev ** 2
+        predicted_dev2 = predicted_dev ** 2
+        observed_m2 = _sums(observed_dev2)
+        predicted_m2 = _sums(predicted_dev2)
+
+        r_squared = (
+            _pearson_from_sums(
+                _sums(observed_dev * predicted_dev), observed_m2, predicted_m2
+            )
+            ** 2
+        )
+
+        percent_errors = abs_residuals / np.abs(observed)
+        percent_errors_not_null = ~np.isnan(percent_errors)
+        observed_positive = observed > 0
+        n_observed_positive = _counts(observed_positive)
+
+        metrics = pd.DataFrame(
+            {
+                "observed_length": observed_length,
+                "predicted_length": predicted_length,
+                "merged_length": n,
+                "observed_mean": observed_mean,
+                "predicted_mean": predicted_mean,
+                "observed_skew": _skew_from_moments(
+                    n, observed_m2, _sums(observed_dev2 * observed_dev)
+                ),
+                "predicted_skew": _skew_from_moments(
+                    n, predicted_m2, _sums(predicted_dev2 * predicted_dev)
+                ),
+                "observed_kurtosis": _kurtosis_from_moments(
+                    n, observed_m2, _sums(observed_dev2 ** 2)
+                ),
+                "predicted_kurtosis": _kurtosis_from_moments(
+                    n, predicted_m2, _sums(predicted_dev2 ** 2)
+                ),
+                "observed_cvstd": np.where(
+                    n > 1, np.sqrt(observed_m2 / (n - 1)) / observed_mean, np.nan
+                ),
+                "predicted_cvstd": np.where(
+                    n > 1, np.sqrt(predicted_m2 / (n - 1)) / predicted_mean, np.nan
+                ),
+                "r_squared": r_squared,
+                "r_squared_adj": _compute_r_squared_adj(r_squared, n, num_parameters),
+                "cvrmse": np.sqrt(squared_residuals_sum / n) / observed_mean,
+                "cvrmse_adj": np.sqrt(squared_residuals_sum / (n - num_parameters))
+                / observed_mean,
+                "mape": _sums(np.where(percent_errors_not_null, percent_errors, 0))
+                / _counts(percent_errors_not_null),
+                "mape_no_zeros": _sums(np.where(observed_positive, percent_errors, 0))
+                / n_observed_positive,
+                "num_meter_zeros": n - n_observed_positive,
+                "nmae": _sums(abs_residuals) / observed_sum,
+                "nmbe": residuals_sum / observed_sum,
+                "autocorr_resid": _grouped_autocorr(
+                    residuals, codes, n_meters, autocorr_lags
+                ),
+            },
+            columns=_METRICS_COLUMNS,
+            index=pd.Index(unique_meter_ids, name=meter_id_column),
+        )
+
+    return metrics
+
+
+class MetricsAccumulator(object):
+    """ Running totals from which :any:`eemeter.ModelMetrics` can be computed
+    without holding complete observed and predicted series in memory.
+
+    Observed and predicted values are added chunk by chunk with
+    :any:`eemeter.MetricsAccumulator.update`, and accumulators for separate
+    chunks of data (e.g., computed by separate workers) can be combined with
+    :any:`eemeter.MetricsAccumulator.merge`. Moments are combined with the
+    pairwise updates of Chan et al. (1979) and Pebay (2008), so results
+    match those of :any:`eemeter.ModelMetrics` for the complete series up to
+    floating point error.
+
+    Chunks must be added (and accumulators merged) in time order, as the
+    autocorrelation of residuals depends on the order of values. All other
+    statistics are independent of order.
+
+    Parameters
+    ----------
+    autocorr_lags : :any:`int`, optional
+        The number of lags to use when calculating the autocorrelation of the
+        residuals
+
+    Attributes
+    ----------
+    observed_length : :any:`int`
+        The number of non-null observed values.
+    predicted_length : :any:`int`
+        The number of non-null predicted values.
+    """
+
+    def __init__(self, autocorr_lags=1):
+        if autocorr_lags <= 0:
+            raise ValueError("autocorr_lags must be greater than zero")
+        self.autocorr_lags = autocorr_lags
+        self.observed_length = 0
+        self.predicted_length = 0
+
+        # moments of observed (x) and predicted (y) values.
+        self.moments = _Moments()
+        self.observed_sum = np.float64(0.0)
+        self.predicted_sum = np.float64(0.0)
+        self.residuals_sum = np.float64(0.0)
+        self.squared_residuals_sum = np.float64(0.0)
+        self.abs_residuals_sum = np.float64(0.0)
+        self.percent_errors_sum = np.float64(0.0)
+        self.percent_errors_count = 0
+        self.positive_percent_errors_sum = np.float64(0.0)
+        self.num_positive = 0
+
+        # moments of residuals (x) and lagged residuals (y), and the first and
+        # last few residuals, for pairing up with residuals in adjacent chunks.
+        self.autocorr_moments = _Moments()
+        self.head = np.empty(0)
+        self.tail = np.empty(0)
+
+    def __repr__(self):
+        return "MetricsAccumulator(merged_length={}, autocorr_lags={})".format(
+            self.moments.n, self.autocorr_lags
+        )
+
+    def update(self, observed_input, predicted_input):
+        """ Add a chunk of observed and predicted values.
+
+        Parameters
+        ----------
+        observed_input : :any:`pandas.Series`
+            Series with :any:`pandas.DatetimeIndex` with a set of electricity
+            or gas meter values.
+        predicted_input : :any:`pandas.Series`
+            Series with :any:`pandas.DatetimeIndex` with a set of electricity
+            or gas meter values.
+        """
+        observed, predicted, observed_length, predicted_length = _align_inputs(
+            observed_input, predicted_input
+        )
+        self._update_arrays(observed, predicted, observed_length, predicted_length)
+
+    def _update_arrays(self, observed, predicted, observed_length, predicted_length):
+        chunk = MetricsAccumulator(autocorr_lags=self.autocorr_lags)
+        chunk.observed_length = observed_length
+        chunk.predicted_length = predicted_length
+
+        residuals = predicted - observed
+        abs_residuals = np.abs(residuals)
+        n = len(observed)
+
+        chunk.observed_sum = observed.sum()
+        chunk.predicted_sum = predicted.sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            chunk.moments = _Moments.from_arrays(
+                observed,
+                predicted,
+                means=(chunk.observed_sum / n, chunk.predicted_sum / n),
+            )
+            percent_errors = abs_residuals / np.abs(observed)
+        chunk.residuals_sum = residuals.sum()
+        chunk.squared_residuals_sum = np.dot(residuals, residuals)
+        chunk.abs_residuals_sum = abs_residuals.sum()
+
+        not_null = ~np.isnan(percent_errors)
+        chunk.percent_errors_sum = percent_errors[not_null].sum()
+        chunk.percent_errors_count = int(not_null.sum())
+        observed_positive = observed > 0
+        chunk.positive_percent_errors_sum = percent_errors[observed_positive].sum()
+        chunk.num_positive = int(observed_positive.sum())
+
+        lag = self.autocorr_lags
+        chunk.autocorr_moments = _Moments.from_arrays(residuals[lag:], residuals[:-lag])
+        chunk.head = residuals[:lag]
+        chunk.tail = residuals[-lag:]
+
+        self.merge(chunk)
+
+    def merge(self, other):
+        """ Add the totals of another :any:`eemeter.MetricsAccumulator`, for
+        data immediately following the data added to this one, to these
+        ones. """
+        lag = self.autocorr_lags
+        if other.autocorr_lags != lag:
+            raise ValueError("Cannot merge accumulators with different autocorr_lags")
+
+        self.observed_length += other.observed_length
+        self.predicted_length += other.predicted_length
+        self.moments.merge(other.moments)
+        self.observed_sum += other.observed_sum
+        self.predicted_sum += other.predicted_sum
+        self.residuals_sum += other.residuals_sum
+        self.squared_residuals_sum += other.squared_residuals_sum
+        self.abs_residuals_sum += other.abs_residuals_sum
+        self.percent_errors_sum += other.percent_errors_sum
+        self.percent_errors_count += other.percent_errors_count
+        self.positive_percent_errors_sum += other.positive_percent_errors_sum
+        self.num_positive += other.num_positive
+
+        # pair residuals at the end of this data with residuals ``lag`` values
+        # later at the start of the other data.
+        boundary = np.concatenate([self.tail, other.head])
+        n_tail = len(self.tail)
+        first = np.arange(max(0, n_tail - lag), min(n_tail, len(boundary) - lag))
+        self.autocorr_moments.merge(
+            _Moments.from_arrays(boundary[first + lag], boundary[first])
+        )
+        self.autocorr_moments.merge(other.autocorr_moments)
+        self.head = np.concatenate([self.head, other.head])[:lag]
+        self.tail = np.concatenate([self.tail, other.tail])[-lag:]
+
+    def model_metrics(self, num_parameters=1):
+        """ Compute model metrics for all data added to this accumulator.
+
+        Parameters
+        ----------
+        num_parameters : :any:`int`, optional
+            The number of parameters (excluding the intercept) used in the
+            regression from which the predictions were derived.
+
+        Returns
+        -------
+        model_metrics : :any:`eemeter.ModelMetrics`
+            Model metrics for all data added to this accumulator.
+        """
+        if num_parameters < 0:
+            raise ValueError("num_parameters must be greater than or equal to zero")
+        if self.observed_length != self.predicted_length:
+            raise ValueError("Input series are of different lengths")
+        return ModelMetrics._from_accumulator(self, num_parameters)
+
+
+class SavingsAccumulator(object):
+    """ Running totals of savings results, e.g., from
+    :any:`eemeter.caltrack_metered_savings` or
+    :any:`eemeter.caltrack_modeled_savings`, so that savings can be totalled
+    chunk by chunk without holding complete results in memory.
+
+    Attributes
+    ----------
+    totals : :any:`collections.OrderedDict`
+        Mapping of column name to the sum of non-null values in that column.
+    counts : :any:`collections.OrderedDict`
+        Mapping of column name to the number of non-null values in that column.
+    """
+
+    def __init__(self):
+        self.totals = OrderedDict()
+        self.counts = OrderedDict()
+
+    def __repr__(self):
+        return "SavingsAccumulator({})".format(
+            ", ".join(
+                "{}={}".format(column, round(total, 3))
+                for column, total in self.totals.items()
+            )
+        )
+
+    def update(self, results):
+        """ Add a chunk of savings results.
+
+        Parameters
+        ----------
+        results : :any:`pandas.DataFrame`
+            Savings results, with a column for each quantity to total.
+        """
+        for column in results.columns:
+            values = np.asarray(results[column].values, dtype=np.float64)
+            not_null = ~np.isnan(values)
+            self._add(column, values[not_null].sum(), int(not_null.sum()))
+
+    def _add(self, column, total, count):
+        self.totals[column] = self.totals.get(column, 0.0) + total
+        self.counts[column] = self.counts.get(column, 0) + count
+
+    def merge(self, other):
+        """ Add the totals of another :any:`eemeter.SavingsAccumulator` to
+        these ones. """
+        for column, total in other.totals.items():
+            self._add(column, total, other.counts[column])
+
+    def json(self):
+        """ Return a JSON-serializable representation of these totals.
+
+        The output of this function can be converted to a serialized string
+        with :any:`json.dumps`.
+        """
+        return {
+            column: {"total": _json_safe_float(total), "count": self.counts[column]}
+            for column, total in self.totals.items()
+        }
@@ -1,18 +1,121 @@
+import copy
 import json
-from pkg_resources import resource_stream
+import os
 
 from dateutil.parser import parse as parse_date
 import pytz
 
-from eemeter import meter_data_from_csv, temperature_data_from_csv
+from ..__version__ import __version__
 
 __all__ = ("samples", "load_sample")
 
 
+# Decoded sample metadata and data, keyed by file, so repeated calls to
+# load_sample don't need to gunzip and reparse the bundled CSVs.
+_metadata_cache = {}
+_data_cache = {}
+
+
+def _open_sample_file(filename):
+    try:
+        from importlib.resources import open_binary
+    except ImportError:  # pragma: no cover
+        # python < 3.7
+        from pkg_resources import resource_stream as open_binary
+
+    return open_binary("eemeter.samples", filename)
+
+
 def _load_sample_metadata():
-    with resource_stream("eemeter.samples", "metadata.json") as f:
-        metadata = json.loads(f.read().decode("utf-8"))
-    return metadata
+    if "metadata" not in _metadata_cache:
+        with _open_sample_file("metadata.json") as f:
+            _metadata_cache["metadata"] = json.loads(f.read().decode("utf-8"))
+    # callers (i.e., load_sample) modify metadata in place.
+    return copy.deepcopy(_metadata_cache["metadata"])
+
+
+def _disk_cache_path(cache_dir, kind, filename, freq):
+    return os.path.join(
+        cache_dir,
+        "{}-{}-{}-{}.npz".format(
+            filename.replace(".csv.gz", ""), kind, freq or "none", __version__
+        ),
+    )
+
+
+def _read_disk_cache(path):
+    import numpy as np
+    import pandas as pd
+
+    if not os.path.exists(path):
+        return None
+
+    with np.load(path, allow_pickle=False) as npz:
+        freq = str(npz["freq"]) or None
+        index = pd.DatetimeIndex(npz["index"], tz="UTC", freq=freq)
+        index.name = str(npz["index_name"])
+        if str(npz["kind"]) == "meter":
+            return pd.DataFrame({str(npz["name"]): npz["values"]}, index=index)
+        return pd.Series(npz["values"], index=index, name=str(npz["name"]))
+
+
+def _write_disk_cache(path, kind, data):
+    import numpy as np
+
+    if kind == "meter":
+        (name,) = data.columns
+        values = data[name].values
+    else:
+        name = data.name
+        values = data.values
+
+    if not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+
+    # write then rename so that concurrent readers never see a partial file.
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            kind=kind,
+            name=name,
+            values=values,
+            index=data.index.tz_convert("UTC").tz_localize(None).values,
+            index_name=data.index.name or "",
+            freq=data.index.freqstr or "",
+        )
+    os.rename(tmp_path, path)
+
+
+def _load_sample_data(kind, filename, freq, cache_dir):
+    key = (kind, filename, freq)
+    data = _data_cache.get(key)
+
+    if data is None and cache_dir is not None:
+        path = _disk_cache_path(cache_dir, kind, filename, freq)
+        data = _read_disk_cache(path)
+    else:
+        path = None
+
+    if data is None:
+        from eemeter.io import meter_data_from_csv, temperature_data_from_csv
+
+        with _open_sample_file(filename) as f:
+            if kind == "meter":
+                data = meter_data_from_csv(f, gzipped=True, freq=freq)
+            else:
+                data = temperature_data_from_csv(f, gzipped=True, freq=freq)
+        if path is not None:
+            _write_disk_cache(path, kind, data)
+
+    _data_cache[key] = data
+
+    # copies keep the cached data safe from modification by callers. The
+    # index is copied deeply as well, since a shallow copy can share the
+    # cached index (and its ``freq``) with the returned object.
+    out = data.copy()
+    out.index = data.index.copy(deep=True)
+    return out
 
 
 def samples():
@@ -27,15 +130,23 @@ def samples():
     return list(sorted(sample_metadata.keys()))
 
 
-def load_sample(sample):
+def load_sample(sample, cache_dir=None):
     """ Load meter data, temperature data, and metadata for associated with a
     particular sample identifier. Note: samples are simulated, not real, data.
 
+    Decoded sample data is kept in memory, so only the first call for a
+    particular sample needs to parse the bundled CSV files. If a
+    ``cache_dir`` is given (or the ``EEMETER_SAMPLE_CACHE_DIR`` environment
+    variable is set), decoded data is also stored there as ``.npz`` files
+    so it can be reused across processes.
+
     Parameters
     ----------
     sample : :any:`str`
         Identifier of sample. Complete list can be obtained with
         :any:`eemeter.samples`.
+    cache_dir : :any:`str`, optional
+        Directory in which to cache decoded sample data.
 
     Returns
     -------
@@ -54,17 +165,19 @@ def load_sample(sample):
             )
         )
 
+    if cache_dir is None:
+        cache_dir = os.environ.get("EEMETER_SAMPLE_CACHE_DIR") or None
+
     freq = metadata.get("freq")
     if freq not in ("hourly", "daily"):
         freq = None
 
-    meter_data_filename = metadata["meter_data_filename"]
-    with resource_stream("eemeter.samples", meter_data_filename) as f:
-        meter_data = meter_data_from_csv(f, gzipped=True, freq=freq)
-
-    temperature_filename = metadata["temperature_filename"]
-    with resource_stream("eemeter.samples", temperature_filename) as f:
-        temperature_data = temperature_data_from_csv(f, gzipped=True, freq="hourly")
+    meter_data = _load_sample_data(
+        "meter", metadata["meter_data_filename"], freq, cache_dir
+    )
+    temperature_data = _load_sample_data(
+        "temperature", metadata["temperature_filename"], "hourly", cache_dir
+    )
 
     metadata["blackout_start_date"] = pytz.UTC.localize(
         parse_date(metadata["blackout_start_date"])
@@ -0,0 +1,246 @@
+import numpy as np
+import pandas as pd
+
+from .load import _load_sample_metadata
+
+__all__ = ("synthetic_meters",)
+
+
+_BILLING_PERIOD_DAYS = {"billing_monthly": (27, 34), "billing_bimonthly": (56, 65)}
+
+
+def _station_temperatures(random_seed, station_index, start, n_days):
+    """ Return true (gap-free) hourly temperatures for a synthetic station. """
+    rng = np.random.RandomState([random_seed, 0, station_index])
+
+    index = pd.date_range(start, periods=n_days * 24, freq="H", tz="UTC")
+    day_of_year = index.dayofyear.values + index.hour.values / 24.0
+
+    annual_mean = 52 + rng.uniform(-8, 8)
+    annual_amplitude = 24 + rng.uniform(-6, 6)
+    diurnal_amplitude = 8 + rng.uniform(-3, 3)
+
+    # day-to-day weather: an AR(1) process on daily anomalies.
+    daily_anomaly = np.empty(n_days)
+    daily_anomaly[0] = rng.normal(0, 6)
+    for i in range(1, n_days):
+        daily_anomaly[i] = 0.7 * daily_anomaly[i - 1] + rng.normal(0, 4.5)
+
+    temps = (
+        annual_mean
+        - annual_amplitude * np.cos(2 * np.pi * (day_of_year - 20) / 365.25)
+        - diurnal_amplitude * np.cos(2 * np.pi * (index.hour.values - 10) / 24.0)
+        + np.repeat(daily_anomaly, 24)
+        + rng.normal(0, 1, len(index))
+    )
+    return pd.Series(temps, index=index)
+
+
+def _aggregate(hourly_usage, freq, n_days, rng):
+    """ Aggregate hourly usage to the requested frequency. Returns period start
+    offsets in hours and period values. As in the samples, the final entry marks
+    the end of the last period and has a value of ``numpy.nan``. """
+    if freq == "hourly":
+        period_starts = np.arange(n_days * 24 + 1)
+        return period_starts, np.append(hourly_usage, np.nan)
+
+    daily_usage = hourly_usage.reshape(n_days, 24).sum(axis=1)
+    if freq == "daily":
+        period_starts = np.arange(n_days + 1)
+        return period_starts * 24, np.append(daily_usage, np.nan)
+
+    min_days, max_days = _BILLING_PERIOD_DAYS[freq]
+    period_starts = [0]
+    while True:
+        next_start = period_starts[-1] + rng.randint(min_days, max_days)
+        if next_start > n_days:
+            break
+        period_starts.append(next_start)
+    period_starts = np.array(period_starts)
+
+    values = np.append(np.add.reduceat(daily_usage, period_starts[:-1]), np.nan)
+    return period_starts * 24, values
+
+
+def synthetic_meters(
+    n_meters,
+    freq="daily",
+    start="2015-11-22",
+    n_days=810,
+    n_stations=1,
+    noise=0.1,
+    meter_gap_fraction=0.0,
+    temperature_gap_fraction=0.0,
+    duplicate_fraction=0.0,
+    templates=None,
+    random_seed=None,
+):
+    """ Generate synthetic meter data and temperature data.
+
+    Meters are based on the base, heating and cooling loads and balance
+    points of the bundled samples (see :any:`eemeter.samples`), scaled and
+    jittered per meter, and driven by simulated hourly station temperatures.
+    Meters are generated lazily, one at a time, so arbitrarily large
+    portfolios can be produced without holding them in memory. Note:
+    temperature data is shared by all meters at the same station and should
+    not be modified in place.
+
+    Parameters
+    ----------
+    n_meters : :any:`int`
+        Number of meters to generate.
+    freq : :any:`str`, optional
+        One of ``'hourly'``, ``'daily'``, ``'billing_monthly'``, or
+        ``'billing_bimonthly'``.
+    start : :any:`str` or :any:`datetime.datetime`, optional
+        Start date (UTC) of meter and temperature data.
+    n_days : :any:`int`, optional
+        Number of days of data to generate.
+    n_stations : :any:`int`, optional
+        Number of weather stations. Meters are assigned to stations in
+        round-robin order.
+    noise : :any:`float`, optional
+        Standard deviation of multiplicative noise applied to hourly usage.
+    meter_gap_fraction : :any:`float`, optional
+        Fraction of meter data values to replace with ``numpy.nan``.
+    temperature_gap_fraction : :any:`float`, optional
+        Fraction of hourly temperature values to replace with ``numpy.nan``.
+    duplicate_fraction : :any:`float`, optional
+        Fraction of meter data rows to duplicate (same timestamp, same value).
+    templates : :any:`list` of :any:`str`, optional
+        Sample identifiers to use as templates for load parameters. Defaults
+        to all bundled samples.
+    random_seed : :any:`int`, optional
+        Seed for reproducible output. Meter ``i`` is the same for a given seed
+        regardless of ``n_meters``.
+
+    Yields
+    ------
+    meter_data, temperature_data, metadata : :any:`tuple` of :any:`pandas.DataFrame`, :any:`pandas.Series`, and :any:`dict`
+        Meter data, temperature data, and metadata for each meter, in the same
+        form as :any:`eemeter.load_sample`.
+    """
+    if freq not in ("hourly", "daily") and freq not in _BILLING_PERIOD_DAYS:
+        raise ValueError("freq not supported: {}".format(freq))
+
+    if n_stations < 1:
+        raise ValueError("n_stations must be greater than zero")
+
+    sample_metadata = _load_sample_metadata()
+    if templates is None:
+        templates = sorted(sample_metadata.keys())
+    for template in templates:
+        if template not in sample_metadata:
+            raise ValueError("Sample not found: {}".format(template))
+
+    if random_seed is None:
+        random_seed = np.random.randint(2 ** 31)
+
+    start = pd.Timestamp(start)
+    if start.tz is None:
+        start = start.tz_localize("UTC")
+
+    # station temperatures are small relative to a portfolio; keep them.
+    stations = {}
+
+    for i in range(n_meters):
+        rng = np.random.RandomState([random_seed, 1, i])
+        station_index = i % n_stations
+
+        if station_index not in stations:
+            true_temperatures = _station_temperatures(
+                random_seed, station_index, start, n_days
+            )
+            temperature_data = true_temperatures.copy()
+            station_rng = np.random.RandomState([random_seed, 2, station_index])
+            gaps = station_rng.rand(len(temperature_data)) < temperature_gap_fraction
+            temperature_data[gaps] = np.nan
+            temperature_data.index.name = "dt"
+            temperature_data.name = "tempF"
+            stations[station_index] = (
+                true_temperatures.values,
+                true_temperatures.values[: 365 * 24].reshape(-1, 24).mean(axis=1),
+                temperature_data,
+            )
+        hourly_temps, first_year_daily_temps, temperature_data = stations[station_index]
+
+        template = templates[rng.randint(len(templates))]
+        template_metadata = sample_metadata[template]
+        scale = rng.lognormal(0, 0.5)
+
+        annual_base_load = template_metadata["annual_baseline_base_load"] * scale
+        annual_heating_load = template_metadata["annual_baseline_heating_load"] * scale
+        annual_cooling_load = template_metadata["annual_baseline_cooling_load"] * scale
+
+        hourly_usage = np.repeat(annual_base_load / 365.0 / 24.0, len(hourly_temps))
+        metadata = {
+            "id": "synthetic-{:06d}".format(i),
+            "template": template,
+            "station_id": "synthetic-station-{:04d}".format(station_index),
+            "freq": freq,
+            "interpretation": template_metadata["interpretation"],
+            "unit": template_metadata["unit"],
+            "annual_baseline_base_load": annual_base_load,
+            "annual_baseline_heating_load": annual_heating_load,
+            "annual_baseline_cooling_load": annual_cooling_load,
+        }
+
+        # betas are chosen to give the template's annual loads over the first
+        # year of data.
+        if annual_heating_load > 0:
+            heating_balance_point = int(
+                template_metadata["baseline_heating_balance_point"] + rng.randint(-3, 4)
+            )
+            mean_daily_hdd = np.maximum(
+                heating_balance_point - first_year_daily_temps, 0
+            ).mean()
+            if mean_daily_hdd > 0:
+                beta_hdd = annual_heating_load / 365.0 / mean_daily_hdd
+            else:  # no hdds at all in this (short) period
+                beta_hdd = 0.0
+            hourly_usage += (
+                beta_hdd * np.maximum(heating_balance_point - hourly_temps, 0) / 24.0
+            )
+            metadata["baseline_heating_balance_point"] = heating_balance_point
+        if annual_cooling_load > 0:
+            cooling_balance_point = int(
+                template_metadata["baseline_cooling_balance_point"] + rng.randint(-3, 4)
+            )
+            mean_daily_cdd = np.maximum(
+                first_year_daily_temps - cooling_balance_point, 0
+            ).mean()
+            if mean_daily_cdd > 0:
+                beta_cdd = annual_cooling_load / 365.0 / mean_daily_cdd
+            else:  # no cdds at all in this (short) period
+                beta_cdd = 0.0
+            hourly_usage += (
+                beta_cdd * np.maximum(hourly_temps - cooling_balance_point, 0) / 24.0
+            )
+            metadata["baseline_cooling_balance_point"] = cooling_balance_point
+
+        hourly_usage *= np.maximum(1 + noise * rng.randn(len(hourly_usage)), 0)
+
+        hour_offsets, values = _aggregate(hourly_usage, freq, n_days, rng)
+
+        gaps = rng.rand(len(values)) < meter_gap_fraction
+        values[gaps] = np.nan
+
+        if freq == "hourly":
+            index = pd.date_range(start, periods=len(values), freq="H")
+        elif freq == "daily":
+            index = pd.date_range(start, periods=len(values), freq="D")
+        else:
+            index = pd.date_range(start, periods=n_days * 24 + 1, freq="H")
+            index = pd.DatetimeIndex(index[hour_offsets], freq=None)
+
+        n_duplicates = int(round(duplicate_fraction * len(values)))
+        if n_duplicates > 0:
+            positions = rng.choice(len(values), n_duplicates, replace=False)
+            rows = np.sort(np.concatenate([np.arange(len(values)), positions]))
+            values = values[rows]
+            index = pd.DatetimeIndex(index[rows], freq=None)
+
+        index.name = "start"
+        meter_data = pd.DataFrame({"value": values}, index=index)
+
+        yield meter_data, temperature_data, metadata
@@ -0,0 +1,234 @@
+import weakref
+
+import numpy as np
+import pandas as pd
+
+__all__ = ("SharedTemperatureData",)
+
+
+def _shared_memory():
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "multiprocessing.shared_memory (python 3.8+) is required for"
+            " shared temperature data."
+        )
+    return shared_memory
+
+
+def _attach_segment(name):
+    shared_memory = _shared_memory()
+    try:
+        # python 3.13+: attaching processes needn't track the segment, which
+        # is unlinked by the process that created it.
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _release_segments(segments, unlink):
+    # Segments are not closed here: arrays viewing a segment keep it (and so
+    # its mapping) alive, and it is closed when they are garbage collected.
+    if unlink:
+        for segment in segments:
+            try:
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+    del segments[:]
+
+
+class _SegmentArray(object):
+    """ Array interface to part of a shared memory segment. Arrays made from
+    it with :any:`numpy.asarray` hold it, and so the segment, as their
+    ``base``, so the segment can't be unmapped while they are in use.
+    """
+
+    def __init__(self, segment, dtype, length, offset, readonly):
+        self.segment = segment
+        dtype = np.dtype(dtype)
+        address = np.ndarray(
+            (length,), dtype=dtype, buffer=segment.buf, offset=offset
+        ).ctypes.data
+        self.__array_interface__ = {
+            "version": 3,
+            "shape": (length,),
+            "typestr": dtype.str,
+            "data": (address, readonly),
+        }
+
+
+class SharedTemperatureData(object):
+    """ Temperature data for many weather stations placed in shared memory,
+    for use by process pool workers.
+
+    Each temperature series is stored once in a
+    :any:`multiprocessing.shared_memory.SharedMemory` segment by the process
+    that creates this object. Pickling this object (e.g., to pass it to
+    workers of a :any:`multiprocessing.pool.Pool` or
+    :any:`concurrent.futures.ProcessPoolExecutor`) sends only the names of
+    the segments, and workers attach to them on first access, getting
+    read-only :any:`pandas.Series` views rather than copies of the data::
+
+        >>> with SharedTemperatureData() as shared:
+        ...     shared.add("722880", temperature_data)
+        ...     shared.add(("722880", "daily"), temperature_data.resample("D").mean())
+        ...     with ProcessPoolExecutor() as executor:
+        ...         results = list(executor.map(fit_meter, meters, repeat(shared)))
+
+    where, e.g., ``fit_meter`` calls
+    :any:`eemeter.merge_temperature_data` with
+    ``shared[meter.station_id]``.
+
+    Segments are unlinked when the creating process closes this object,
+    exits the ``with`` block, or exits. Workers need not clean up: their
+    mappings are released when they exit, including if they crash. If the
+    creating process itself is killed, segments are unlinked by the
+    :any:`multiprocessing` resource tracker, so workers should be started by
+    the creating process. Requires python 3.8+.
+
+    Parameters
+    ----------
+    temperature_data : :any:`dict`, optional
+        Temperature series to add, by key (e.g., weather station ID). See
+        :any:`eemeter.SharedTemperatureData.add`.
+    """
+
+    def __init__(self, temperature_data=None):
+        self._owner = True
+        self._layouts = {}
+        self._init_segments()
+        if temperature_data is not None:
+            for key, series in temperature_data.items():
+                self.add(key, series)
+
+    def __repr__(self):
+        return "SharedTemperatureData({})".format(", ".join(map(repr, self.keys())))
+
+    def __getstate__(self):
+        return {"layouts": self._layouts}
+
+    def __setstate__(self, state):
+        self._owner = False
+        self._layouts = state["layouts"]
+        self._init_segments()
+
+    def _init_segments(self):
+        # fail clearly on python < 3.8 before relying on python 3 APIs, e.g.,
+        # weakref.finalize.
+        _shared_memory()
+        self._segments = {}
+        self._series = {}
+        # segments are released when closed or garbage collected, or at exit.
+        self._all_segments = []
+        self._finalizer = weakref.finalize(
+            self, _release_segments, self._all_segments, self._owner
+        )
+
+    def _check_open(self):
+        if not self._finalizer.alive:
+            raise ValueError("SharedTemperatureData is closed.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __contains__(self, key):
+        return key in self._layouts
+
+    def __len__(self):
+        return len(self._layouts)
+
+    def keys(self):
+        """ Keys of the temperature series, in the order they were added. """
+        return list(self._layouts)
+
+    def add(self, key, temperature_data):
+        """ Place a temperature series in shared memory.
+
+        Parameters
+        ----------
+        key : hashable
+            Key under which to store the series, e.g., a weather station ID,
+            or a tuple of weather station ID and ``'daily'`` for a derived
+            daily series.
+        temperature_data : :any:`pandas.Series`
+            Series with timezone-aware :any:`pandas.DatetimeIndex` and
+            temperature values. Values are stored as ``float64``, and the
+            frequency of the index (e.g., ``'H'``) is kept.
+        """
+        self._check_open()
+        if not self._owner:
+            raise ValueError(
+                "Temperature data can only be added by the process which"
+                " created this SharedTemperatureData."
+            )
+        if key in self._layouts:
+            raise ValueError("Temperature data already added: {!r}".format(key))
+        if not isinstance(temperature_data.index, pd.DatetimeIndex):
+            raise ValueError("temperature_data.index must be a DatetimeIndex.")
+        if not temperature_data.index.tz:
+            raise ValueError(
+                "temperature_data.index must be timezone-aware. You can set it"
+                " with temperature_data.tz_localize(...)."
+            )
+
+        n = len(temperature_data)
+        # index times (nanoseconds since epoch, UTC) then values.
+        segment = _shared_memory().SharedMemory(create=True, size=max(16 * n, 1))
+        self._all_segments.append(segment)
+        times, values = self._arrays(segment, n, readonly=False)
+        times[:] = temperature_data.index.asi8
+        values[:] = temperature_data.values
+        self._segments[key] = segment
+        self._layouts[key] = {
+            "segment": segment.name,
+            "length": n,
+            "tz": str(temperature_data.index.tz),
+            "freq": temperature_data.index.freqstr,
+            "name": temperature_data.name,
+            "index_name": temperature_data.index.name,
+        }
+
+    def __getitem__(self, key):
+        """ Read-only view of the temperature series stored under ``key``. """
+        series = self._series.get(key)
+        if series is not None:
+            return series
+        self._check_open()
+        layout = self._layouts[key]
+        segment = self._segments.get(key)
+        if segment is None:
+            segment = _attach_segment(layout["segment"])
+            self._all_segments.append(segment)
+            self._segments[key] = segment
+        times, values = self._arrays(segment, layout["length"])
+        # no copies: the index is localized to UTC, then converted.
+        index = pd.DatetimeIndex(
+            times.view("M8[ns]"),
+            tz="UTC",
+            freq=layout["freq"],
+            name=layout["index_name"],
+        ).tz_convert(layout["tz"])
+        series = pd.Series(values, index=index, name=layout["name"], copy=False)
+        self._series[key] = series
+        return series
+
+    @staticmethod
+    def _arrays(segment, n, readonly=True):
+        times = np.asarray(_SegmentArray(segment, np.int64, n, 0, readonly))
+        values = np.asarray(_SegmentArray(segment, np.float64, n, 8 * n, readonly))
+        return times, values
+
+    def close(self):
+        """ Release the shared memory segments, and unlink them if this is
+        the process which created them. Series views already returned by
+        this object remain usable: each keeps its mapping of the segment
+        until it is garbage collected.
+        """
+        self._series.clear()
+        self._segments.clear()
+        self._finalizer()
@@ -7,6 +7,7 @@ import pytz
 
 from .exceptions import NoBaselineDataError, NoReportingDataError
 from .api import EEMeterWarning
+from .instrumentation import timed_function
 
 
 __all__ = (
@@ -16,24 +17,79 @@ __all__ = (
     "get_baseline_data",
     "get_reporting_data",
     "merge_temperature_data",
+    "merge_temperature_data_frame",
     "remove_duplicates",
     "overwrite_partial_rows_with_nan",
 )
 
 
-def _matching_groups(index, df, tolerance):
-    # convert index to df for use with merge_asof
-    index_df = pd.DataFrame({"index_col": index}, index=index)
+def _matching_period_codes(index, temperature_index, tolerance):
+    """ Match each temperature timestamp to the latest meter period starting
+    at or before it, but not more than ``tolerance`` before it.
 
-    # get a dataframe containing mean temperature
-    #   1) merge by matching temperature to closest previous meter start date,
-    #      up to tolerance limit, using merge_asof.
-    #   2) group by meter_index, and take the mean, ignoring all columns except
-    #      the temperature column.
-    groups = pd.merge_asof(
-        left=df, right=index_df, left_index=True, right_index=True, tolerance=tolerance
-    ).groupby("index_col")
-    return groups
+    Returns integer period codes for ``temperature_index``: the position in
+    ``index`` of the matched period (the first position, if the period start
+    is duplicated), or -1 if there is no matching period. Also returns the
+    codes of the periods in ``index`` themselves, for mapping aggregations
+    by code back onto ``index``.
+    """
+    if not index.is_monotonic_increasing:
+        raise ValueError("meter_data_index must be sorted.")
+
+    # nanoseconds since epoch (UTC), so timezones needn't match.
+    index_times = index.asi8
+    temperature_times = temperature_index.asi8
+
+    index_codes = np.searchsorted(index_times, index_times, side="left")
+    if len(index_times) == 0:
+        return np.full(len(temperature_times), -1), index_codes
+
+    positions = np.searchsorted(index_times, temperature_times, side="right") - 1
+    matched = positions >= 0
+    if tolerance is not None:
+        matched &= (
+            temperature_times - index_times[positions] <= pd.Timedelta(tolerance).value
+        )
+    codes = np.where(matched, index_codes[positions], -1)
+    return codes, index_codes
+
+
+def _mean_degree_day_columns(
+    temps, cooling_balance_points, heating_balance_points, n_days
+):
+    """ Mean cooling and heating degrees of the (non-null) temperatures in
+    ``temps`` for each balance point, times ``n_days``, as ``cdd_<bp>`` and
+    ``hdd_<bp>`` column dicts.
+
+    Temperatures are sorted once and summed cumulatively, so that the sum and
+    count of temperatures above (or below) every balance point can be found
+    with a single :any:`numpy.searchsorted`. This takes O(n log n + k) rather
+    than O(nk) time for n temperatures and k balance points, so fine grids
+    of (possibly fractional) balance points are cheap.
+    """
+    temps = np.sort(temps)
+    n_temps = temps.shape[0]
+    cumulative_temps = np.concatenate([[0.0], np.cumsum(temps)])
+    cooling_bps = np.asarray(cooling_balance_points, dtype=np.float64)
+    heating_bps = np.asarray(heating_balance_points, dtype=np.float64)
+
+    # temperatures above cooling balance points
+    n_below = np.searchsorted(temps, cooling_bps, side="right")
+    cdds = (cumulative_temps[-1] - cumulative_temps[n_below]) - cooling_bps * (
+        n_temps - n_below
+    )
+    # temperatures below heating balance points
+    n_below = np.searchsorted(temps, heating_bps, side="left")
+    hdds = heating_bps * n_below - cumulative_temps[n_below]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # clip tiny negative values left by cancellation
+        cdds = np.maximum(cdds, 0) / n_temps * n_days
+        hdds = np.maximum(hdds, 0) / n_temps * n_days
+
+    cdd_cols = {"cdd_%s" % bp: cdd for bp, cdd in zip(cooling_balance_points, cdds)}
+    hdd_cols = {"hdd_%s" % bp: hdd for bp, hdd in zip(heating_balance_points, hdds)}
+    return cdd_cols, hdd_cols
 
 
 def _degree_day_columns(
@@ -61,14 +117,12 @@ def _degree_day_columns(
                 n_days = 1
             else:
                 n_days = n_temps / 24.0
-            cdd_cols = {
-                "cdd_%s" % bp: np.maximum(temps - bp, 0).mean() * n_days
-                for bp in cooling_balance_points
-            }
-            hdd_cols = {
-                "hdd_%s" % bp: np.maximum(bp - temps, 0).mean() * n_days
-                for bp in heating_balance_points
-            }
+            cdd_cols, hdd_cols = _mean_degree_day_columns(
+                temps.values[temps.notnull().values],
+                cooling_balance_points,
+                heating_balance_points,
+                n_days,
+            )
 
             columns = count_cols
             columns.update(cdd_cols)
@@ -108,14 +162,12 @@ def _degree_day_columns(
                 else:
                     n_days = n_days_total
 
-                cdd_cols = {
-                    "cdd_%s" % bp: np.maximum(daily_temps - bp, 0).mean() * n_days
-                    for bp in cooling_balance_points
-                }
-                hdd_cols = {
-                    "hdd_%s" % bp: np.maximum(bp - daily_temps, 0).mean() * n_days
-                    for bp in heating_balance_points
-                }
+                cdd_cols, hdd_cols = _mean_degree_day_columns(
+                    daily_temps.values,
+                    cooling_balance_points,
+                    heating_balance_points,
+                    n_days,
+                )
             else:  # faster route for daily case, should have same effect.
 
                 if count > n_limit_daily:
@@ -162,9 +214,11 @@ def merge_temperature_data(
     use_mean_daily_values=True,
     tolerance=None,
     keep_partial_nan_rows=False,
+    chunk_size=None,
+    dtype=None,
 ):
-    """ Merge meter data of any frequency with hourly temperature data to make
-    a dataset to feed to models.
+    """ Merge meter data of any frequency with hourly or daily temperature data
+    to make a dataset to feed to models.
 
     Creates a :any:`pandas.DataFrame` with the same index as the meter data.
 
@@ -197,6 +251,18 @@ def merge_temperature_data(
         For CalTRACK compliance (3.3.1.2), for daily or billing methods,
         must set ``degree_day_method=daily``.
 
+    .. note::
+
+        Daily temperature data (``freq='D'``) can be used with daily or
+        billing period meter data, and ``degree_day_method='daily'``. Each
+        value is taken to be the mean temperature of the day starting at its
+        timestamp, so days should start at the same time of day as the meter
+        periods. A day is kept if its value is not null, as if it had
+        sufficient hourly coverage, so ``percent_hourly_coverage_per_day`` is
+        not used. All days of a period are dropped if fewer than
+        ``percent_hourly_coverage_per_billing_period`` of them are kept.
+        Data quality columns count days rather than hours.
+
     See also :any:`eemeter.compute_temperature_features`.
 
     Parameters
@@ -205,8 +271,9 @@ def merge_temperature_data(
         DataFrame with :any:`pandas.DatetimeIndex` and a column with the name
         ``value``.
     temperature_data : :any:`pandas.Series`
-        Series with :any:`pandas.DatetimeIndex` with hourly (``'H'``) frequency
-        and a set of temperature values.
+        Series with :any:`pandas.DatetimeIndex` with hourly (``'H'``) or daily
+        (``'D'``) frequency and a set of temperature values. Daily values are
+        taken to be mean daily temperatures (see note above).
     cooling_balance_points : :any:`list` of :any:`int` or :any:`float`, optional
         List of cooling balance points for which to create cooling degree days.
     heating_balance_points : :any:`list` of :any:`int` or :any:`float`, optional
@@ -231,6 +298,16 @@ def merge_temperature_data(
         If True, keeps data in resultant :any:`pandas.DataFrame` that has
         missing temperature or meter data. Otherwise, these rows are overwritten
         entirely with ``numpy.nan`` values.
+    chunk_size : :any:`int`, optional
+        If given, compute temperature features for at most this many meter
+        data periods at a time, using only the temperature data within those
+        periods. This bounds the memory used by intermediate results for
+        long, high-frequency datasets. The result is the same.
+    dtype : :any:`str` or :any:`numpy.dtype`, optional
+        If given, e.g., ``'float32'``, the floating point type of temperature
+        feature columns. Count columns (e.g., ``n_days_kept``) are stored as
+        ``int16`` if they have no missing values and fit, or as ``dtype``
+        otherwise. Use for compact feature frames when fitting many meters.
 
     Returns
     -------
@@ -268,15 +345,331 @@ def merge_temperature_data(
         use_mean_daily_values=use_mean_daily_values,
         tolerance=tolerance,
         keep_partial_nan_rows=keep_partial_nan_rows,
+        chunk_size=chunk_size,
+        dtype=dtype,
     )
 
     df = pd.concat([meter_value_df, temperature_feature_df], axis=1)
 
     if not keep_partial_nan_rows:
-        df = overwrite_partial_rows_with_nan(df)
+        df = overwrite_partial_rows_with_nan(df, inplace=True)
+        # rows overwritten with nan may have upcast compact columns.
+        df = _astype_temperature_features(df, dtype, exclude=["meter_value"])
     return df
 
 
+_NS_PER_DAY = 24 * 60 * 60 * 10 ** 9
+
+
+def _daily_temperature_table(temperature_data, offset):
+    """ Aggregate hourly temperatures into days starting ``offset``
+    nanoseconds after midnight UTC.
+
+    Returns day start times (nanoseconds since epoch), and for each day, the
+    number of hours, the number and sum of not-null hourly temperatures, and
+    the mean temperature. Only days with at least one hour are included.
+    """
+    times = temperature_data.index.asi8
+    temps = temperature_data.values.astype(np.float64)
+    not_null = ~np.isnan(temps)
+    if len(times) == 0:
+        empty = np.array([])
+        return times, empty, empty, empty, empty
+
+    days = (times - offset) // _NS_PER_DAY
+    days = days - days[0]
+    n_hours = np.bincount(days)
+    n_not_null = np.bincount(days, weights=not_null)
+    temperature_sums = np.bincount(days[not_null], weights=temps[not_null])
+    temperature_sums = np.pad(
+        temperature_sums, (0, len(n_hours) - len(temperature_sums)), "constant"
+    )
+    has_hours = n_hours > 0
+    day_times = times[0] - (times[0] - offset) % _NS_PER_DAY
+    day_times = day_times + np.flatnonzero(has_hours) * _NS_PER_DAY
+    n_hours = n_hours[has_hours].astype(np.float64)
+    n_not_null = n_not_null[has_hours]
+    temperature_sums = temperature_sums[has_hours]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        temperature_means = temperature_sums / n_not_null
+    return day_times, n_hours, n_not_null, temperature_sums, temperature_means
+
+
+def merge_temperature_data_frame(
+    meter_data,
+    temperature_data,
+    heating_balance_points=None,
+    cooling_balance_points=None,
+    meter_id_column="meter_id",
+    start_column="start",
+    data_quality=False,
+    temperature_mean=True,
+    percent_hourly_coverage_per_day=0.5,
+    percent_hourly_coverage_per_billing_period=0.9,
+    use_mean_daily_values=True,
+    keep_partial_nan_rows=False,
+    dtype=None,
+):
+    """ Merge daily or billing period meter data for many meters sharing a
+    weather station with temperature data.
+
+    Results are the same as those of :any:`eemeter.merge_temperature_data`
+    with ``degree_day_method='daily'`` for each meter, but hourly
+    temperatures are aggregated into a daily table once for all meters,
+    and the features of all periods of all meters are then summed from that
+    table with array operations, rather than grouping the hourly
+    temperatures of each meter by period.
+
+    .. note::
+
+        Days in the daily table start at the same time of day as the
+        periods, so the daily table is built once for each distinct period
+        start time of day (usually just one, or two across daylight saving
+        time changes). Periods are made up of the whole days in the table
+        starting within them, so they must be at least one day long, and
+        periods that are not whole days long (i.e., those spanning daylight
+        saving time changes) may differ slightly in the hours counted. The
+        last period of each meter only marks the end of its data and has no
+        temperature features.
+
+    Parameters
+    ----------
+    meter_data : :any:`pandas.DataFrame`
+        Long-format meter data with one row per meter and period, containing
+        meter ID and timezone-aware period start columns (or index levels)
+        and a column with the name ``value``.
+    temperature_data : :any:`pandas.Series`
+        Series with :any:`pandas.DatetimeIndex` with hourly (``'H'``) or daily
+        (``'D'``) frequency and a set of temperature values, as for
+        :any:`eemeter.compute_temperature_features`.
+    cooling_balance_points : :any:`list` of :any:`int` or :any:`float`, optional
+        List of cooling balance points for which to create cooling degree days.
+    heating_balance_points : :any:`list` of :any:`int` or :any:`float`, optional
+        List of heating balance points for which to create heating degree days.
+    meter_id_column : :any:`str`, optional
+        Name of the column (or index level) containing meter IDs.
+    start_column : :any:`str`, optional
+        Name of the column (or index level) containing period start times.
+    data_quality : :any:`bool`, optional
+        See :any:`eemeter.merge_temperature_data`.
+    temperature_mean : :any:`bool`, optional
+        See :any:`eemeter.merge_temperature_data`.
+    percent_hourly_coverage_per_day : :any:`str`, optional
+        See :any:`eemeter.merge_temperature_data`.
+    percent_hourly_coverage_per_billing_period : :any:`str`, optional
+        See :any:`eemeter.merge_temperature_data`.
+    use_mean_daily_values : :any:`bool`, optional
+        See :any:`eemeter.merge_temperature_data`.
+    keep_partial_nan_rows: :any:`bool`, optional
+        See :any:`eemeter.merge_temperature_data`.
+    dtype : :any:`str` or :any:`numpy.dtype`, optional
+        See :any:`eemeter.merge_temperature_data`.
+
+    Returns
+    -------
+    data : :any:`pandas.DataFrame`
+        A dataset indexed by meter ID and period start, sorted by meter and
+        then by time, with the same columns as that of
+        :any:`eemeter.merge_temperature_data`.
+    """
+    if temperature_data.index.freq == "H":
+        daily_temperature_data = False
+    elif temperature_data.index.freq == "D":
+        daily_temperature_data = True
+    else:
+        raise ValueError(
+            "temperature_data.index must have hourly (freq='H') or daily"
+            " (freq='D') frequency. Found: {}".format(temperature_data.index.freq)
+        )
+
+    if not temperature_data.index.tz:
+        raise ValueError(
+            "temperature_data.index must be timezone-aware. You can set it with"
+            " temperature_data.tz_localize(...)."
+        )
+
+    def _values(column):
+        if column in meter_data.columns:
+            return pd.Index(meter_data[column])
+        return meter_data.index.get_level_values(column)
+
+    starts = _values(start_column)
+    if not getattr(starts, "tz", None):
+        raise ValueError(
+            "meter data period starts must be timezone-aware. You can set them"
+            " with tz_localize(...)."
+        )
+
+    if heating_balance_points is None:
+        heating_balance_points = []
+    if cooling_balance_points is None:
+        cooling_balance_points = []
+
+    if dtype is not None and np.dtype(dtype).kind != "f":
+        raise ValueError("dtype must be a floating point type. Found: {}".format(dtype))
+
+    # sort rows by meter, then by time.
+    codes, unique_meter_ids = pd.factorize(_values(meter_id_column), sort=True)
+    times = starts.asi8
+    rows = np.flatnonzero(codes >= 0)
+    rows = rows[np.lexsort((times[rows], codes[rows]))]
+    codes, times = codes[rows], times[rows]
+    meter_values = np.asarray(meter_data["value"].values, dtype=np.float64)[rows]
+    n_rows = len(rows)
+
+    # each period ends at the next distinct start time of the same meter.
+    new_period = np.ones(n_rows, dtype=bool)
+    new_period[1:] = (codes[1:] != codes[:-1]) | (times[1:] != times[:-1])
+    period_rows = np.flatnonzero(new_period)
+    period_codes = codes[period_rows]
+    period_times = times[period_rows]
+    period_ends = np.append(period_times[1:], 0)
+    has_end = np.append(period_codes[1:] == period_codes[:-1], False)
+    row_periods = np.cumsum(new_period) - 1
+
+    # allow for days shortened by daylight saving time.
+    if (has_end & (period_ends - period_times < pd.Timedelta("23H").value)).any():
+        raise ValueError(
+            "Periods must be at least one day long. Use merge_temperature_data"
+            " for hourly meter data."
+        )
+
+    n_periods = len(period_times)
+    n_hours = np.zeros(n_periods)
+    n_not_null = np.zeros(n_periods)
+    temperature_sums = np.zeros(n_periods)
+    n_days_total = np.zeros(n_periods)
+    n_days_kept = np.zeros(n_periods)
+    cdds = np.zeros((n_periods, len(cooling_balance_points)))
+    hdds = np.zeros((n_periods, len(heating_balance_points)))
+
+    if daily_temperature_data:
+        day_temps = temperature_data.values.astype(np.float64)
+        day_not_null = (~np.isnan(day_temps)).astype(np.float64)
+        tables = [
+            (
+                np.flatnonzero(has_end),
+                temperature_data.index.asi8,
+                np.ones(len(day_temps)),
+                day_not_null,
+                np.where(day_not_null > 0, day_temps, 0),
+                day_temps,
+            )
+        ]
+    else:
+        offsets = period_times % _NS_PER_DAY
+        tables = [
+            (np.flatnonzero(has_end & (offsets == offset)),)
+            + _daily_temperature_table(temperature_data, offset)
+            for offset in np.unique(offsets[has_end])
+        ]
+
+    # CalTRACK 2.2.2.3
+    n_limit_daily = 24 * percent_hourly_coverage_per_day
+
+    for periods, day_times, day_hours, day_not_null, day_sums, day_means in tables:
+        first_days = np.searchsorted(day_times, period_times[periods])
+        last_days = np.searchsorted(day_times, period_ends[periods])
+
+        def _period_sums(day_values):
+            # day values are summed over periods as differences of prefix sums.
+            cumulative = np.concatenate([[0.0], np.cumsum(day_values)])
+            return cumulative[last_days] - cumulative[first_days]
+
+        n_hours[periods] = _period_sums(day_hours)
+        n_not_null[periods] = _period_sums(day_not_null)
+        temperature_sums[periods] = _period_sums(day_sums)
+        n_days_total[periods] = last_days - first_days
+
+        # CalTrack 2.2.3.2
+        sufficient = (
+            n_not_null[periods]
+            >= percent_hourly_coverage_per_billing_period * n_hours[periods]
+        )
+        if daily_temperature_data:
+            kept_days = day_not_null > 0
+            single_day = np.zeros(len(periods), dtype=bool)
+        else:
+            # CalTRACK 2.2.2.3
+            kept_days = day_not_null > n_limit_daily
+            # as in merge_temperature_data, periods of at most 24 hours are
+            # kept if they have more than the limit of hours, null or not.
+            single_day = n_hours[periods] <= 24
+            sufficient |= single_day
+        kept_single_day = day_hours > n_limit_daily
+
+        def _kept_sums(day_values):
+            sums = _period_sums(np.where(kept_days, day_values, 0))
+            single_day_sums = _period_sums(np.where(kept_single_day, day_values, 0))
+            return np.where(single_day, single_day_sums, sums) * sufficient
+
+        n_days_kept[periods] = _kept_sums(np.ones(len(day_times)))
+        # single days kept without any not-null hours have null degree days.
+        n_null_days_kept = _kept_sums(np.isnan(day_means))
+        day_means = np.where(np.isnan(day_means), 0, day_means)
+        with np.errstate(invalid="ignore"):
+            null_degree_days = np.where(n_null_days_kept > 0, np.nan, 0)
+        for i, bp in enumerate(cooling_balance_points):
+            cdd_sums = _kept_sums(np.maximum(day_means - bp, 0))
+            cdds[periods, i] = cdd_sums + null_degree_days
+        for i, bp in enumerate(heating_balance_points):
+            hdd_sums = _kept_sums(np.maximum(bp - day_means, 0))
+            hdds[periods, i] = hdd_sums + null_degree_days
+
+    no_temperatures = n_days_total == 0
+    n_days_dropped = n_days_total - n_days_kept
+    if use_mean_daily_values:
+        n_days = np.ones(n_periods)
+    else:
+        n_days = n_days_total
+
+    columns = []
+    if use_mean_daily_values:
+        # CalTrack 3.3.1.1
+        with np.errstate(invalid="ignore"):
+            days_per_period = np.where(
+                has_end, (period_ends - period_times) / float(_NS_PER_DAY), np.nan
+            )
+        meter_values = meter_values / days_per_period[row_periods]
+    columns.append(("meter_value", meter_values))
+
+    def _period_values(values):
+        return np.where(no_temperatures, np.nan, values)[row_periods]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if data_quality:
+            n_null = n_hours - n_not_null
+            columns.append(("temperature_not_null", _period_values(n_not_null)))
+            columns.append(("temperature_null", _period_values(n_null)))
+        if temperature_mean:
+            temperature_means = temperature_sums / n_not_null
+            columns.append(("temperature_mean", _period_values(temperature_means)))
+        columns.append(("n_days_kept", _period_values(n_days_kept)))
+        columns.append(("n_days_dropped", _period_values(n_days_dropped)))
+        # CalTrack 3.3.4.1.1
+        for i, bp in enumerate(cooling_balance_points):
+            cdd = cdds[:, i] / n_days_kept * n_days
+            columns.append(("cdd_%s" % bp, _period_values(cdd)))
+        # CalTrack 3.3.5.1.1
+        for i, bp in enumerate(heating_balance_points):
+            hdd = hdds[:, i] / n_days_kept * n_days
+            columns.append(("hdd_%s" % bp, _period_values(hdd)))
+
+    index = pd.MultiIndex.from_arrays(
+        [
+            unique_meter_ids.take(codes),
+            pd.DatetimeIndex(times, tz="UTC").tz_convert(starts.tz),
+        ],
+        names=[meter_id_column, start_column],
+    )
+    df = pd.DataFrame(dict(columns), index=index, columns=[c for c, _ in columns])
+
+    if not keep_partial_nan_rows:
+        df = overwrite_partial_rows_with_nan(df, inplace=True)
+    return _astype_temperature_features(df, dtype, exclude=["meter_value"])
+
+
+@timed_function("compute_temperature_features")
 def compute_temperature_features(
     temperature_data,
     meter_data_index,
@@ -290,9 +683,11 @@ def compute_temperature_features(
     use_mean_daily_values=True,
     tolerance=None,
     keep_partial_nan_rows=False,
+    chunk_size=None,
+    dtype=None,
 ):
-    """ Compute temperature features from hourly temperature data using the
-    :any:`pandas.DatetimeIndex` meter data..
+    """ Compute temperature features from hourly or daily temperature data
+    using the :any:`pandas.DatetimeIndex` meter data..
 
     Creates a :any:`pandas.DataFrame` with the same index as the meter data.
 
@@ -325,13 +720,26 @@ def compute_temperature_features(
         For CalTRACK compliance (3.3.1.2), for daily or billing methods,
         must set ``degree_day_method=daily``.
 
+    .. note::
+
+        Daily temperature data (``freq='D'``) can be used with daily or
+        billing period meter data, and ``degree_day_method='daily'``. Each
+        value is taken to be the mean temperature of the day starting at its
+        timestamp, so days should start at the same time of day as the meter
+        periods. A day is kept if its value is not null, as if it had
+        sufficient hourly coverage, so ``percent_hourly_coverage_per_day`` is
+        not used. All days of a period are dropped if fewer than
+        ``percent_hourly_coverage_per_billing_period`` of them are kept.
+        Data quality columns count days rather than hours.
+
     See also :any:`eemeter.merge_temperature_data`.
 
     Parameters
     ----------
     temperature_data : :any:`pandas.Series`
-        Series with :any:`pandas.DatetimeIndex` with hourly (``'H'``) frequency
-        and a set of temperature values.
+        Series with :any:`pandas.DatetimeIndex` with hourly (``'H'``) or daily
+        (``'D'``) frequency and a set of temperature values. Daily values are
+        taken to be mean daily temperatures (see note above).
     meter_data_index : :any:`pandas.DataFrame`
         A :any:`pandas.DatetimeIndex` corresponding to the index over which
         to compute temperature features.
@@ -359,16 +767,30 @@ def compute_temperature_features(
         If True, keeps data in resultant :any:`pandas.DataFrame` that has
         missing temperature or meter data. Otherwise, these rows are overwritten
         entirely with ``numpy.nan`` values.
+    chunk_size : :any:`int`, optional
+        If given, compute temperature features for at most this many meter
+        data periods at a time, using only the temperature data within those
+        periods. This bounds the memory used by intermediate results for
+        long, high-frequency datasets. The result is the same.
+    dtype : :any:`str` or :any:`numpy.dtype`, optional
+        If given, e.g., ``'float32'``, the floating point type of temperature
+        feature columns. Count columns (e.g., ``n_days_kept``) are stored as
+        ``int16`` if they have no missing values and fit, or as ``dtype``
+        otherwise. Use for compact feature frames when fitting many meters.
 
     Returns
     -------
     data : :any:`pandas.DataFrame`
         A dataset with the specified parameters.
     """
-    if temperature_data.index.freq != "H":
+    if temperature_data.index.freq == "H":
+        daily_temperature_data = False
+    elif temperature_data.index.freq == "D":
+        daily_temperature_data = True
+    else:
         raise ValueError(
-            "temperature_data.index must have hourly frequency (freq='H')."
-            " Found: {}".format(temperature_data.index.freq)
+            "temperature_data.index must have hourly (freq='H') or daily"
+            " (freq='D') frequency. Found: {}".format(temperature_data.index.freq)
         )
 
     if not temperature_data.index.tz:
@@ -391,19 +813,24 @@ def compute_temperature_features(
             " meter_data.tz_localize(...)."
         )
 
-    temp_agg_funcs = []
-    temp_agg_column_renames = {}
-
     if heating_balance_points is None:
         heating_balance_points = []
     if cooling_balance_points is None:
         cooling_balance_points = []
 
-    if tolerance is None and meter_data_index.freq is not None:
-        tolerance = pd.Timedelta(meter_data_index.freq)
+    if daily_temperature_data and meter_data_index.freq == "H":
+        raise ValueError(
+            "Daily temperature_data (freq='D') cannot be used with hourly"
+            " meter data."
+        )
 
     if not (heating_balance_points == [] and cooling_balance_points == []):
         if degree_day_method == "hourly":
+            if daily_temperature_data:
+                raise ValueError(
+                    "degree_day_method='hourly' requires hourly temperature_data"
+                    " (freq='H'). Found: 'D'"
+                )
             pass
         elif degree_day_method == "daily":
             if meter_data_index.freq == "H":
@@ -414,6 +841,96 @@ def compute_temperature_features(
         else:
             raise ValueError("method not supported: {}".format(degree_day_method))
 
+    if tolerance is None and meter_data_index.freq is not None:
+        tolerance = pd.Timedelta(meter_data_index.freq)
+
+    if dtype is not None and np.dtype(dtype).kind != "f":
+        raise ValueError("dtype must be a floating point type. Found: {}".format(dtype))
+
+    if daily_temperature_data:
+        compute_features = partial(
+            _compute_daily_temperature_features,
+            heating_balance_points=heating_balance_points,
+            cooling_balance_points=cooling_balance_points,
+            data_quality=data_quality,
+            temperature_mean=temperature_mean,
+            percent_hourly_coverage_per_billing_period=percent_hourly_coverage_per_billing_period,
+            use_mean_daily_values=use_mean_daily_values,
+            tolerance=tolerance,
+            keep_partial_nan_rows=keep_partial_nan_rows,
+        )
+    else:
+        compute_features = partial(
+            _compute_temperature_features,
+            heating_balance_points=heating_balance_points,
+            cooling_balance_points=cooling_balance_points,
+            data_quality=data_quality,
+            temperature_mean=temperature_mean,
+            degree_day_method=degree_day_method,
+            percent_hourly_coverage_per_day=percent_hourly_coverage_per_day,
+            percent_hourly_coverage_per_billing_period=percent_hourly_coverage_per_billing_period,
+            use_mean_daily_values=use_mean_daily_values,
+            tolerance=tolerance,
+            keep_partial_nan_rows=keep_partial_nan_rows,
+        )
+
+    if chunk_size is None or len(meter_data_index) <= chunk_size:
+        return _astype_temperature_features(
+            compute_features(temperature_data, meter_data_index), dtype
+        )
+
+    # Temperatures are matched to the latest meter period starting at or
+    # before them, so the temperatures for a chunk of periods are exactly
+    # those from the start of the chunk up to the start of the next chunk.
+    meter_times = meter_data_index.asi8
+    temperature_times = temperature_data.index.asi8
+    chunks = []
+    start = 0
+    while start < len(meter_data_index):
+        end = start + chunk_size
+        if end < len(meter_data_index):
+            # keep duplicate periods together, as they share temperatures.
+            end = np.searchsorted(meter_times, meter_times[end - 1], side="right")
+        temperature_start = np.searchsorted(temperature_times, meter_times[start])
+        if end < len(meter_data_index):
+            temperature_end = np.searchsorted(temperature_times, meter_times[end])
+        else:
+            temperature_end = len(temperature_times)
+        chunk = compute_features(
+            temperature_data.iloc[temperature_start:temperature_end],
+            meter_data_index[start:end],
+        )
+        chunks.append(_astype_temperature_features(chunk, dtype))
+        start = end
+
+    # chunks without any temperature data lack degree day columns.
+    columns = []
+    for chunk in chunks:
+        columns.extend(column for column in chunk.columns if column not in columns)
+    df = pd.concat([chunk.reindex(columns=columns) for chunk in chunks])
+    # restore the index frequency lost in concatenation.
+    df.index = meter_data_index.rename(df.index.name)
+    return _astype_temperature_features(df, dtype)
+
+
+def _compute_temperature_features(
+    temperature_data,
+    meter_data_index,
+    heating_balance_points,
+    cooling_balance_points,
+    data_quality,
+    temperature_mean,
+    degree_day_method,
+    percent_hourly_coverage_per_day,
+    percent_hourly_coverage_per_billing_period,
+    use_mean_daily_values,
+    tolerance,
+    keep_partial_nan_rows,
+):
+    # Inputs are assumed to have been checked by compute_temperature_features.
+    temp_agg_funcs = []
+    temp_agg_column_renames = {}
+
     # heating/cooling degree day aggregations. Needed for n_days fields as well.
     temp_agg_funcs.extend(
         _degree_day_columns(
@@ -429,34 +946,30 @@ def compute_temperature_features(
         {("temp", "degree_day_columns"): "degree_day_columns"}
     )
 
-    if data_quality:
-        temp_agg_funcs.extend(
-            [("not_null", "count"), ("null", lambda x: x.isnull().sum())]
-        )
-        temp_agg_column_renames.update(
-            {
-                ("temp", "not_null"): "temperature_not_null",
-                ("temp", "null"): "temperature_null",
-            }
-        )
-
     if temperature_mean:
         temp_agg_funcs.extend([("mean", "mean")])
         temp_agg_column_renames.update({("temp", "mean"): "temperature_mean"})
 
-    # aggregate temperatures
-    temp_df = temperature_data.to_frame("temp")
-    temp_groups = _matching_groups(meter_data_index, temp_df, tolerance)
-    temp_aggregations = temp_groups.agg({"temp": temp_agg_funcs})
-
-    # expand temp aggregations by faking and delete the `meter_value` column.
-    # I haven't yet figured out a way to avoid this and get the desired
-    # structure and behavior. (philngo)
-    meter_value = pd.DataFrame({"meter_value": 0}, index=meter_data_index)
-    df = pd.concat([meter_value, temp_aggregations], axis=1).rename(
-        columns=temp_agg_column_renames
+    # aggregate temperatures by meter period.
+    codes, index_codes = _matching_period_codes(
+        meter_data_index, temperature_data.index, tolerance
     )
-    del df["meter_value"]
+    matched = codes >= 0
+    temp_df = temperature_data[matched].to_frame("temp")
+    temp_aggregations = temp_df.groupby(codes[matched]).agg({"temp": temp_agg_funcs})
+    temp_aggregations.columns = [
+        temp_agg_column_renames[column] for column in temp_aggregations.columns
+    ]
+
+    df = temp_aggregations.reindex(index_codes)
+    df.index = meter_data_index
+
+    if data_quality:
+        not_null_counts, null_counts = _data_quality_counts(
+            temperature_data.values, codes, index_codes
+        )
+        df.insert(0, "temperature_not_null", not_null_counts)
+        df.insert(1, "temperature_null", null_counts)
 
     if df.empty:
         if "degree_day_columns" in df:
@@ -467,22 +980,200 @@ def compute_temperature_features(
     else:
         # expand degree_day_columns
         if "degree_day_columns" in df:
-            df = pd.concat(
-                [
-                    df.drop(["degree_day_columns"], axis=1),
-                    df["degree_day_columns"].dropna().apply(pd.Series),
-                ],
-                axis=1,
-            )
+            degree_day_columns = df["degree_day_columns"].dropna()
+            df = df.drop(["degree_day_columns"], axis=1)
+            # periods without temperatures have no degree day columns to add.
+            if not degree_day_columns.empty:
+                df = pd.concat([df, degree_day_columns.apply(pd.Series)], axis=1)
 
     if not keep_partial_nan_rows:
-        df = overwrite_partial_rows_with_nan(df)
+        df = overwrite_partial_rows_with_nan(df, inplace=True)
 
     return df
 
 
-def overwrite_partial_rows_with_nan(df):
-    return df.dropna().reindex(df.index)
+def _compute_daily_temperature_features(
+    temperature_data,
+    meter_data_index,
+    heating_balance_points,
+    cooling_balance_points,
+    data_quality,
+    temperature_mean,
+    percent_hourly_coverage_per_billing_period,
+    use_mean_daily_values,
+    tolerance,
+    keep_partial_nan_rows,
+):
+    # Inputs are assumed to have been checked by compute_temperature_features.
+    # Each temperature is the mean temperature of a day, so days need not be
+    # aggregated from hours, and all periods are summed at once by code.
+    codes, index_codes = _matching_period_codes(
+        meter_data_index, temperature_data.index, tolerance
+    )
+    matched = codes >= 0
+    matched_codes = codes[matched]
+    temps = temperature_data.values[matched].astype(np.float64)
+    not_null = ~np.isnan(temps)
+    n_codes = len(index_codes)
+
+    def _sum_by_period(values, days):
+        return np.bincount(matched_codes[days], weights=values, minlength=n_codes)[
+            index_codes
+        ]
+
+    n_days_total = _sum_by_period(None, slice(None))
+    n_days_not_null = _sum_by_period(None, not_null)
+    no_temperatures = n_days_total == 0
+
+    columns = []
+    if data_quality:
+        not_null_counts, null_counts = _data_quality_counts(
+            temperature_data.values, codes, index_codes
+        )
+        columns.append(("temperature_not_null", not_null_counts))
+        columns.append(("temperature_null", null_counts))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if temperature_mean:
+            temperature_sums = _sum_by_period(temps[not_null], not_null)
+            columns.append(("temperature_mean", temperature_sums / n_days_not_null))
+
+        # CalTrack 2.2.3.2
+        sufficient = (
+            n_days_not_null >= percent_hourly_coverage_per_billing_period * n_days_total
+        )
+        # rows of a period share its values, so look them up by code.
+        kept = not_null & sufficient[matched_codes]
+        kept_temps = temps[kept]
+        n_days_kept = _sum_by_period(None, kept)
+        n_days_dropped = n_days_total - n_days_kept
+        columns.append(("n_days_kept", np.where(no_temperatures, np.nan, n_days_kept)))
+        columns.append(
+            ("n_days_dropped", np.where(no_temperatures, np.nan, n_days_dropped))
+        )
+
+        if use_mean_daily_values:
+            n_days = 1
+        else:
+            n_days = n_days_total
+
+        # CalTrack 3.3.4.1.1
+        for bp in cooling_balance_points:
+            cdds = _sum_by_period(np.maximum(kept_temps - bp, 0), kept)
+            columns.append(("cdd_%s" % bp, cdds / n_days_kept * n_days))
+
+        # CalTrack 3.3.5.1.1
+        for bp in heating_balance_points:
+            hdds = _sum_by_period(np.maximum(bp - kept_temps, 0), kept)
+            columns.append(("hdd_%s" % bp, hdds / n_days_kept * n_days))
+
+    df = pd.DataFrame(
+        dict(columns), index=meter_data_index, columns=[c for c, _ in columns]
+    )
+
+    if not keep_partial_nan_rows:
+        df = overwrite_partial_rows_with_nan(df, inplace=True)
+
+    return df
+
+
+def _data_quality_counts(temperatures, codes, index_codes):
+    """ Count not-null and null temperatures in each meter period from the
+    period codes given by :any:`_matching_period_codes`. Periods without any
+    matching temperatures get ``numpy.nan`` counts.
+    """
+    matched = codes >= 0
+    matched_codes = codes[matched]
+    null = np.isnan(temperatures[matched])
+    n_codes = len(index_codes)
+    counts = np.bincount(matched_codes, minlength=n_codes)[index_codes]
+    null_counts = np.bincount(matched_codes, weights=null, minlength=n_codes)
+    null_counts = null_counts[index_codes].astype(float)
+    not_null_counts = counts - null_counts.astype(int)
+    if (counts > 0).all():
+        return not_null_counts, null_counts
+    no_temperatures = counts == 0
+    not_null_counts = not_null_counts.astype(float)
+    not_null_counts[no_temperatures] = np.nan
+    null_counts[no_temperatures] = np.nan
+    return not_null_counts, null_counts
+
+
+_COUNT_COLUMNS = (
+    "n_days_kept",
+    "n_days_dropped",
+    "n_hours_kept",
+    "n_hours_dropped",
+    "temperature_not_null",
+    "temperature_null",
+)
+
+
+def _astype_temperature_features(df, dtype, exclude=()):
+    """ Convert temperature feature columns to ``dtype`` and count columns to
+    ``int16`` where possible (see :any:`eemeter.compute_temperature_features`).
+    """
+    if dtype is None:
+        return df
+
+    int16_info = np.iinfo(np.int16)
+    column_dtypes = {}
+    for column in df.columns:
+        if column in exclude:
+            continue
+        values = df[column]
+        if (
+            column in _COUNT_COLUMNS
+            and len(values) > 0
+            and values.notnull().all()
+            and int16_info.min <= values.min()
+            and values.max() <= int16_info.max
+        ):
+            column_dtypes[column] = np.int16
+        else:
+            column_dtypes[column] = dtype
+    return df.astype(column_dtypes, copy=False)
+
+
+def overwrite_partial_rows_with_nan(df, inplace=False):
+    """ Overwrite every row that has any missing value with ``numpy.nan``.
+
+    Equivalent to ``df.dropna().reindex(df.index)``, but rows are masked in
+    place rather than dropped and reindexed, so at most one copy of ``df`` is
+    made (none if ``inplace=True``).
+
+    Parameters
+    ----------
+    df : :any:`pandas.DataFrame`
+        DataFrame in which to overwrite rows.
+    inplace : :any:`bool`, optional
+        If True, modify ``df`` rather than a copy.
+
+    Returns
+    -------
+    df : :any:`pandas.DataFrame`
+        DataFrame in which each row is either complete or entirely
+        ``numpy.nan``.
+    """
+    partial_rows = np.zeros(len(df), dtype=bool)
+    for column in df.columns:
+        partial_rows |= df[column].isnull().values
+
+    if not inplace:
+        df = df.copy()
+
+    if partial_rows.any():
+        for column in df.columns:
+            values = df[column]
+            if values.dtype.kind == "f":
+                values.values[partial_rows] = np.nan
+            else:
+                # upcast as reindexing would: int to float, bool to object.
+                if values.dtype.kind == "b":
+                    values = values.astype(object)
+                df[column] = values.where(~partial_rows)
+
+    return df
 
 
 def remove_duplicates(df_or_series):
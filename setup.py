@@ -69,7 +69,7 @@ setup(
     author=about["__author__"],
     author_email=about["__author_email__"],
     url=about["__url__"],
-    packages=find_packages(exclude=("tests",)),
+    packages=find_packages(exclude=("tests", "benchmarks")),
     entry_points={"console_scripts": ["eemeter=eemeter.cli:cli"]},
     install_requires=REQUIRED,
     include_package_data=True,
@@ -59,6 +59,14 @@ def test_candidate_model_with_no_plot_func():
         candidate_model.plot("a")
 
 
+def test_candidate_model_with_no_predict_func_compile():
+    candidate_model = CandidateModel(
+        model_type="model_type", formula="formula", status="status"
+    )
+    with pytest.raises(ValueError):
+        candidate_model.compile()
+
+
 def test_candidate_model_json_with_warning():
     eemeter_warning = EEMeterWarning(
         qualified_name="qualified_name", description="description", data={}
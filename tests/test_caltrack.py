@@ -1,4 +1,6 @@
 import json
+import pickle
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -6,14 +8,20 @@ import pytest
 
 from eemeter import (
     CandidateModel,
+    CompiledCaltrackModel,
     caltrack_method,
     caltrack_sufficiency_criteria,
+    caltrack_sufficiency_and_data,
+    caltrack_sufficiency_criteria_frame,
+    caltrack_sufficiency_criteria_from_frame,
     caltrack_metered_savings,
     caltrack_modeled_savings,
     get_baseline_data,
     merge_temperature_data,
 )
 from eemeter.caltrack import (
+    caltrack_method_rolling,
+    caltrack_method_sensitivity,
     get_intercept_only_candidate_models,
     get_too_few_non_zero_degree_day_warning,
     get_total_degree_day_too_low_warning,
@@ -21,8 +29,12 @@ from eemeter.caltrack import (
     get_parameter_p_value_too_high_warning,
     get_cdd_only_candidate_models,
     get_hdd_only_candidate_models,
+    get_single_cdd_only_candidate_model,
+    get_single_cdd_hdd_candidate_model,
     get_cdd_hdd_candidate_models,
+    get_change_point_candidate_model,
     caltrack_predict,
+    caltrack_predict_frame,
     select_best_candidate,
     _caltrack_predict_design_matrix,
 )
@@ -355,6 +367,57 @@ def test_caltrack_predict_cdd_hdd_with_design_matrix(
     assert round(prediction.temperature_mean.mean()) == 65.0
 
 
+def test_caltrack_predict_cdd_hdd_daily_temperature_data(
+    candidate_model_cdd_hdd, temperature_data, prediction_index, degree_day_method
+):
+    daily_temperature_data = temperature_data.resample("D").mean()
+    prediction = candidate_model_cdd_hdd.predict(
+        daily_temperature_data,
+        prediction_index,
+        degree_day_method,
+        with_disaggregated=True,
+    )
+    expected = candidate_model_cdd_hdd.predict(
+        temperature_data, prediction_index, degree_day_method, with_disaggregated=True
+    )
+    # the last period is a partial day of hourly data.
+    pd.testing.assert_frame_equal(prediction.iloc[:-1], expected.iloc[:-1])
+    with pytest.raises(ValueError):
+        candidate_model_cdd_hdd.predict(
+            daily_temperature_data, prediction_index, "hourly"
+        )
+
+
+def test_caltrack_predict_cdd_hdd_disaggregated_with_design_matrix(
+    candidate_model_cdd_hdd, temperature_data, prediction_index, degree_day_method
+):
+    prediction = candidate_model_cdd_hdd.predict(
+        temperature_data,
+        prediction_index,
+        degree_day_method,
+        with_disaggregated=True,
+        with_design_matrix=True,
+    )
+    assert list(prediction.columns) == [
+        "predicted_usage",
+        "base_load",
+        "heating_load",
+        "cooling_load",
+        "temperature_mean",
+        "n_days_kept",
+        "n_days_dropped",
+        "cdd_70",
+        "hdd_60",
+        "n_days",
+    ]
+    assert prediction.index.equals(prediction_index)
+    pd.testing.assert_series_equal(
+        prediction.base_load + prediction.heating_load + prediction.cooling_load,
+        prediction.predicted_usage,
+        check_names=False,
+    )
+
+
 @pytest.fixture
 def candidate_model_bad_model_type():
     return CandidateModel(
@@ -390,6 +453,190 @@ def test_caltrack_predict_empty(
     assert prediction.empty is True
 
 
+@pytest.fixture
+def model_params_frame():
+    return pd.DataFrame(
+        {
+            "model_type": ["intercept_only", "hdd_only", "cdd_only", "cdd_hdd"],
+            "intercept": [1, 1, 1, 1],
+            "beta_hdd": [None, 1, None, 1],
+            "heating_balance_point": [None, 60, None, 60],
+            "beta_cdd": [None, None, 1, 1],
+            "cooling_balance_point": [None, None, 65, 70],
+        },
+        index=pd.Index(["a", "b", "c", "d"], name="meter_id"),
+        columns=[
+            "model_type",
+            "intercept",
+            "beta_hdd",
+            "heating_balance_point",
+            "beta_cdd",
+            "cooling_balance_point",
+        ],
+    )
+
+
+def test_caltrack_predict_frame(
+    model_params_frame, temperature_data, prediction_index, degree_day_method
+):
+    prediction = caltrack_predict_frame(
+        model_params_frame, temperature_data, prediction_index, degree_day_method
+    )
+    assert list(prediction.columns) == ["a", "b", "c", "d"]
+    assert prediction.index.equals(prediction_index)
+    assert list(prediction.sum().round()) == [365.0, 974.0, 1733.0, 1582.0]
+
+    for meter_id, row in model_params_frame.iterrows():
+        model_params = row.drop("model_type").dropna().to_dict()
+        expected = caltrack_predict(
+            row.model_type,
+            model_params,
+            temperature_data,
+            prediction_index,
+            degree_day_method,
+            with_disaggregated=True,
+        )
+        assert np.allclose(
+            prediction[meter_id], expected.predicted_usage, equal_nan=True
+        )
+
+
+def test_caltrack_predict_frame_with_disaggregated(
+    model_params_frame, temperature_data, prediction_index, degree_day_method
+):
+    prediction = caltrack_predict_frame(
+        model_params_frame,
+        temperature_data,
+        prediction_index,
+        degree_day_method,
+        with_disaggregated=True,
+    )
+    assert list(prediction.columns.levels[0]) == [
+        "base_load",
+        "cooling_load",
+        "heating_load",
+        "predicted_usage",
+    ]
+    assert list(prediction["base_load"].sum().round()) == [365.0] * 4
+    assert list(prediction["heating_load"].sum().round()) == [0, 609.0, 0, 609.0]
+    assert list(prediction["cooling_load"].sum().round()) == [0, 0, 1368.0, 608.0]
+
+
+def test_caltrack_predict_frame_long_format(
+    model_params_frame, temperature_data, prediction_index, degree_day_method
+):
+    prediction = caltrack_predict_frame(
+        model_params_frame,
+        temperature_data,
+        prediction_index,
+        degree_day_method,
+        with_disaggregated=True,
+        long_format=True,
+    )
+    assert list(prediction.columns) == [
+        "predicted_usage",
+        "base_load",
+        "heating_load",
+        "cooling_load",
+    ]
+    assert list(prediction.index.names) == ["meter_id", None]
+    assert len(prediction) == 4 * len(prediction_index)
+    assert round(prediction.loc["d"].predicted_usage.sum()) == 1582.0
+
+
+def test_caltrack_predict_frame_missing_params(
+    model_params_frame, temperature_data, prediction_index, degree_day_method
+):
+    model_params_frame.loc["d", "beta_cdd"] = None
+    with pytest.raises(MissingModelParameterError):
+        caltrack_predict_frame(
+            model_params_frame, temperature_data, prediction_index, degree_day_method
+        )
+
+
+def test_caltrack_predict_frame_bad_model_type(
+    model_params_frame, temperature_data, prediction_index, degree_day_method
+):
+    model_params_frame.loc["d", "model_type"] = "unknown"
+    with pytest.raises(UnrecognizedModelTypeError):
+        caltrack_predict_frame(
+            model_params_frame, temperature_data, prediction_index, degree_day_method
+        )
+
+
+def test_caltrack_predict_frame_empty(
+    model_params_frame, temperature_data, prediction_index, degree_day_method
+):
+    prediction = caltrack_predict_frame(
+        model_params_frame,
+        temperature_data[:0],
+        prediction_index[:0],
+        degree_day_method,
+    )
+    assert prediction.empty is True
+    assert list(prediction.columns) == ["a", "b", "c", "d"]
+
+
+def test_candidate_model_compile(
+    candidate_model_cdd_hdd, temperature_data, prediction_index, degree_day_method
+):
+    prediction = candidate_model_cdd_hdd.predict(
+        temperature_data,
+        prediction_index,
+        degree_day_method,
+        with_disaggregated=True,
+        with_design_matrix=True,
+    )[:-1]
+    compiled_model = candidate_model_cdd_hdd.compile()
+    assert isinstance(compiled_model, CompiledCaltrackModel)
+    assert str(compiled_model) == "CompiledCaltrackModel(model_type='cdd_hdd')"
+
+    predicted_usage = compiled_model(
+        prediction.temperature_mean.values, prediction.n_days.values
+    )
+    assert np.allclose(predicted_usage, prediction.predicted_usage)
+    base_load, heating_load, cooling_load = compiled_model.disaggregated(
+        prediction.temperature_mean.values, prediction.n_days.values
+    )
+    assert np.allclose(base_load, prediction.base_load)
+    assert np.allclose(heating_load, prediction.heating_load)
+    assert np.allclose(cooling_load, prediction.cooling_load)
+
+    assert compiled_model(50.0) == 11
+    assert compiled_model(65) == 1
+    assert compiled_model(80.0, 0.5) == 5.5
+    assert compiled_model(np.array(80.0), 0.5) == 5.5
+
+
+def test_candidate_model_compile_pickle(candidate_model_cdd_hdd):
+    compiled_model = pickle.loads(pickle.dumps(candidate_model_cdd_hdd.compile()))
+    assert compiled_model.model_type == "cdd_hdd"
+    assert compiled_model(np.array([50.0, 80.0])).tolist() == [11, 11]
+    assert not hasattr(compiled_model, "__dict__")
+
+
+def test_candidate_model_compile_intercept_only():
+    compiled_model = CompiledCaltrackModel("intercept_only", {"intercept": 2})
+    assert compiled_model(np.nan) == 2
+    assert compiled_model(np.array([np.nan, 50.0]), 2).tolist() == [4, 4]
+    base_load, heating_load, cooling_load = compiled_model.disaggregated([50.0])
+    assert base_load.tolist() == [2]
+    assert heating_load.tolist() == [0]
+    assert cooling_load.tolist() == [0]
+
+
+def test_candidate_model_compile_missing_params():
+    with pytest.raises(MissingModelParameterError):
+        CompiledCaltrackModel("hdd_only", {"intercept": 2})
+
+
+def test_candidate_model_compile_bad_model_type():
+    with pytest.raises(UnrecognizedModelTypeError):
+        CompiledCaltrackModel("unknown", {"intercept": 2})
+    with pytest.raises(ValueError):
+        CompiledCaltrackModel(None, {"intercept": 2})
+
+
 @pytest.fixture
 def cdd_hdd_h53_c68_billing_monthly_totals(il_electricity_cdd_hdd_billing_monthly):
     meter_data = il_electricity_cdd_hdd_billing_monthly["meter_data"]
@@ -819,6 +1066,32 @@ def test_get_cdd_only_candidate_models_error():
     assert warning.data["traceback"] is not None
 
 
+def test_get_cdd_only_candidate_models_identical_columns():
+    data = pd.DataFrame(
+        {
+            "meter_value": [1, 1, 1, 6],
+            "cdd_65": [0, 0.1, 0, 5],
+            "cdd_70": [0, 0.1, 0, 5],
+            "cdd_75": [0, 0, 0, 0],
+            "cdd_80": [0, 0, 0, 0],
+        }
+    )
+    candidate_models = get_cdd_only_candidate_models(data, 1, 1, 0.1, None)
+    assert [model.formula for model in candidate_models] == [
+        "meter_value ~ cdd_65",
+        "meter_value ~ cdd_70",
+        "meter_value ~ cdd_75",
+        "meter_value ~ cdd_80",
+    ]
+    # identical columns are fit once
+    assert candidate_models[1].result is candidate_models[0].result
+    for balance_point, model in zip([65, 70, 75, 80], candidate_models):
+        expected = get_single_cdd_only_candidate_model(
+            data, 1, 1, 0.1, None, balance_point
+        )
+        assert model.json() == expected.json()
+
+
 def test_get_hdd_only_candidate_models_qualified(
     temperature_data, prediction_index, degree_day_method
 ):
@@ -1094,6 +1367,115 @@ def test_get_cdd_hdd_candidate_models_error():
     assert warning.data["traceback"] is not None
 
 
+def test_get_cdd_hdd_candidate_models_identical_columns():
+    data = pd.DataFrame(
+        {
+            "meter_value": [6, 1, 1, 6, 1, 1],
+            "cdd_65": [5, 0, 0.1, 0, 0, 0],
+            "cdd_70": [0, 0, 0, 0, 0, 0],
+            "cdd_75": [0, 0, 0, 0, 0, 0],
+            "hdd_60": [0, 0, 0.1, 4, 0.2, 0],
+            "hdd_65": [0, 0.1, 0.1, 5, 0.2, 0.3],
+            "hdd_70": [0, 0.1, 0.1, 5, 0.2, 0.3],
+        }
+    )
+    candidate_models = get_cdd_hdd_candidate_models(data, 0, 0, 0, 0, 1, 1, None)
+    assert len(candidate_models) == 8
+    # (70, 65), (70, 70), (75, 65) and (75, 70) are fit once
+    assert candidate_models[4].result is candidate_models[3].result
+    assert candidate_models[7].result is candidate_models[3].result
+    balance_points = [
+        (cooling_balance_point, heating_balance_point)
+        for cooling_balance_point in [65, 70, 75]
+        for heating_balance_point in [60, 65, 70]
+        if heating_balance_point <= cooling_balance_point
+    ]
+    for (cooling_balance_point, heating_balance_point), model in zip(
+        balance_points, candidate_models
+    ):
+        expected = get_single_cdd_hdd_candidate_model(
+            data, 0, 0, 0, 0, 1, 1, None, cooling_balance_point, heating_balance_point
+        )
+        assert model.json() == expected.json()
+
+    best_candidate, _ = select_best_candidate(candidate_models)
+    assert best_candidate is candidate_models[1]
+
+
+@pytest.fixture
+def change_point_baseline_data(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    blackout_start_date = il_electricity_cdd_hdd_daily["blackout_start_date"]
+    data = merge_temperature_data(
+        meter_data,
+        temperature_data,
+        heating_balance_points=range(40, 66),
+        cooling_balance_points=range(55, 81),
+    )
+    baseline_data, warnings = get_baseline_data(data, end=blackout_start_date)
+    return baseline_data
+
+
+@pytest.mark.parametrize("model_type", ["cdd_hdd", "hdd_only", "cdd_only"])
+def test_get_change_point_candidate_model(change_point_baseline_data, model_type):
+    candidate_model = get_change_point_candidate_model(
+        change_point_baseline_data,
+        model_type=model_type,
+        heating_balance_point_bounds=(40, 65),
+        cooling_balance_point_bounds=(55, 80),
+    )
+    assert candidate_model.model_type == model_type
+    assert candidate_model.status == "QUALIFIED"
+
+    # at least as good as the best qualified candidate on the integer grid
+    model_results = caltrack_method(change_point_baseline_data)
+    grid_r_squared_adj = max(
+        c.r_squared_adj
+        for c in model_results.candidates
+        if c.model_type == model_type and c.status == "QUALIFIED"
+    )
+    assert candidate_model.r_squared_adj >= grid_r_squared_adj
+
+    for key in ["heating_balance_point", "cooling_balance_point"]:
+        if key in candidate_model.model_params:
+            balance_point = candidate_model.model_params[key]
+            assert balance_point == round(balance_point, 2)
+
+
+def test_get_change_point_candidate_model_predict(
+    change_point_baseline_data, temperature_data, prediction_index, degree_day_method
+):
+    candidate_model = get_change_point_candidate_model(
+        change_point_baseline_data,
+        heating_balance_point_bounds=(40, 65),
+        cooling_balance_point_bounds=(55, 80),
+    )
+    assert candidate_model.model_params["heating_balance_point"] == 52.3
+    assert candidate_model.model_params["cooling_balance_point"] == 68.34
+    assert candidate_model.formula == ('meter_value ~ Q("cdd_68.34") + Q("hdd_52.3")')
+    prediction = candidate_model.predict(
+        temperature_data, prediction_index, degree_day_method
+    )
+    assert round(prediction.predicted_usage.sum(), 2) == 7206.91
+
+
+def test_get_change_point_candidate_model_insufficient_degree_days(
+    change_point_baseline_data
+):
+    candidate_model = get_change_point_candidate_model(
+        change_point_baseline_data, model_type="hdd_only", minimum_non_zero_hdd=10000
+    )
+    assert candidate_model.status == "NOT ATTEMPTED"
+
+
+def test_get_change_point_candidate_model_bad_model_type(change_point_baseline_data):
+    with pytest.raises(ValueError):
+        get_change_point_candidate_model(
+            change_point_baseline_data, model_type="intercept_only"
+        )
+
+
 @pytest.fixture
 def candidate_model_qualified_high_r2():
     return CandidateModel(
@@ -1211,6 +1593,199 @@ def test_caltrack_method_cdd_hdd_use_billing_presets(
     assert round(prediction.predicted_usage.sum(), 2) == 7059.48
 
 
+def test_caltrack_method_cdd_hdd_float32(cdd_hdd_h60_c65):
+    model_results = caltrack_method(cdd_hdd_h60_c65)
+    model_results_compact = caltrack_method(
+        cdd_hdd_h60_c65.astype({"hdd_60": "float32", "cdd_65": "float32"})
+    )
+    model_params = model_results.model.model_params
+    for key, value in model_results_compact.model.model_params.items():
+        assert value == pytest.approx(model_params[key], rel=1e-6)
+
+
+def test_caltrack_method_fractional_balance_points(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    blackout_start_date = il_electricity_cdd_hdd_daily["blackout_start_date"]
+    data = merge_temperature_data(
+        meter_data,
+        temperature_data,
+        heating_balance_points=[55, 60.5],
+        cooling_balance_points=[65, 70.5],
+    )
+    baseline_data, warnings = get_baseline_data(data, end=blackout_start_date)
+    model_results = caltrack_method(baseline_data)
+    assert len(model_results.candidates) == 9
+    assert [candidate.formula for candidate in model_results.candidates[1:5]] == [
+        "meter_value ~ hdd_55",
+        'meter_value ~ Q("hdd_60.5")',
+        "meter_value ~ cdd_65",
+        'meter_value ~ Q("cdd_70.5")',
+    ]
+    assert model_results.model.status == "QUALIFIED"
+
+    rolling = list(caltrack_method_rolling(data, window=365))
+    assert len(rolling) == len(data) - 365
+
+
+def test_caltrack_method_partial_rows_after_merge(cdd_hdd_h60_c65):
+    data = cdd_hdd_h60_c65.copy()
+    data.loc[data.index[::7], "cdd_65"] = np.nan
+    expected = data.dropna().reindex(data.index)
+    model_results = caltrack_method(data)
+    expected_results = caltrack_method(expected)
+    assert model_results.json(with_candidates=True) == expected_results.json(
+        with_candidates=True
+    )
+    sensitivity = caltrack_method_sensitivity(data, [{}])
+    assert sensitivity[0].json(with_candidates=True) == expected_results.json(
+        with_candidates=True
+    )
+
+
+def test_caltrack_method_rolling(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    data = merge_temperature_data(
+        meter_data,
+        temperature_data,
+        heating_balance_points=[55, 60, 65],
+        cooling_balance_points=[60, 65, 70],
+    )
+    rolling = list(caltrack_method_rolling(data, window=365))
+    assert len(rolling) == len(data) - 365
+
+    for baseline_end, model_results in rolling[::200]:
+        baseline_data, _ = get_baseline_data(data, end=baseline_end, max_days=365)
+        expected = caltrack_method(baseline_data)
+        assert model_results.status == expected.status
+        assert model_results.model.formula == expected.model.formula
+        assert [c.status for c in model_results.candidates] == [
+            c.status for c in expected.candidates
+        ]
+        assert model_results.r_squared_adj == pytest.approx(expected.r_squared_adj)
+        for key, value in expected.model.model_params.items():
+            assert model_results.model.model_params[key] == pytest.approx(value)
+        assert model_results.metrics.cvrmse_adj == pytest.approx(
+            expected.metrics.cvrmse_adj
+        )
+
+
+def test_caltrack_method_rolling_tied_candidates(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    data = merge_temperature_data(
+        meter_data,
+        temperature_data,
+        heating_balance_points=[50, 55, 60, 65, 70],
+        cooling_balance_points=[60, 65, 70, 75],
+    )
+    # short windows in which all temperatures are below (or above) several
+    # balance points give candidates with tied r-squared values.
+    rolling = list(caltrack_method_rolling(data, window=30))
+    n_matched = 0
+    for baseline_end, model_results in rolling[::15]:
+        baseline_data, _ = get_baseline_data(data, end=baseline_end, max_days=30)
+        expected = caltrack_method(baseline_data)
+        if model_results.model.formula == expected.model.formula:
+            n_matched += 1
+            continue
+        # otherwise, the refit broke a tie by rounding error.
+        (refit,) = [
+            candidate
+            for candidate in expected.candidates
+            if candidate.formula == model_results.model.formula
+        ]
+        assert refit.r_squared_adj == pytest.approx(
+            expected.model.r_squared_adj, rel=1e-9
+        )
+        assert model_results.candidates.index(
+            model_results.model
+        ) < expected.candidates.index(expected.model)
+    assert n_matched > len(rolling[::15]) * 0.9
+
+
+def test_caltrack_method_rolling_small_window(cdd_hdd_h60_c65):
+    rolling = list(caltrack_method_rolling(cdd_hdd_h60_c65, window=3))
+    baseline_end, model_results = rolling[0]
+    assert baseline_end == cdd_hdd_h60_c65.index[3]
+    assert model_results.status == "SUCCESS"
+    assert model_results.model.model_type == "intercept_only"
+
+
+def test_caltrack_method_rolling_bad_window(cdd_hdd_h60_c65):
+    with pytest.raises(ValueError):
+        list(caltrack_method_rolling(cdd_hdd_h60_c65, window=0))
+
+
+def test_caltrack_method_sensitivity(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    blackout_start_date = il_electricity_cdd_hdd_daily["blackout_start_date"]
+    data = merge_temperature_data(
+        meter_data,
+        temperature_data,
+        heating_balance_points=[50, 55, 60, 65],
+        cooling_balance_points=[60, 65, 70, 90],
+    )
+    baseline_data, warnings = get_baseline_data(data, end=blackout_start_date)
+    settings = [
+        {},
+        {"use_billing_presets": True},
+        {"minimum_non_zero_cdd": 1000},
+        {"minimum_non_zero_cdd": 1000, "minimum_non_zero_hdd": 1000},
+    ]
+    model_results = caltrack_method_sensitivity(baseline_data, settings)
+    assert len(model_results) == 4
+    for run_settings, model_result in zip(settings, model_results):
+        expected = caltrack_method(baseline_data, **run_settings)
+        assert model_result.json(with_candidates=True) == expected.json(
+            with_candidates=True
+        )
+    assert [model_result.model.model_type for model_result in model_results] == [
+        "cdd_hdd",
+        "cdd_hdd",
+        "hdd_only",
+        "intercept_only",
+    ]
+
+
+def test_caltrack_method_sensitivity_fractional_balance_points(
+    il_electricity_cdd_hdd_daily
+):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    blackout_start_date = il_electricity_cdd_hdd_daily["blackout_start_date"]
+    data = merge_temperature_data(
+        meter_data,
+        temperature_data,
+        heating_balance_points=[55, 60.5],
+        cooling_balance_points=[65, 70.5],
+    )
+    baseline_data, warnings = get_baseline_data(data, end=blackout_start_date)
+    settings = [{}, {"minimum_non_zero_cdd": 1000}]
+    model_results = caltrack_method_sensitivity(baseline_data, settings)
+    for run_settings, model_result in zip(settings, model_results):
+        expected = caltrack_method(baseline_data, **run_settings)
+        assert model_result.json(with_candidates=True) == expected.json(
+            with_candidates=True
+        )
+
+
+def test_caltrack_method_sensitivity_no_data():
+    data = pd.DataFrame({"meter_value": [], "hdd_60": [], "cdd_65": []})
+    model_results = caltrack_method_sensitivity(data, [{}, {}])
+    assert [model_result.status for model_result in model_results] == [
+        "NO DATA",
+        "NO DATA",
+    ]
+
+
+def test_caltrack_method_sensitivity_bad_settings(cdd_hdd_h60_c65):
+    with pytest.raises(ValueError):
+        caltrack_method_sensitivity(cdd_hdd_h60_c65, [{"fit_cdd": False}])
+
+
 # When model is intercept-only, num_parameters should = 0 with cvrmse = cvrmse_adj
 def test_caltrack_method_num_parameters_equals_zero():
     data = pd.DataFrame(
@@ -1570,6 +2145,97 @@ def test_caltrack_sufficiency_criteria_handle_single_input():
     assert len(data_sufficiency.warnings) == 3
 
 
+@pytest.mark.parametrize(
+    "sample_fixture,kwargs",
+    [
+        ("il_electricity_cdd_hdd_daily", {}),
+        ("il_electricity_cdd_hdd_billing_monthly", {"dtype": "float32"}),
+    ],
+)
+def test_caltrack_sufficiency_and_data(request, sample_fixture, kwargs):
+    sample = request.getfixturevalue(sample_fixture)
+    meter_data = sample["meter_data"]
+    temperature_data = sample["temperature_data"].copy()
+    temperature_data.iloc[3000:4000] = np.nan
+    balance_points = dict(heating_balance_points=[55, 60], cooling_balance_points=[65])
+
+    data_sufficiency, data = caltrack_sufficiency_and_data(
+        meter_data, temperature_data, None, None, **dict(balance_points, **kwargs)
+    )
+
+    data_quality = merge_temperature_data(
+        meter_data, temperature_data, data_quality=True, temperature_mean=False
+    )
+    expected_sufficiency = caltrack_sufficiency_criteria(data_quality, None, None)
+    assert data_sufficiency.json() == expected_sufficiency.json()
+    assert data_sufficiency.status == "FAIL"
+
+    expected_data = merge_temperature_data(
+        meter_data, temperature_data, **dict(balance_points, **kwargs)
+    )
+    pd.testing.assert_frame_equal(data, expected_data)
+
+
+def test_caltrack_sufficiency_criteria_frame(
+    il_electricity_cdd_hdd_daily, il_electricity_cdd_hdd_billing_monthly
+):
+    requested_start = pd.Timestamp("2016-01-01", tz="UTC")
+    requested_end = pd.Timestamp("2017-01-01", tz="UTC")
+
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"].copy()
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    meter_data.iloc[5:8] = -1
+    meter_data.iloc[20:60] = np.nan
+    meters = {
+        "daily": (meter_data, None, None),
+        "daily_requested": (meter_data, requested_start, requested_end),
+        "daily_baseline": (
+            get_baseline_data(meter_data, end=requested_end)[0],
+            None,
+            requested_end,
+        ),
+        "billing": (
+            il_electricity_cdd_hdd_billing_monthly["meter_data"],
+            requested_start,
+            None,
+        ),
+    }
+
+    frames, expected = [], {}
+    for meter_id, (meter_data, start, end) in meters.items():
+        data_quality = merge_temperature_data(
+            meter_data, temperature_data, data_quality=True, temperature_mean=False
+        )
+        expected[meter_id] = caltrack_sufficiency_criteria(data_quality, start, end)
+        frames.append(data_quality.assign(meter_id=meter_id).reset_index())
+    data = pd.concat(frames).sample(frac=1, random_state=0)
+
+    with warnings.catch_warnings():
+        # missing meter values are expected and shouldn't raise warnings.
+        warnings.simplefilter("error", RuntimeWarning)
+        sufficiency = caltrack_sufficiency_criteria_frame(
+            data,
+            pd.Series({meter_id: start for meter_id, (_, start, _) in meters.items()}),
+            pd.Series({meter_id: end for meter_id, (_, _, end) in meters.items()}),
+        )
+    assert sorted(sufficiency.index) == sorted(meters)
+    assert sufficiency.status.to_dict() == {
+        "billing": "FAIL",
+        "daily": "FAIL",
+        "daily_baseline": "PASS",
+        "daily_requested": "FAIL",
+    }
+    assert sufficiency.negative_meter_values.sum() == 2
+    assert sufficiency.loc["daily_requested", "n_days_total"] == 809
+
+    for meter_id in meters:
+        data_sufficiency = caltrack_sufficiency_criteria_from_frame(
+            sufficiency, meter_id
+        )
+        assert data_sufficiency.json() == expected[meter_id].json()
+        assert json.dumps(data_sufficiency.json())
+
+
 @pytest.fixture
 def baseline_model(cdd_hdd_h60_c65):
     model_results = caltrack_method(cdd_hdd_h60_c65)
@@ -1664,6 +2330,30 @@ def test_caltrack_metered_savings_cdd_hdd_with_disaggregated(
     ]
 
 
+def test_caltrack_metered_savings_cdd_hdd_partial_rows(
+    baseline_model, reporting_meter_data, reporting_temperature_data
+):
+    reporting_meter_data.value.iloc[10] = np.nan
+    results = caltrack_metered_savings(
+        baseline_model,
+        reporting_meter_data,
+        reporting_temperature_data,
+        degree_day_method="daily",
+        with_disaggregated=True,
+    )
+    assert results.index.equals(reporting_meter_data.index)
+    # rows missing any value are entirely null, including the last.
+    assert results.isnull().all(axis=1).tolist() == [i in (10, 59) for i in range(60)]
+    loads = (
+        results.counterfactual_base_load
+        + results.counterfactual_heating_load
+        + results.counterfactual_cooling_load
+    )
+    pd.testing.assert_series_equal(
+        loads, results.counterfactual_usage, check_names=False
+    )
+
+
 def test_caltrack_modeled_savings_cdd_hdd(
     baseline_model, reporting_model, reporting_meter_data, reporting_temperature_data
 ):
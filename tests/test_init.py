@@ -0,0 +1,74 @@
+import subprocess
+import sys
+
+import pytest
+
+import eemeter
+
+# generous compared to the ~30ms this takes on a laptop, but well below the
+# cost of importing pandas or statsmodels.
+IMPORT_TIME_BUDGET_SECONDS = 0.3
+
+
+def _run_python(*args):
+    return subprocess.run(
+        [sys.executable] + list(args),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+
+def test_lazy_attributes():
+    from eemeter.caltrack import caltrack_method
+    from eemeter.transform import merge_temperature_data
+
+    assert eemeter.caltrack_method is caltrack_method
+    assert eemeter.merge_temperature_data is merge_temperature_data
+    assert "caltrack_method" in dir(eemeter)
+
+
+def test_lazy_submodule():
+    assert eemeter.caltrack.__name__ == "eemeter.caltrack"
+
+
+def test_samples_not_shadowed_by_subpackage():
+    import eemeter.samples.load
+
+    assert callable(eemeter.samples)
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        eemeter.not_an_attribute
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="requires PEP 562")
+def test_import_does_not_load_heavy_dependencies():
+    result = _run_python(
+        "-c",
+        "import sys, eemeter; print(' '.join(sorted("
+        "m for m in ('pandas', 'statsmodels', 'pkg_resources', 'matplotlib')"
+        " if m in sys.modules)))",
+    )
+    assert result.stdout.strip() == ""
+
+
+def _import_time_seconds():
+    result = _run_python("-X", "importtime", "-c", "import eemeter")
+    # lines look like "import time:   self [us] | cumulative | imported package"
+    cumulative_us = [
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.split("|")[-1].strip() == "eemeter"
+    ]
+    assert len(cumulative_us) == 1
+    return cumulative_us[0] / 1e6
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="requires -X importtime")
+def test_import_time_budget():
+    # best of several runs to be robust to a busy machine (e.g., pytest -n auto)
+    import_time = min(_import_time_seconds() for _ in range(5))
+    assert import_time < IMPORT_TIME_BUDGET_SECONDS
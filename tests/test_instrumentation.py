@@ -0,0 +1,118 @@
+import json
+
+import pandas as pd
+import pytest
+
+from eemeter import (
+    Timings,
+    caltrack_method,
+    merge_temperature_data,
+    record_timings,
+    register_timing_hook,
+    unregister_timing_hook,
+)
+from eemeter.instrumentation import _NULL_TIMER, current_timings, timed
+
+
+@pytest.fixture
+def merge_and_fit(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+
+    def _merge_and_fit():
+        data = merge_temperature_data(
+            meter_data,
+            temperature_data,
+            heating_balance_points=[60, 61],
+            cooling_balance_points=[65, 66],
+        )
+        return caltrack_method(data)
+
+    return _merge_and_fit
+
+
+def test_timings_disabled_by_default(merge_and_fit):
+    assert timed("stage") is _NULL_TIMER
+    model_results = merge_and_fit()
+    assert model_results.timings is None
+
+
+def test_record_timings(merge_and_fit):
+    with record_timings() as timings:
+        assert timed("stage") is not _NULL_TIMER
+        model_results = merge_and_fit()
+
+    assert current_timings() is None
+    assert model_results.timings is not timings
+    assert list(model_results.timings.stages) == [
+        "compute_temperature_features",
+        "caltrack_method.intercept_only",
+        "caltrack_method.hdd_only",
+        "caltrack_method.cdd_only",
+        "caltrack_method.cdd_hdd",
+        "select_best_candidate",
+        "ModelMetrics",
+    ]
+    for stage, (seconds, count) in model_results.timings.stages.items():
+        assert seconds >= 0
+        assert count == 1
+
+    flat = model_results.timings.flat(prefix="eemeter")
+    assert flat["eemeter.select_best_candidate.count"] == 1
+    assert len(flat) == 14
+    assert json.dumps(model_results.timings.json()) is not None
+    assert repr(model_results.timings).startswith("Timings(")
+
+
+def test_record_timings_nested(merge_and_fit):
+    with record_timings() as outer:
+        merge_and_fit()
+        with record_timings() as inner:
+            model_results = merge_and_fit()
+    assert outer.stages["ModelMetrics"][1] == 2
+    assert inner.stages["ModelMetrics"][1] == 1
+    assert model_results.timings.stages["ModelMetrics"][1] == 1
+
+
+def test_timings_merge():
+    timings = Timings()
+    timings.add("a", 1.0)
+    other = Timings()
+    other.add("a", 2.0)
+    other.add("b", 0.5, count=3)
+    timings.merge(other)
+    assert timings.json() == {
+        "a": {"seconds": 3.0, "count": 2},
+        "b": {"seconds": 0.5, "count": 3},
+    }
+    assert timings.flat() == {
+        "a.seconds": 3.0,
+        "a.count": 2,
+        "b.seconds": 0.5,
+        "b.count": 3,
+    }
+
+
+def test_timing_hook(merge_and_fit):
+    calls = []
+
+    def hook(stage, seconds):
+        calls.append(stage)
+
+    register_timing_hook(hook)
+    try:
+        model_results = merge_and_fit()
+    finally:
+        unregister_timing_hook(hook)
+
+    assert model_results.timings is None
+    assert "select_best_candidate" in calls
+    assert timed("stage") is _NULL_TIMER
+
+
+def test_timed_records_on_exception():
+    with record_timings() as timings:
+        with pytest.raises(ValueError):
+            with timed("failing"):
+                raise ValueError()
+    assert timings.stages["failing"][1] == 1
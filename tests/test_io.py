@@ -126,6 +126,18 @@ def test_temperature_data_from_csv_gzipped(sample_metadata):
     assert temperature_data.index.freq is None
 
 
+def test_temperature_data_from_csv_dtype(sample_metadata):
+    meter_item = sample_metadata["il-electricity-cdd-hdd-daily"]
+    temperature_filename = meter_item["temperature_filename"]
+
+    with resource_stream("eemeter.samples", temperature_filename) as f:
+        temperature_data = temperature_data_from_csv(
+            f, gzipped=True, freq="hourly", dtype="float32"
+        )
+    assert temperature_data.dtype == "float32"
+    assert temperature_data.index.freq == "H"
+
+
 def test_temperature_data_from_csv_hourly_freq(sample_metadata):
     meter_item = sample_metadata["il-electricity-cdd-hdd-daily"]
     temperature_filename = meter_item["temperature_filename"]
@@ -157,6 +169,13 @@ def test_temperature_data_from_json_orient_list(sample_metadata):
     assert temperature_data.index.freq is None
 
 
+def test_temperature_data_from_json_dtype(sample_metadata):
+    data = [["2017-01-01T00:00:00Z", 11], ["2017-01-02T00:00:00Z", 10]]
+    temperature_data = temperature_data_from_json(data, dtype="float32")
+    assert temperature_data.dtype == "float32"
+    assert temperature_data.index.tz.zone == "UTC"
+
+
 def test_temperature_data_from_json_bad_orient(sample_metadata):
     data = [["2017-01-01T00:00:00Z", 11], ["2017-01-02T00:00:00Z", 10]]
     with pytest.raises(ValueError):
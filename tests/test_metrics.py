@@ -3,7 +3,12 @@ import pytest
 import pandas as pd
 import numpy as np
 
-from eemeter import ModelMetrics
+from eemeter import (
+    MetricsAccumulator,
+    ModelMetrics,
+    SavingsAccumulator,
+    compute_metrics_frame,
+)
 from eemeter.metrics import (
     _compute_r_squared,
     _compute_r_squared_adj,
@@ -101,6 +106,66 @@ def test_ModelMetrics_inputs_unchanged(sample_data):
     assert sample_data[1].name == "NameTwo"
 
 
+@pytest.fixture
+def sample_data_random():
+    index = pd.date_range("2018-01-01", periods=100, freq="D", tz="UTC")
+    random = np.random.RandomState(1)
+    observed = pd.Series(random.randint(0, 6, 100).astype(float), index=index)
+    predicted = pd.Series(random.rand(100) * 5, index=index)
+    observed.iloc[[3, 50]] = np.nan
+    predicted.iloc[[3, 50]] = np.nan
+    return observed, predicted
+
+
+def test_ModelMetrics_matches_pandas(sample_data_random):
+    observed, predicted = sample_data_random
+    model_metrics = ModelMetrics(observed, predicted, num_parameters=2, autocorr_lags=2)
+    combined = pd.DataFrame({"observed": observed, "predicted": predicted}).dropna()
+    combined["residuals"] = combined.predicted - combined.observed
+    no_observed_zeros = combined[combined.observed > 0]
+    assert model_metrics.merged_length == 98
+    assert model_metrics.observed_mean == pytest.approx(combined.observed.mean())
+    assert model_metrics.observed_skew == pytest.approx(combined.observed.skew())
+    assert model_metrics.predicted_kurtosis == pytest.approx(
+        combined.predicted.kurtosis()
+    )
+    assert model_metrics.predicted_cvstd == pytest.approx(
+        combined.predicted.std() / combined.predicted.mean()
+    )
+    assert model_metrics.r_squared == pytest.approx(_compute_r_squared(combined))
+    assert model_metrics.cvrmse_adj == pytest.approx(
+        _compute_cvrmse_adj(combined, 98, 2)
+    )
+    assert np.isinf(model_metrics.mape)
+    assert model_metrics.mape_no_zeros == pytest.approx(
+        _compute_mape(no_observed_zeros)
+    )
+    assert model_metrics.num_meter_zeros == (combined.observed == 0).sum()
+    assert model_metrics.nmae == pytest.approx(_compute_nmae(combined))
+    assert model_metrics.nmbe == pytest.approx(_compute_nmbe(combined))
+    assert model_metrics.autocorr_resid == pytest.approx(
+        _compute_autocorr_resid(combined, 2)
+    )
+
+
+def test_ModelMetrics_unaligned_index(sample_data_random):
+    observed, predicted = sample_data_random
+    aligned = ModelMetrics(observed, predicted)
+    unaligned = ModelMetrics(observed, predicted.iloc[::-1])
+    assert unaligned.merged_length == 98
+    assert unaligned.json() == aligned.json()
+
+
+def test_ModelMetrics_constant_series():
+    model_metrics = ModelMetrics(pd.Series([2.0] * 5), pd.Series([2.0] * 5))
+    assert model_metrics.observed_skew == 0
+    assert model_metrics.observed_kurtosis == 0
+    assert np.isnan(model_metrics.r_squared)
+    assert np.isnan(model_metrics.autocorr_resid)
+    assert model_metrics.cvrmse == 0
+    json.dumps(model_metrics.json())
+
+
 @pytest.fixture
 def model_metrics(sample_data):
     series_one, series_two = sample_data
@@ -207,3 +272,152 @@ def test_json_safe_float():
 
     with pytest.raises(Exception):
         _json_safe_float("not a number")
+
+
+@pytest.fixture
+def long_format_data(sample_data_random):
+    observed, predicted = sample_data_random
+    random = np.random.RandomState(2)
+    meters = []
+    for meter_id, n in [("a", 100), ("b", 40), ("c", 3), ("d", 1)]:
+        meters.append(
+            pd.DataFrame(
+                {
+                    "meter_id": meter_id,
+                    "observed": observed.values[:n],
+                    "predicted": predicted.values[:n] * random.rand(n),
+                },
+                index=observed.index[:n],
+            )
+        )
+    # interleave meters, keeping each in time order.
+    return pd.concat(meters).sort_index(kind="mergesort")
+
+
+def test_compute_metrics_frame(long_format_data):
+    metrics = compute_metrics_frame(long_format_data, num_parameters=2, autocorr_lags=2)
+    assert list(metrics.index) == ["a", "b", "c", "d"]
+    assert metrics.index.name == "meter_id"
+    for meter_id, data in long_format_data.groupby("meter_id"):
+        expected = ModelMetrics(
+            data.observed, data.predicted, num_parameters=2, autocorr_lags=2
+        )
+        for key, value in expected.json().items():
+            if value is None or np.isnan(value):
+                assert not np.isfinite(metrics.loc[meter_id, key])
+            else:
+                assert metrics.loc[meter_id, key] == pytest.approx(value)
+
+
+def test_compute_metrics_frame_options(long_format_data):
+    data = long_format_data.rename(
+        columns={"meter_id": "id", "observed": "obs", "predicted": "pred"}
+    ).set_index("id", append=True)
+    num_parameters = pd.Series([0, 1, 2, 0], index=["d", "c", "b", "a"])
+    metrics = compute_metrics_frame(
+        data,
+        meter_id_column="id",
+        observed_column="obs",
+        predicted_column="pred",
+        num_parameters=num_parameters,
+    )
+    expected = ModelMetrics(
+        long_format_data.observed[long_format_data.meter_id == "b"],
+        long_format_data.predicted[long_format_data.meter_id == "b"],
+        num_parameters=2,
+    )
+    assert metrics.loc["b", "cvrmse_adj"] == pytest.approx(expected.cvrmse_adj)
+    assert metrics.loc["b", "merged_length"] == 39
+
+
+def test_compute_metrics_frame_errors(long_format_data):
+    with pytest.raises(ValueError):
+        compute_metrics_frame(long_format_data, num_parameters=-1)
+    with pytest.raises(ValueError):
+        compute_metrics_frame(long_format_data, autocorr_lags=0)
+
+
+def _assert_same_metrics(model_metrics, expected):
+    for key, value in expected.json().items():
+        if value is None or np.isnan(value):
+            assert model_metrics.json()[key] is None
+        else:
+            assert model_metrics.json()[key] == pytest.approx(value)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 30, 200])
+def test_metrics_accumulator_update(sample_data_random, chunk_size):
+    observed, predicted = sample_data_random
+    accumulator = MetricsAccumulator(autocorr_lags=3)
+    for start in range(0, len(observed), chunk_size):
+        end = start + chunk_size
+        accumulator.update(observed.iloc[start:end], predicted.iloc[start:end])
+    assert accumulator.observed_length == 98
+    _assert_same_metrics(
+        accumulator.model_metrics(num_parameters=2),
+        ModelMetrics(observed, predicted, num_parameters=2, autocorr_lags=3),
+    )
+
+
+def test_metrics_accumulator_merge(sample_data_random):
+    observed, predicted = sample_data_random
+    # e.g., one accumulator per worker, each with consecutive chunks of data.
+    workers = []
+    for start, end in [(0, 10), (10, 11), (11, 12), (12, 60), (60, 100)]:
+        accumulator = MetricsAccumulator(autocorr_lags=2)
+        accumulator.update(observed.iloc[start:end], predicted.iloc[start:end])
+        workers.append(accumulator)
+    workers[1].merge(workers[2])
+    workers[3].merge(workers[4])
+    workers[0].merge(workers[1])
+    workers[0].merge(workers[3])
+    _assert_same_metrics(
+        workers[0].model_metrics(), ModelMetrics(observed, predicted, autocorr_lags=2)
+    )
+    assert repr(workers[0]) == "MetricsAccumulator(merged_length=98, autocorr_lags=2)"
+
+
+def test_metrics_accumulator_errors(sample_data_random):
+    observed, predicted = sample_data_random
+    with pytest.raises(ValueError):
+        MetricsAccumulator(autocorr_lags=0)
+    with pytest.raises(ValueError):
+        MetricsAccumulator(autocorr_lags=1).merge(MetricsAccumulator(autocorr_lags=2))
+
+    accumulator = MetricsAccumulator()
+    accumulator.update(observed, predicted.fillna(0))
+    with pytest.raises(ValueError):
+        accumulator.model_metrics()
+    accumulator.update(observed.fillna(0), predicted)
+    with pytest.raises(ValueError):
+        accumulator.model_metrics(num_parameters=-1)
+    assert accumulator.model_metrics().merged_length == 196
+
+
+def test_metrics_accumulator_empty():
+    model_metrics = MetricsAccumulator().model_metrics()
+    assert model_metrics.merged_length == 0
+    assert json.dumps(model_metrics.json()) is not None
+
+
+def test_savings_accumulator():
+    results = pd.DataFrame(
+        {
+            "reporting_observed": [1.0, 2.0, np.nan, 4.0],
+            "counterfactual_usage": [2.0, 3.0, np.nan, 4.5],
+            "metered_savings": [1.0, 1.0, np.nan, 0.5],
+        },
+        columns=["reporting_observed", "counterfactual_usage", "metered_savings"],
+    )
+    first, second = SavingsAccumulator(), SavingsAccumulator()
+    first.update(results.iloc[:2])
+    second.update(results.iloc[2:])
+    first.merge(second)
+    assert list(first.totals.keys()) == list(results.columns)
+    assert first.totals["metered_savings"] == 2.5
+    assert first.counts["metered_savings"] == 3
+    assert first.json()["counterfactual_usage"] == {"total": 9.5, "count": 3}
+    assert repr(first) == (
+        "SavingsAccumulator(reporting_observed=7.0, counterfactual_usage=9.5, "
+        "metered_savings=2.5)"
+    )
@@ -86,3 +86,61 @@ def test_load_sample_billing_monthly():
 def test_load_sample_unknown():
     with pytest.raises(ValueError):
         load_sample("unknown")
+
+
+def test_load_sample_memoized():
+    meter_data, temperature_data, metadata = load_sample("il-electricity-cdd-hdd-daily")
+    meter_data.value[:] = 0
+    metadata["freq"] = "modified"
+
+    meter_data2, temperature_data2, metadata2 = load_sample(
+        "il-electricity-cdd-hdd-daily"
+    )
+    assert meter_data2.value.sum() > 0
+    assert metadata2["freq"] == "daily"
+    assert meter_data2.index.freq == "D"
+    assert temperature_data2.equals(temperature_data)
+
+
+def test_load_sample_memoized_index_not_shared():
+    _, temperature_data, _ = load_sample("il-electricity-cdd-hdd-hourly")
+    expected = temperature_data.copy()
+    temperature_data.index.freq = None
+    temperature_data.values[:] = 0
+
+    _, temperature_data2, _ = load_sample("il-electricity-cdd-hdd-hourly")
+    assert temperature_data2.index.freq == "H"
+    assert temperature_data2.equals(expected)
+
+
+def test_load_sample_disk_cache(tmpdir):
+    from eemeter.samples import load
+
+    load._data_cache.clear()
+    cache_dir = str(tmpdir.join("cache"))
+    meter_data, temperature_data, _ = load_sample(
+        "il-electricity-cdd-hdd-hourly", cache_dir=cache_dir
+    )
+    load._data_cache.clear()
+    assert len(tmpdir.join("cache").listdir()) == 2
+
+    meter_data2, temperature_data2, _ = load_sample(
+        "il-electricity-cdd-hdd-hourly", cache_dir=cache_dir
+    )
+    assert meter_data2.equals(meter_data)
+    assert meter_data2.index.freq == "H"
+    assert meter_data2.index.name == meter_data.index.name
+    assert str(meter_data2.index.tz) == "UTC"
+    assert temperature_data2.equals(temperature_data)
+    assert temperature_data2.name == temperature_data.name
+    assert temperature_data2.index.freq == "H"
+
+
+def test_load_sample_disk_cache_env(tmpdir, monkeypatch):
+    from eemeter.samples import load
+
+    load._data_cache.clear()
+    monkeypatch.setenv("EEMETER_SAMPLE_CACHE_DIR", str(tmpdir))
+    meter_data, _, _ = load_sample("il-gas-hdd-only-billing_monthly")
+    assert meter_data.index.freq is None
+    assert len(tmpdir.listdir()) == 2
@@ -0,0 +1,126 @@
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eemeter import SharedTemperatureData
+
+requires_shared_memory = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="requires multiprocessing.shared_memory"
+)
+
+
+@pytest.fixture
+def temperature_data():
+    index = pd.date_range(
+        "2017-01-01", periods=1000, freq="H", tz="America/Chicago", name="dt"
+    )
+    return pd.Series(np.arange(1000.0), index=index, name="tempF")
+
+
+def _sum_temperatures(shared, key):
+    return shared[key].sum()
+
+
+@pytest.mark.skipif(
+    sys.version_info >= (3, 8), reason="multiprocessing.shared_memory available"
+)
+def test_shared_temperature_data_requires_shared_memory(temperature_data):
+    with pytest.raises(ImportError):
+        SharedTemperatureData({"a": temperature_data})
+
+
+@requires_shared_memory
+def test_shared_temperature_data(temperature_data):
+    daily_temperature_data = temperature_data.resample("D").mean()
+    with SharedTemperatureData({"a": temperature_data}) as shared:
+        shared.add(("a", "daily"), daily_temperature_data)
+        assert len(shared) == 2
+        assert "a" in shared
+        assert shared.keys() == ["a", ("a", "daily")]
+        assert repr(shared) == "SharedTemperatureData('a', ('a', 'daily'))"
+        pd.testing.assert_series_equal(shared["a"], temperature_data)
+        pd.testing.assert_series_equal(shared["a", "daily"], daily_temperature_data)
+        assert shared["a"] is shared["a"]
+        assert not shared["a"].values.flags.writeable
+
+
+@requires_shared_memory
+def test_shared_temperature_data_pickle(temperature_data):
+    with SharedTemperatureData({"a": temperature_data}) as shared:
+        attached = pickle.loads(pickle.dumps(shared))
+        pd.testing.assert_series_equal(attached["a"], temperature_data)
+        with pytest.raises(ValueError):
+            attached.add("b", temperature_data)
+        attached.close()
+        # closing an attached copy leaves the segments in place.
+        pd.testing.assert_series_equal(shared["a"], temperature_data)
+
+
+@requires_shared_memory
+def test_shared_temperature_data_process_pool(temperature_data):
+    from concurrent.futures import ProcessPoolExecutor
+
+    with SharedTemperatureData({"a": temperature_data}) as shared:
+        with ProcessPoolExecutor(2) as executor:
+            results = list(executor.map(_sum_temperatures, [shared] * 2, ["a"] * 2))
+    assert results == [temperature_data.sum()] * 2
+
+
+@requires_shared_memory
+def test_shared_temperature_data_empty(temperature_data):
+    with SharedTemperatureData({"a": temperature_data.iloc[:0]}) as shared:
+        assert len(shared["a"]) == 0
+
+
+@requires_shared_memory
+def test_shared_temperature_data_invalid(temperature_data):
+    with SharedTemperatureData({"a": temperature_data}) as shared:
+        with pytest.raises(ValueError):
+            shared.add("a", temperature_data)
+        with pytest.raises(ValueError):
+            shared.add("b", temperature_data.tz_localize(None))
+        with pytest.raises(ValueError):
+            shared.add("c", temperature_data.reset_index(drop=True))
+    with pytest.raises(ValueError):
+        shared["a"]
+
+
+_VIEW_OUTLIVES_OWNER = """
+import gc
+import numpy as np
+import pandas as pd
+from eemeter import SharedTemperatureData
+
+index = pd.date_range("2017-01-01", periods=100000, freq="H", tz="UTC")
+temperature_data = pd.Series(np.arange(100000.0), index=index)
+
+def _view():
+    return SharedTemperatureData({"a": temperature_data})["a"]
+
+shared = SharedTemperatureData({"a": temperature_data})
+dropped = shared["a"]
+del shared
+closed_shared = SharedTemperatureData({"a": temperature_data})
+closed = closed_shared["a"]
+closed_shared.close()
+gc.collect()
+for view in [dropped, closed, _view()]:
+    assert view.sum() == temperature_data.sum()
+    assert view.index[-1] == index[-1]
+"""
+
+
+@requires_shared_memory
+def test_shared_temperature_data_view_outlives_owner():
+    # run in a subprocess, so that reading unmapped memory fails the test
+    # rather than crashing the test run.
+    process = subprocess.run(
+        [sys.executable, "-c", _VIEW_OUTLIVES_OWNER],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.returncode == 0, process.stderr.decode()
@@ -0,0 +1,93 @@
+import types
+
+import numpy as np
+import pytest
+
+from eemeter import synthetic_meters
+
+
+def test_synthetic_meters_is_lazy():
+    meters = synthetic_meters(10 ** 9, random_seed=1)
+    assert isinstance(meters, types.GeneratorType)
+    meter_data, temperature_data, metadata = next(meters)
+    assert metadata["id"] == "synthetic-000000"
+
+
+@pytest.mark.parametrize(
+    "freq,n_rows,index_freq",
+    [
+        ("hourly", 30 * 24 + 1, "H"),
+        ("daily", 31, "D"),
+        ("billing_monthly", None, None),
+        ("billing_bimonthly", None, None),
+    ],
+)
+def test_synthetic_meters_freq(freq, n_rows, index_freq):
+    ((meter_data, temperature_data, metadata),) = synthetic_meters(
+        1, freq=freq, n_days=30 if n_rows else 365, random_seed=1
+    )
+    if n_rows is not None:
+        assert meter_data.shape == (n_rows, 1)
+    assert meter_data.index.freq == index_freq
+    assert str(meter_data.index.tz) == "UTC"
+    assert meter_data.index.is_monotonic_increasing
+    assert np.isnan(meter_data.value.iloc[-1])
+    assert meter_data.value.iloc[:-1].notnull().all()
+    assert temperature_data.index.freq == "H"
+    assert metadata["freq"] == freq
+
+
+def test_synthetic_meters_reproducible():
+    meters_a = list(synthetic_meters(3, n_days=60, random_seed=5))
+    meters_b = list(synthetic_meters(2, n_days=60, random_seed=5))
+    for (meter_a, temp_a, metadata_a), (meter_b, temp_b, metadata_b) in zip(
+        meters_a, meters_b
+    ):
+        assert meter_a.equals(meter_b)
+        assert temp_a.equals(temp_b)
+        assert metadata_a == metadata_b
+
+
+def test_synthetic_meters_stations():
+    meters = list(synthetic_meters(6, n_days=30, n_stations=3, random_seed=1))
+    station_ids = [metadata["station_id"] for _, _, metadata in meters]
+    assert len(set(station_ids)) == 3
+    # meters on the same station share temperature data
+    assert meters[0][1] is meters[3][1]
+    assert not meters[0][1].equals(meters[1][1])
+
+
+def test_synthetic_meters_gaps_and_duplicates():
+    ((meter_data, temperature_data, _),) = synthetic_meters(
+        1,
+        n_days=200,
+        meter_gap_fraction=0.1,
+        temperature_gap_fraction=0.1,
+        duplicate_fraction=0.05,
+        random_seed=1,
+    )
+    assert meter_data.index.duplicated().sum() == 10
+    assert meter_data.index.freq is None
+    assert meter_data.index.is_monotonic_increasing
+    assert 5 < meter_data.value.isnull().sum() < 50
+    assert 200 < temperature_data.isnull().sum() < 800
+
+
+def test_synthetic_meters_templates():
+    meters = synthetic_meters(
+        5, n_days=30, templates=["il-gas-hdd-only-daily"], random_seed=1
+    )
+    for _, _, metadata in meters:
+        assert metadata["template"] == "il-gas-hdd-only-daily"
+        assert metadata["annual_baseline_cooling_load"] == 0
+        assert "baseline_heating_balance_point" in metadata
+        assert "baseline_cooling_balance_point" not in metadata
+
+
+def test_synthetic_meters_bad_args():
+    with pytest.raises(ValueError):
+        next(synthetic_meters(1, freq="weekly"))
+    with pytest.raises(ValueError):
+        next(synthetic_meters(1, n_stations=0))
+    with pytest.raises(ValueError):
+        next(synthetic_meters(1, templates=["unknown"]))
@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from pkg_resources import resource_stream
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -11,10 +12,16 @@ from eemeter import (
     get_baseline_data,
     get_reporting_data,
     merge_temperature_data,
+    merge_temperature_data_frame,
     remove_duplicates,
     NoBaselineDataError,
     NoReportingDataError,
 )
+from eemeter.transform import (
+    _matching_period_codes,
+    _mean_degree_day_columns,
+    overwrite_partial_rows_with_nan,
+)
 
 
 def test_merge_temperature_data_no_freq_index(il_electricity_cdd_hdd_billing_monthly):
@@ -1505,6 +1512,168 @@ def test_compute_temperature_features_empty_meter_data():
     assert round(df.temperature_mean.sum()) == 0
 
 
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_merge_temperature_data_daily_chunked(il_electricity_cdd_hdd_daily, chunk_size):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"].copy()
+    temperature_data.iloc[3000:4000] = float("nan")
+    kwargs = dict(
+        heating_balance_points=[60, 65],
+        cooling_balance_points=[65, 70],
+        data_quality=True,
+    )
+    df = merge_temperature_data(meter_data, temperature_data, **kwargs)
+    df_chunked = merge_temperature_data(
+        meter_data, temperature_data, chunk_size=chunk_size, **kwargs
+    )
+    pd.testing.assert_frame_equal(df, df_chunked)
+    assert df_chunked.index.freq == "D"
+
+
+@pytest.mark.parametrize("keep_partial_nan_rows", [True, False])
+def test_compute_temperature_features_billing_monthly_chunked(
+    il_electricity_cdd_hdd_billing_monthly, keep_partial_nan_rows
+):
+    meter_data = il_electricity_cdd_hdd_billing_monthly["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_billing_monthly["temperature_data"]
+    # a gap covering entire billing periods.
+    temperature_data = temperature_data.copy()
+    temperature_data.iloc[4000:8000] = float("nan")
+    kwargs = dict(
+        heating_balance_points=[60, 65],
+        cooling_balance_points=[65, 70],
+        keep_partial_nan_rows=keep_partial_nan_rows,
+    )
+    df = compute_temperature_features(temperature_data, meter_data.index, **kwargs)
+    df_chunked = compute_temperature_features(
+        temperature_data, meter_data.index, chunk_size=2, **kwargs
+    )
+    pd.testing.assert_frame_equal(df, df_chunked)
+
+
+def test_compute_temperature_features_chunked_past_end_of_temperature_data(
+    il_electricity_cdd_hdd_daily
+):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"][:230]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    temperature_data = temperature_data[
+        temperature_data.index < meter_data.index[200]
+    ]
+    kwargs = dict(heating_balance_points=[60, 65], cooling_balance_points=[65, 70])
+    df = compute_temperature_features(temperature_data, meter_data.index, **kwargs)
+    df_chunked = compute_temperature_features(
+        temperature_data, meter_data.index, chunk_size=30, **kwargs
+    )
+    assert "degree_day_columns" not in df_chunked.columns
+    assert df_chunked.hdd_60.notnull().sum() > 0
+    pd.testing.assert_frame_equal(df, df_chunked)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+def test_compute_temperature_features_chunked_duplicate_periods(
+    il_electricity_cdd_hdd_daily, chunk_size
+):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"][:50]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    index = meter_data.index.append(meter_data.index[10:15]).sort_values()
+    kwargs = dict(heating_balance_points=[60, 65], cooling_balance_points=[65, 70])
+    df = compute_temperature_features(temperature_data, index, **kwargs)
+    df_chunked = compute_temperature_features(
+        temperature_data, index, chunk_size=chunk_size, **kwargs
+    )
+    pd.testing.assert_frame_equal(df, df_chunked)
+
+
+def test_merge_temperature_data_hourly_chunked(il_electricity_cdd_hdd_hourly):
+    meter_data = il_electricity_cdd_hdd_hourly["meter_data"][: 24 * 30]
+    temperature_data = il_electricity_cdd_hdd_hourly["temperature_data"]
+    kwargs = dict(
+        heating_balance_points=[60, 65],
+        cooling_balance_points=[65, 70],
+        degree_day_method="hourly",
+    )
+    df = merge_temperature_data(meter_data, temperature_data, **kwargs)
+    df_chunked = merge_temperature_data(
+        meter_data, temperature_data, chunk_size=100, **kwargs
+    )
+    pd.testing.assert_frame_equal(df, df_chunked)
+
+
+def test_merge_temperature_data_float32(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    kwargs = dict(
+        heating_balance_points=[60, 65], cooling_balance_points=[65], data_quality=True
+    )
+    df = merge_temperature_data(meter_data, temperature_data, **kwargs)
+    df_compact = merge_temperature_data(
+        meter_data, temperature_data, dtype="float32", **kwargs
+    )
+    assert df_compact.meter_value.dtype == "float64"
+    assert (df_compact.drop("meter_value", axis=1).dtypes == "float32").all()
+    pd.testing.assert_frame_equal(
+        df, df_compact.astype("float64"), check_less_precise=True
+    )
+
+    # without missing rows, counts are stored as int16.
+    df_compact = merge_temperature_data(
+        meter_data[:-1], temperature_data, dtype="float32", **kwargs
+    )
+    assert df_compact.n_days_kept.dtype == "int16"
+    assert df_compact.temperature_not_null.dtype == "int16"
+    assert df_compact.hdd_60.dtype == "float32"
+
+
+def test_compute_temperature_features_bad_dtype(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    with pytest.raises(ValueError):
+        compute_temperature_features(temperature_data, meter_data.index, dtype="int16")
+
+
+def test_matching_period_codes():
+    index = pd.DatetimeIndex(
+        [
+            "2017-01-01T02:00",
+            "2017-01-01T05:00",
+            "2017-01-01T05:00",
+            "2017-01-01T06:00",
+        ],
+        tz="UTC",
+    )
+    temperature_index = pd.date_range(
+        "2017-01-01", periods=10, freq="H", tz="UTC"
+    ).tz_convert("US/Pacific")
+    codes, index_codes = _matching_period_codes(index, temperature_index, None)
+    assert list(codes) == [-1, -1, 0, 0, 0, 1, 3, 3, 3, 3]
+    assert list(index_codes) == [0, 1, 1, 3]
+
+    codes, index_codes = _matching_period_codes(
+        index, temperature_index, pd.Timedelta("1H")
+    )
+    assert list(codes) == [-1, -1, 0, 0, -1, 1, 3, 3, -1, -1]
+
+
+def test_matching_period_codes_unsorted():
+    index = pd.DatetimeIndex(["2017-01-02", "2017-01-01"], tz="UTC")
+    temperature_index = pd.date_range("2017-01-01", periods=48, freq="H", tz="UTC")
+    with pytest.raises(ValueError):
+        _matching_period_codes(index, temperature_index, None)
+
+
+def test_compute_temperature_features_duplicate_index(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    index = meter_data.index[:10]
+    index = index[[0, 1, 2, 3, 4, 4, 5, 6, 7, 8, 9]]
+    df = compute_temperature_features(
+        temperature_data, index, heating_balance_points=[60], data_quality=True
+    )
+    assert df.shape == (11, 6)
+    assert df.iloc[4].equals(df.iloc[5])
+    assert list(df.temperature_not_null.iloc[1:-1]) == [24] * 9
+
+
 def test_as_freq_not_series(il_electricity_cdd_hdd_billing_monthly):
     meter_data = il_electricity_cdd_hdd_billing_monthly["meter_data"]
     assert meter_data.shape == (27, 1)
@@ -1697,6 +1866,316 @@ def test_get_reporting_data_end_gap(il_electricity_cdd_hdd_hourly):
     }
 
 
+def test_mean_degree_day_columns():
+    temps = np.array([61.5, 55.0, 70.25, 64.0, 58.0, 64.0])
+    balance_points = [50, 55, 58.5, 64, 64.5, 80]
+    cdd_cols, hdd_cols = _mean_degree_day_columns(
+        temps, balance_points, balance_points, 2
+    )
+    assert list(cdd_cols) == ["cdd_%s" % bp for bp in balance_points]
+    assert list(hdd_cols) == ["hdd_%s" % bp for bp in balance_points]
+    for bp in balance_points:
+        expected_cdd = np.maximum(temps - bp, 0).mean() * 2
+        expected_hdd = np.maximum(bp - temps, 0).mean() * 2
+        assert cdd_cols["cdd_%s" % bp] == pytest.approx(expected_cdd, abs=1e-12)
+        assert hdd_cols["hdd_%s" % bp] == pytest.approx(expected_hdd, abs=1e-12)
+
+
+def test_mean_degree_day_columns_empty():
+    cdd_cols, hdd_cols = _mean_degree_day_columns(np.array([]), [60], [60], 1)
+    assert np.isnan(cdd_cols["cdd_60"])
+    assert np.isnan(hdd_cols["hdd_60"])
+
+
+def test_compute_temperature_features_fractional_balance_points(
+    il_electricity_cdd_hdd_billing_monthly
+):
+    meter_data = il_electricity_cdd_hdd_billing_monthly["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_billing_monthly["temperature_data"]
+    df = compute_temperature_features(
+        temperature_data,
+        meter_data.index,
+        heating_balance_points=[60, 60.5],
+        cooling_balance_points=[65.25],
+    )
+    assert list(df.columns) == [
+        "temperature_mean",
+        "n_days_kept",
+        "n_days_dropped",
+        "cdd_65.25",
+        "hdd_60",
+        "hdd_60.5",
+    ]
+    assert round(df["hdd_60"].sum(), 2) == 308.41
+    assert round(df["hdd_60.5"].sum(), 2) == 316.19
+
+
+def test_overwrite_partial_rows_with_nan():
+    df = pd.DataFrame(
+        {
+            "a": [1.0, np.nan, 3.0, 4.0],
+            "b": [1, 2, 3, 4],
+            "c": np.array([1, 2, np.nan, 4], dtype="float32"),
+            "d": [True, False, True, False],
+            "e": ["w", "x", "y", None],
+        },
+        columns=["a", "b", "c", "d", "e"],
+    )
+    expected = df.dropna().reindex(df.index)
+    result = overwrite_partial_rows_with_nan(df)
+    pd.testing.assert_frame_equal(result, expected)
+    # input is unchanged
+    assert df.a.notnull().sum() == 3
+
+
+def test_overwrite_partial_rows_with_nan_inplace():
+    df = pd.DataFrame({"a": [1.0, np.nan, 3.0], "b": [1.0, 2.0, np.nan]})
+    result = overwrite_partial_rows_with_nan(df, inplace=True)
+    assert result is df
+    assert df.isnull().sum().tolist() == [2, 2]
+
+
+def test_overwrite_partial_rows_with_nan_no_missing():
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [1, 2]})
+    result = overwrite_partial_rows_with_nan(df)
+    assert result is not df
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_compute_temperature_features_daily_temperature_data(
+    il_electricity_cdd_hdd_daily
+):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    daily_temperature_data = temperature_data.resample("D").mean()
+    kwargs = dict(
+        heating_balance_points=[60, 61.5],
+        cooling_balance_points=[65],
+        data_quality=True,
+        keep_partial_nan_rows=True,
+    )
+    df_hourly = compute_temperature_features(
+        temperature_data, meter_data.index, **kwargs
+    )
+    df = compute_temperature_features(
+        daily_temperature_data, meter_data.index, **kwargs
+    )
+    assert list(df.columns) == list(df_hourly.columns)
+    # days are counted rather than hours.
+    assert df.temperature_not_null.iloc[:-1].max() == 1
+    assert df.temperature_null.sum() == 0
+    columns = ["temperature_mean", "n_days_kept", "n_days_dropped"]
+    columns.extend(["cdd_65", "hdd_60", "hdd_61.5"])
+    # the last period is a partial day of hourly data.
+    pd.testing.assert_frame_equal(df[columns].iloc[:-1], df_hourly[columns].iloc[:-1])
+
+
+def test_merge_temperature_data_daily_temperature_data(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    daily_temperature_data = temperature_data.resample("D").mean()
+    kwargs = dict(heating_balance_points=[60], cooling_balance_points=[65])
+    df_hourly = merge_temperature_data(meter_data, temperature_data, **kwargs)
+    df = merge_temperature_data(meter_data, daily_temperature_data, **kwargs)
+    pd.testing.assert_frame_equal(df.iloc[:-1], df_hourly.iloc[:-1])
+
+
+@pytest.mark.parametrize("use_mean_daily_values", [True, False])
+def test_compute_temperature_features_billing_monthly_daily_temperature_data(
+    il_electricity_cdd_hdd_billing_monthly, use_mean_daily_values
+):
+    meter_data = il_electricity_cdd_hdd_billing_monthly["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_billing_monthly["temperature_data"]
+    # days starting at the same time of day as the billing periods.
+    offset = pd.Timedelta(hours=6)
+    daily_temperature_data = temperature_data.shift(-6).resample("D").mean()
+    daily_temperature_data.index = daily_temperature_data.index + offset
+    daily_temperature_data = daily_temperature_data.asfreq("D")
+    kwargs = dict(
+        heating_balance_points=[60],
+        cooling_balance_points=[65],
+        use_mean_daily_values=use_mean_daily_values,
+    )
+    df_hourly = compute_temperature_features(
+        temperature_data, meter_data.index, **kwargs
+    )
+    df = compute_temperature_features(
+        daily_temperature_data, meter_data.index, **kwargs
+    )
+    # the first and last periods have days with too few hours of data.
+    pd.testing.assert_frame_equal(df.iloc[1:-1], df_hourly.iloc[1:-1])
+
+
+def test_compute_temperature_features_daily_temperature_data_coverage(
+    il_electricity_cdd_hdd_billing_monthly
+):
+    meter_data = il_electricity_cdd_hdd_billing_monthly["meter_data"]
+    index = pd.date_range("2017-01-01", periods=3, freq="10D", tz="UTC")
+    temperatures = np.full(30, 50.0)
+    temperatures[[0, 15, 16]] = np.nan
+    daily_temperature_data = pd.Series(
+        temperatures, index=pd.date_range("2017-01-01", periods=30, tz="UTC")
+    )
+    df = compute_temperature_features(
+        daily_temperature_data,
+        index,
+        heating_balance_points=[60],
+        data_quality=True,
+        keep_partial_nan_rows=True,
+    )
+    assert df.temperature_not_null.tolist() == [9, 8, 10]
+    assert df.temperature_null.tolist() == [1, 2, 0]
+    # a period is dropped entirely if less than 90% of its days are kept.
+    assert df.n_days_kept.tolist() == [9, 0, 10]
+    assert df.n_days_dropped.tolist() == [1, 10, 0]
+    assert df.hdd_60.fillna(-1).tolist() == [10, -1, 10]
+    assert df.temperature_mean.tolist() == [50, 50, 50]
+
+
+def test_compute_temperature_features_daily_temperature_data_hourly_degree_days_fail(
+    il_electricity_cdd_hdd_daily
+):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    daily_temperature_data = temperature_data.resample("D").mean()
+    with pytest.raises(ValueError):
+        compute_temperature_features(
+            daily_temperature_data,
+            meter_data.index,
+            heating_balance_points=[60],
+            degree_day_method="hourly",
+        )
+
+
+def test_compute_temperature_features_daily_temperature_data_hourly_meter_data_fail(
+    il_electricity_cdd_hdd_hourly
+):
+    meter_data = il_electricity_cdd_hdd_hourly["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_hourly["temperature_data"]
+    daily_temperature_data = temperature_data.resample("D").mean()
+    with pytest.raises(ValueError):
+        compute_temperature_features(daily_temperature_data, meter_data.index)
+
+
+def test_compute_temperature_features_bad_temperature_freq(
+    il_electricity_cdd_hdd_daily
+):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    with pytest.raises(ValueError):
+        compute_temperature_features(
+            temperature_data.resample("2H").mean(), meter_data.index
+        )
+
+
+def _merge_temperature_data_by_meter(meter_data_by_meter, temperature_data, **kwargs):
+    meter_data = pd.concat(meter_data_by_meter, names=["meter_id", "start"])
+    df = merge_temperature_data_frame(meter_data, temperature_data, **kwargs)
+    for meter_id, meter_data in meter_data_by_meter.items():
+        expected = merge_temperature_data(meter_data, temperature_data, **kwargs)
+        # per-meter slices of the MultiIndex have no freq.
+        expected.index.freq = None
+        # the last period of each meter only marks the end of the data.
+        assert df.loc[meter_id].iloc[-1].isnull().all()
+        pd.testing.assert_frame_equal(
+            df.loc[meter_id].iloc[:-1], expected.iloc[:-1], check_dtype=False
+        )
+    return df
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"data_quality": True, "keep_partial_nan_rows": True},
+        {"use_mean_daily_values": False, "temperature_mean": False},
+        {
+            "percent_hourly_coverage_per_day": 0.9,
+            "percent_hourly_coverage_per_billing_period": 0.99,
+        },
+    ],
+)
+@pytest.mark.parametrize("sample", ["daily", "billing_monthly"])
+def test_merge_temperature_data_frame(
+    il_electricity_cdd_hdd_daily, il_electricity_cdd_hdd_billing_monthly, sample, kwargs
+):
+    sample = {
+        "daily": il_electricity_cdd_hdd_daily,
+        "billing_monthly": il_electricity_cdd_hdd_billing_monthly,
+    }[sample]
+    meter_data = sample["meter_data"]
+    temperature_data = sample["temperature_data"].copy()
+    # missing hours covering partial and entire days.
+    temperature_data.iloc[100:130] = np.nan
+    temperature_data.iloc[5000:5010] = np.nan
+    df = _merge_temperature_data_by_meter(
+        {"b": meter_data.iloc[3:], "a": meter_data},
+        temperature_data,
+        heating_balance_points=[55, 60.5],
+        cooling_balance_points=[65],
+        **kwargs
+    )
+    assert df.index.names == ["meter_id", "start"]
+    assert df.index.get_level_values("meter_id").unique().tolist() == ["a", "b"]
+    assert df.shape[0] == 2 * meter_data.shape[0] - 3
+
+
+def test_merge_temperature_data_frame_daily_temperature_data(
+    il_electricity_cdd_hdd_billing_monthly
+):
+    meter_data = il_electricity_cdd_hdd_billing_monthly["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_billing_monthly["temperature_data"]
+    # days starting at the same time of day as the billing periods.
+    daily_temperature_data = temperature_data.shift(-6).resample("D").mean()
+    daily_temperature_data.index = daily_temperature_data.index + pd.Timedelta(hours=6)
+    daily_temperature_data = daily_temperature_data.asfreq("D")
+    _merge_temperature_data_by_meter(
+        {"a": meter_data, "b": meter_data.iloc[:10]},
+        daily_temperature_data,
+        heating_balance_points=[60],
+        cooling_balance_points=[65],
+        data_quality=True,
+    )
+
+
+def test_merge_temperature_data_frame_columns(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    meter_data_by_meter = pd.concat(
+        {"a": meter_data, "b": meter_data}, names=["id", "start"]
+    )
+    df = merge_temperature_data_frame(
+        meter_data_by_meter.reset_index(),
+        temperature_data,
+        heating_balance_points=[60],
+        meter_id_column="id",
+        dtype="float32",
+    )
+    assert df.index.names == ["id", "start"]
+    assert df.hdd_60.dtype == np.float32
+    assert str(df.index.get_level_values("start").tz) == "UTC"
+    pd.testing.assert_frame_equal(df.loc["a"], df.loc["b"])
+
+
+def test_merge_temperature_data_frame_hourly_meter_data_fail(
+    il_electricity_cdd_hdd_hourly
+):
+    meter_data = il_electricity_cdd_hdd_hourly["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_hourly["temperature_data"]
+    meter_data_by_meter = pd.concat({"a": meter_data}, names=["meter_id", "start"])
+    with pytest.raises(ValueError):
+        merge_temperature_data_frame(meter_data_by_meter, temperature_data)
+
+
+def test_merge_temperature_data_frame_no_meter_data_tz(il_electricity_cdd_hdd_daily):
+    meter_data = il_electricity_cdd_hdd_daily["meter_data"]
+    temperature_data = il_electricity_cdd_hdd_daily["temperature_data"]
+    meter_data = meter_data.tz_localize(None)
+    meter_data_by_meter = pd.concat({"a": meter_data}, names=["meter_id", "start"])
+    with pytest.raises(ValueError):
+        merge_temperature_data_frame(meter_data_by_meter, temperature_data)
+
+
 def test_remove_duplicates_df():
     index = pd.DatetimeIndex(["2017-01-01", "2017-01-02", "2017-01-02"])
     df = pd.DataFrame({"value": [1, 2, 3]}, index=index)